@@ -5,7 +5,7 @@
 # noinspection PyStatementEffect
 {
     'name': "Music Manager",
-    'version': "1.0.0",
+    'version': "1.1.0",
     'category': "Music Manager",
     'description': """
         This module allows the user to manage a music directory, doing CRUD operations with music files and
@@ -33,6 +33,7 @@
         "views/music_manager_audio_settings_views.xml",
         "views/music_manager_genre_views.xml",
         "views/music_manager_music_import_queue_views.xml",
+        "views/music_manager_save_job_views.xml",
         "views/music_manager_track_views.xml",
 
         # Wizards
@@ -44,6 +45,7 @@
 
         # Triggered actions
         "data/ir_cron_data.xml",
+        "data/library_stats_data.xml",
     ],
     'installable': True,
     'application': True,
@@ -1,4 +1,6 @@
 from .download_service_adapter import DownloadServiceAdapter
 from .file_service_adapter import FileServiceAdapter
 from .image_service_adapter import ImageServiceAdapter
+from .track_extraction_adapter import TrackExtractionAdapter
+from .track_save_adapter import TrackSaveAdapter
 from .track_service_adapter import TrackServiceAdapter
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from ..services.file_service import FolderManager
+from ..utils.file_data import FileFingerprint
 from ..utils.file_utils import clean_path_section, is_valid_path
 from ..utils.enums import FileType
 from ..utils.exceptions import InvalidFileFormatError, InvalidPathError
@@ -15,7 +16,8 @@ _logger = logging.getLogger(__name__)
 class FileServiceAdapter:
 
     def __init__(self, str_root_dir: str, file_extension: str) -> None:
-        self.root_dir = self._check_root_dir(str_root_dir)
+        # Only the value is checked here: computing & validating paths never touches the disk
+        self.root_dir = self._get_root_dir_path(str_root_dir)
         self.file_extension = self._check_file_extension(file_extension)
         self._folder_manager = FolderManager(self.root_dir, self.file_extension)
 
@@ -30,6 +32,7 @@ class FileServiceAdapter:
 
         file_path = Path(str_file_path)
 
+        self.check_root_dir()
         self._folder_manager.create_folders(file_path).save_file(file_path, data)
 
     def read_file(self, str_file_path: str | None) -> bytes:
@@ -65,6 +68,7 @@ class FileServiceAdapter:
             _logger.error(f"New path already exists: '{new_path}'.")
             raise InvalidPathError("New path already exists. Must be an empty path.")
 
+        self.check_root_dir()
         self._folder_manager.update_file_path(old_path, new_path)
 
     def delete_file(self, str_file_path: str | None) -> None:
@@ -80,9 +84,28 @@ class FileServiceAdapter:
 
         self._folder_manager.delete_file(file_path)
 
+    def check_root_dir(self) -> None:
+        self._check_root_dir(str(self.root_dir))
+
     def get_all_file_paths(self) -> List[Path]:
+        self.check_root_dir()
         return self._folder_manager.get_all_file_paths()
 
+    def get_fingerprint(self, str_path: str | None) -> FileFingerprint | None:
+        if not isinstance(str_path, str):
+            _logger.error(f"Cannot read path information. The path is not valid: '{str_path}'.")
+            raise InvalidPathError("Path does not exist. Must be set before reading.")
+
+        return self._folder_manager.get_fingerprint(Path(str_path))
+
+    def scan_directory(self, str_dir_path: str | None) -> Tuple[List[str], List[FileFingerprint]]:
+        if not isinstance(str_dir_path, str):
+            _logger.error(f"Cannot scan the directory. The path is not valid: '{str_dir_path}'.")
+            raise InvalidPathError("Directory path does not exist. Must be set before scanning.")
+
+        subdirs, files = self._folder_manager.scan_directory(Path(str_dir_path))
+        return [str(subdir) for subdir in subdirs], files
+
     def set_new_extension(self, new_extension: str) -> None:
         self.file_extension = self._check_file_extension(new_extension)
         self._folder_manager = FolderManager(self.root_dir, self.file_extension)
@@ -113,14 +136,18 @@ class FileServiceAdapter:
 
     @staticmethod
     def _check_root_dir(root_dir: str) -> Path | None:
-        if not isinstance(root_dir, str):
-            _logger.error(f"Root dir is not a valid path: '{root_dir}'.")
-            raise InvalidPathError(f"Root dir is not a valid path: '{root_dir}'.")
-
-        root_dir = Path(root_dir)
+        root_dir = FileServiceAdapter._get_root_dir_path(root_dir)
 
         if not root_dir.is_dir():
             _logger.error(f"Root dir is not a valid directory: '{root_dir}'.")
             raise InvalidPathError(f"Root dir must exist as a valid directory: '{root_dir}'.")
 
         return root_dir
+
+    @staticmethod
+    def _get_root_dir_path(root_dir: str) -> Path:
+        if not isinstance(root_dir, str):
+            _logger.error(f"Root dir is not a valid path: '{root_dir}'.")
+            raise InvalidPathError(f"Root dir is not a valid path: '{root_dir}'.")
+
+        return Path(root_dir)
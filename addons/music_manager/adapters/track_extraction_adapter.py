@@ -0,0 +1,70 @@
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import odoo.addons
+
+
+# Pool workers start from a clean interpreter that cannot import 'odoo.addons.music_manager' yet: their entry points
+# live in a plain module, found through the 'sys.path' every worker gets from the server
+WORKERS_PATH = str(Path(__file__).resolve().parent.parent / 'workers')
+
+if WORKERS_PATH not in sys.path:
+    sys.path.append(WORKERS_PATH)
+
+# noinspection PyUnresolvedReferences
+from music_manager_extraction_worker import _extract_track_data, _init_extraction_worker, _worker_services  # noqa
+
+
+_logger = logging.getLogger(__name__)
+
+
+class TrackExtractionAdapter:
+
+    def __init__(self, file_extension: str, max_workers: int = 1, chunk_size: int = 1) -> None:
+        self.file_extension = file_extension
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.chunk_size = max(int(chunk_size or 1), 1)
+
+        self._executor = None
+
+    def __enter__(self) -> 'TrackExtractionAdapter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def extract_all(self, str_file_paths: List[str]) -> List[Dict[str, str | dict | None]]:
+        if not str_file_paths:
+            return []
+
+        if self.max_workers == 1:
+            _init_extraction_worker(self.file_extension)
+            return [_extract_track_data(file_path) for file_path in str_file_paths]
+
+        executor = self._get_executor()
+        return list(executor.map(_extract_track_data, str_file_paths, chunksize=self.chunk_size))
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if not self._executor:
+            _logger.info(f"Starting tag extraction pool with {self.max_workers} workers.")
+
+            # Workers never touch the Odoo cursor, they only parse files & return plain dictionaries. They start from
+            # a clean 'forkserver' process instead of forking the threaded server, and rebuild their own services
+            # once the addons paths of the server are set
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('forkserver'),
+                initializer=_init_extraction_worker,
+                initargs=(self.file_extension, list(odoo.addons.__path__)),
+            )
+
+        return self._executor
@@ -0,0 +1,96 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from odoo.exceptions import ValidationError
+
+from .file_service_adapter import FileServiceAdapter
+from .track_service_adapter import TrackServiceAdapter
+from ..utils.exceptions import FilePersistenceError, InvalidPathError, MusicManagerError
+
+
+_logger = logging.getLogger(__name__)
+
+
+class TrackSaveAdapter:
+
+    def __init__(
+            self,
+            track_service: TrackServiceAdapter,
+            file_service: FileServiceAdapter,
+            max_workers: int = 1
+    ) -> None:
+        self.track_service = track_service
+        self.file_service = file_service
+        self.max_workers = max(int(max_workers or 1), 1)
+
+        self._executor = None
+
+    def __enter__(self) -> 'TrackSaveAdapter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def apply_all(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not operations:
+            return []
+
+        if self.max_workers == 1:
+            return [self.apply(operation) for operation in operations]
+
+        return list(self._get_executor().map(self.apply, operations))
+
+    def apply(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        result = {
+            'track_id': operation['track_id'],
+            'track_name': operation['track_name'],
+            'new_path': operation['new_path'],
+            'fingerprint': operation.get('fingerprint'),
+            'written': False,
+            'moved': False,
+            'error': None,
+            'error_type': None,
+        }
+
+        # Only files are touched here: workers never use the Odoo cursor
+        try:
+            # Unchanged tags are never rewritten; partial operations only carry the changed frames
+            if operation['metadata']:
+                self.track_service.write_metadata(
+                    operation['old_path'], operation['metadata'], partial=operation.get('partial', False)
+                )
+                result['written'] = True
+
+            if operation['old_path'] != operation['new_path']:
+                self.file_service.update_file_path(operation['old_path'], operation['new_path'])
+                result['moved'] = True
+
+        except InvalidPathError as invalid_path:
+            _logger.error(f"There was an issue with file path: {invalid_path}")
+            result.update(error=str(invalid_path), error_type='invalid_path')
+
+        except FilePersistenceError as not_allowed:
+            _logger.error(f"Cannot update the file: {not_allowed}")
+            result.update(error=str(not_allowed), error_type='persistence')
+
+        except ValidationError as metadata_error:
+            result.update(error=str(metadata_error), error_type='metadata')
+
+        except MusicManagerError as unknown_error:
+            _logger.error(f"Unespected error while trying to update the file: {unknown_error}")
+            result.update(error=str(unknown_error), error_type='unknown')
+
+        return result
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if not self._executor:
+            # Threads are enough: writing tags & moving files is I/O bound
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='music_manager.save')
+
+        return self._executor
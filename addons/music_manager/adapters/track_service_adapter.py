@@ -28,15 +28,33 @@ class TrackServiceAdapter:
         FileType.MP3: MP3AudioFileService,
     }
 
-    def __init__(self, file_type: str = 'mp3') -> None:
+    METADATA_FRAMES = ('TIT2', 'TPE1', 'TPE2', 'TOPE', 'TALB', 'TCMP', 'TRCK', 'TPOS', 'TDRC', 'TCON', 'APIC')
+
+    def __init__(self, file_type: str = 'mp3', tag_padding: int = 0) -> None:
         self.file_type = self._check_file_extension(file_type)
+        self.tag_padding = tag_padding
 
         self._audio_file_service = None
 
     def read_audio_info(self, track: bytes) -> dict[str, str | int | None]:
+        return self._read_audio_info(self._load_decoded_stream(track))
+
+    def probe_audio_info(self, str_file_path: str | None) -> dict[str, str | int | None]:
+        if not isinstance(str_file_path, str):
+            _logger.error(f"Cannot probe the file. The path is not valid: '{str_file_path}'.")
+            raise InvalidPathError("File path does not exist. Must be set before reading.")
+
+        return self._read_audio_info(Path(str_file_path))
+
+    def _read_audio_info(self, track_source: io.BytesIO | Path) -> dict[str, str | int | None]:
         try:
             audio_file_service = self._get_audio_file_service()
-            track_data = audio_file_service.get_full_data(self._load_decoded_stream(track))
+
+            if isinstance(track_source, Path):
+                track_data = audio_file_service.probe_file(track_source)
+
+            else:
+                track_data = audio_file_service.get_full_data(track_source)
 
             metadata = track_data.metadata
             info = track_data.info
@@ -66,6 +84,10 @@ class TrackServiceAdapter:
                 'sample_rate': info.sample_rate,
             }
 
+        except InvalidPathError as invalid_path:
+            _logger.error(f"There was an issue with file path: {invalid_path}")
+            raise ValidationError(_("\nActually, the file path of this record is not valid."))
+
         except InvalidFileFormatError as corrupt_file:
             _logger.error(f"There was a problem reading the file metadata: {corrupt_file}")
             raise ValidationError(
@@ -84,30 +106,26 @@ class TrackServiceAdapter:
                 _("\nDamn! Something went wrong while processing metadata file.\nPlease, contact with your Admin.")
             )
 
-    def write_metadata(self, str_file_path: str | None, new_metadata: dict[str, str | int | None]) -> None:
+    def write_metadata(
+            self, str_file_path: str | None, new_metadata: dict[str, str | int | None], partial: bool = False
+    ) -> None:
         if not isinstance(str_file_path, str):
             _logger.error(f"Cannot save metadata. The path is not valid: '{str_file_path}'.")
             raise InvalidPathError("File path does not exist. A valid path must be set before saving.")
 
         output_path = Path(str_file_path).with_suffix(f'.{self.file_type.value}')
 
-        metadata = {
-            'TIT2': new_metadata['TIT2'],
-            'TPE1': new_metadata['TPE1'],
-            'TPE2': new_metadata['TPE2'],
-            'TOPE': new_metadata['TOPE'],
-            'TALB': new_metadata['TALB'],
-            'TCMP': new_metadata['TCMP'],
-            'TRCK': new_metadata['TRCK'],
-            'TPOS': new_metadata['TPOS'],
-            'TDRC': new_metadata['TDRC'],
-            'TCON': new_metadata['TCON'],
-            'APIC': base64_decode(new_metadata['APIC']) if new_metadata['APIC'] else None,
-        }
+        # Partial updates only carry the frames that changed since the last write
+        frames = [frame for frame in self.METADATA_FRAMES if frame in new_metadata] if partial else self.METADATA_FRAMES
+
+        metadata = {frame: new_metadata[frame] for frame in frames}
+
+        if 'APIC' in metadata:
+            metadata['APIC'] = base64_decode(metadata['APIC']) if metadata['APIC'] else None
 
         try:
             audio_file_service = self._get_audio_file_service()
-            audio_file_service.set_track_metadata(output_path, metadata)
+            audio_file_service.set_track_metadata(output_path, metadata, frames=frames if partial else None)
 
         except ReadingFileError as invalid_metadata:
             _logger.error(f"Failed to process file metadata: {invalid_metadata}")
@@ -137,7 +155,7 @@ class TrackServiceAdapter:
         if not audio_file_service:
             raise AudioInfoServiceError("Unsupported metadata file type")
 
-        return audio_file_service()
+        return audio_file_service(tag_padding=self.tag_padding)
 
     def _get_audio_file_service(self) -> AudioFileService:
         if not self._audio_file_service:
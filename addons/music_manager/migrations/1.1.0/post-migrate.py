@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from odoo import SUPERUSER_ID, api
+from odoo.tools import split_every
+
+
+_logger = logging.getLogger(__name__)
+
+
+PICTURE_MODELS = ('music_manager.artist', 'music_manager.genre', 'music_manager.track')
+
+
+def migrate(cr, version):
+    # Per-record 'picture' attachments are moved into the shared cover store
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    cover_model = env['music_manager.cover']
+    attachment_model = env['ir.attachment']
+
+    # Identical attachments share the SHA-1 checksum computed by Odoo: resolve each image only once
+    cover_ids = {}
+
+    for model_name in PICTURE_MODELS:
+        table = env[model_name]._table
+        attachment_ids = attachment_model.search(
+            [('res_model', '=', model_name), ('res_field', '=', 'picture')]
+        ).ids
+
+        for batch_ids in split_every(500, attachment_ids, list):
+            attachments = attachment_model.browse(batch_ids)
+
+            for attachment in attachments:
+                if not attachment.res_id or not attachment.datas:
+                    continue
+
+                if attachment.checksum not in cover_ids:
+                    cover_ids[attachment.checksum] = cover_model.get_or_create(attachment.datas).id
+
+                cr.execute(
+                    f"UPDATE {table} SET cover_id = %s WHERE id = %s", (cover_ids[attachment.checksum], attachment.res_id)
+                )
+
+            attachments.unlink()
+            env.invalidate_all()
+
+        _logger.info(f"Cover store migration: {len(attachment_ids)} '{model_name}' pictures moved.")
+
+    # Album covers were computed before the track covers above were written by SQL: they are chosen again now
+    albums = env['music_manager.album'].search([])
+    env.add_to_compute(albums._fields['cover_id'], albums)
+    albums.flush_recordset(['cover_id'])
+
+    _logger.info(f"Cover store migration: {len(cover_ids)} distinct covers kept, {len(albums)} album covers updated.")
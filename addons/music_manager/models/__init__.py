@@ -2,8 +2,16 @@
 from .album import Album
 from .artist import Artist
 from .audio_settings import AudioSettings
+from .cover import Cover
+from .cover_source import CoverSource
+from .file_deletion import FileDeletion
 from .genre import Genre
+from .import_checkpoint import ImportCheckpoint
+from .library_stats import LibraryStats
 from .music_import_queue import MusicImportQueue
+from .save_job import SaveJob
+from .save_journal import SaveJournal
+from .scan_index import ScanIndex
 from .track import Track
 from . import mixins
 
@@ -11,7 +19,15 @@ __all__ = [
     "Album",
     "Artist",
     "AudioSettings",
+    "Cover",
+    "CoverSource",
+    "FileDeletion",
     "Genre",
+    "ImportCheckpoint",
+    "LibraryStats",
     "MusicImportQueue",
+    "SaveJob",
+    "SaveJournal",
+    "ScanIndex",
     "Track",
 ]
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+from collections import defaultdict
 
 # noinspection PyProtectedMember
 from odoo import _, api
@@ -7,20 +8,28 @@ from odoo.exceptions import AccessError
 from odoo.models import Model
 from odoo.fields import Binary, Boolean, Char, Integer, Many2many, Many2one, One2many, Selection
 
+from .mixins.name_key_mixin import NameKeyMixin
 from .mixins.process_image_mixin import ProcessImageMixin
-from ..utils.file_utils import get_years_list
+from ..utils.file_utils import get_name_key, get_years_list
 
 
 _logger = logging.getLogger(__name__)
 
 
-class Album(Model, ProcessImageMixin):
+LIBRARY_STATS_FIELDS = {'album_artist_id', 'genre_id'}
+
+
+class Album(Model, NameKeyMixin, ProcessImageMixin):
     _name = 'music_manager.album'
     _description = 'album_table'
     _order = 'is_complete desc, name'
+    _sql_constraints = [
+        ('unique_album_name_key', 'UNIQUE(name_key, album_artist_id)', _("Album artist already has this album.")),
+    ]
 
     # Basic fields
     name = Char(string=_("Album title"), required=True)
+    name_key = Char(string=_("Name key"), compute='_compute_name_key', store=True, index=True, readonly=True)
 
     # Relational fields
     album_artist_id = Many2one(comodel_name='music_manager.artist', string=_("Album artist"))
@@ -37,24 +46,28 @@ class Album(Model, ProcessImageMixin):
             ('ep', _("EP")),
             ('single', _("Single")),
         ],
-        compute='_compute_album_type',
+        compute='_compute_track_stats',
         default='uncategorized',
         store=True,
     )
     display_duration = Char(string=_("Duration (min)"), compute='_compute_display_duration', store=False, readonly=True)
-    disk_amount = Integer(string=_("Disk amount"), compute='_compute_disk_amount', store=False)
-    duration = Integer(string=_("Duration (sec)"), compute='_compute_disk_duration', store=False)
+    disk_amount = Integer(string=_("Disk amount"), compute='_compute_track_stats', store=True)
+    duration = Integer(string=_("Duration (sec)"), compute='_compute_track_stats', store=True)
     is_complete = Boolean(
-        string=_("Album complete"), compute='_compute_is_complete', store=True, readonly=True, default=False
+        string=_("Album complete"), compute='_compute_track_stats', store=True, readonly=True, default=False
     )
-    picture = Binary(
-        string=_("Picture"),
-        compute='_compute_album_picture',
-        inverse='_inverse_album_picture',
-        store=False,
+    cover_id = Many2one(
+        comodel_name='music_manager.cover',
+        string=_("Cover"),
+        compute='_compute_album_cover',
+        inverse='_inverse_album_cover',
+        index=True,
+        ondelete='restrict',
+        store=True,
     )
-    progress = Integer(string=_("Progress"), compute='_compute_album_progress', default=0, readonly=True, store=False)
-    track_amount = Integer(string=_("Track amount"), compute='_compute_track_amount', default=0)
+    picture = Binary(string=_("Picture"), compute='_compute_picture', inverse='_inverse_picture', store=False)
+    progress = Integer(string=_("Progress"), compute='_compute_track_stats', default=0, readonly=True, store=True)
+    track_amount = Integer(string=_("Track amount"), compute='_compute_track_stats', default=0, store=True)
     year = Selection(
         string=_("Debut year"),
         selection='_get_years_list',
@@ -91,6 +104,8 @@ class Album(Model, ProcessImageMixin):
                 if update_vals:
                     album.track_ids.write(update_vals)
 
+        self.env['music_manager.library_stats'].refresh_stats(artists=albums.album_artist_id, genres=albums.genre_id)
+
         return albums
 
     def write(self, vals):
@@ -100,8 +115,15 @@ class Album(Model, ProcessImageMixin):
                     raise AccessError(_("\nCannot update this album because you are not the owner. 🤷"))
 
         self._process_picture_image(vals)
+        refresh_stats = bool(LIBRARY_STATS_FIELDS.intersection(vals))
+        old_artists, old_genres = (self.album_artist_id, self.genre_id) if refresh_stats else (None, None)
         res = super().write(vals)  # type: ignore[arg-type]
 
+        if refresh_stats:
+            self.env['music_manager.library_stats'].refresh_stats(
+                artists=old_artists | self.album_artist_id, genres=old_genres | self.genre_id
+            )
+
         for album in self:
             update_vals = {}
 
@@ -122,8 +144,14 @@ class Album(Model, ProcessImageMixin):
                 if self.env.user not in album.custom_owner_ids:
                     raise AccessError(_("\nCannot delete this album because you are not the owner. 🤷"))
 
+        artists_to_refresh = self.album_artist_id
+        genres_to_refresh = self.genre_id
+
         if self.env.context.get('skip_album_sync'):
-            return super().unlink()
+            res = super().unlink()
+            self.env['music_manager.library_stats'].refresh_stats(artists=artists_to_refresh, genres=genres_to_refresh)
+
+            return res
 
         if self.env.user.has_group('music_manager.group_music_manager_user_admin'):
             tracks_to_delete = self.mapped('track_ids')
@@ -134,13 +162,13 @@ class Album(Model, ProcessImageMixin):
         if tracks_to_delete:
             tracks_to_delete.with_context(skip_album_sync=True).unlink()
 
-        track_model = self.env['music_manager.track'].sudo()
-        empty_albums = self.exists().filtered(
-            lambda albums: track_model.search_count([('album_id', '=', albums.id)]) == 0
-        )
+        empty_albums = self.exists()._filter_empty_albums()
 
         if empty_albums:
-            return super(Album, empty_albums.sudo().with_context(skip_album_sync=True)).unlink()
+            res = super(Album, empty_albums.sudo().with_context(skip_album_sync=True)).unlink()
+            self.env['music_manager.library_stats'].refresh_stats(artists=artists_to_refresh, genres=genres_to_refresh)
+
+            return res
 
         return True
 
@@ -149,68 +177,62 @@ class Album(Model, ProcessImageMixin):
         for album in self:
             album.custom_owner_ids = album.track_ids.mapped('custom_owner_id')
 
-    @api.depends('track_ids.picture')
-    def _compute_album_picture(self) -> None:
-        for album in self:
-            tracks_with_pic = album.track_ids.filtered(lambda track: track.picture)
-
-            if tracks_with_pic:
-                album.picture = tracks_with_pic[0].picture
-
-            else:
-                album.picture = False
+    @api.depends('track_ids.cover_id')
+    def _compute_album_cover(self) -> None:
+        album_ids = [album.id for album in self if album.id]
+        track_covers = {}
+
+        if album_ids:
+            # Only cover ids are read: track pictures are never loaded to choose the album one
+            # noinspection PyProtectedMember
+            track_covers = {
+                album.id: cover_ids for album, cover_ids in self.env['music_manager.track'].sudo()._read_group(
+                    [('album_id', 'in', album_ids), ('cover_id', '!=', False)], ['album_id'], ['cover_id:array_agg']
+                )
+            }
 
-    def _inverse_album_picture(self) -> None:
         for album in self:
-            album.track_ids.write({'picture': album.picture})
+            cover_ids = track_covers.get(album.id) if album.id else album.track_ids.cover_id.ids
 
-    @api.depends()
-    def _compute_album_progress(self) -> None:
-        for album in self:
-            if not album.track_ids:
-                album.progress = 0
+            # Current cover is kept while any track still uses it, so it is only chosen again when it disappears
+            if album.cover_id.id in (cover_ids or []):
+                album.cover_id = album.cover_id
                 continue
 
-            max_track_per_disk = {}
+            album.cover_id = min(cover_ids) if cover_ids else False
 
-            for track in album.track_ids:
-                disk_no = track.disk_no
-                total_track = track.total_track
-
-                if disk_no not in max_track_per_disk or total_track > max_track_per_disk[disk_no]:
-                    max_track_per_disk[disk_no] = total_track
-
-            total_album_tracks = sum(max_track_per_disk.values())
-            total_real = len(album.track_ids)
-
-            if total_album_tracks > 0:
-                percentage = (total_real / total_album_tracks) * 100
-                album.progress = min(int(percentage), 100)
-
-            else:
-                album.progress = 0
-
-    @api.depends('track_ids', 'track_ids.compilation', 'track_ids.duration', 'track_amount', 'duration', 'is_complete')
-    def _compute_album_type(self) -> None:
+    def _inverse_album_cover(self) -> None:
+        # Tracks only point to the shared cover: the image itself is never copied
         for album in self:
-            trck_dur = album.track_ids.mapped('duration')
-            total_trck = album.track_amount
-            album_dur = album.duration
-
-            if not album.is_complete:
-                album.album_type = 'uncategorized'
-
-            elif any(album.track_ids.mapped('compilation')):
-                album.album_type = 'compilation'
+            album.track_ids.write({'cover_id': album.cover_id.id})
 
-            elif (total_trck >= 7) or (total_trck < 7 and album_dur > 1800):
-                album.album_type = 'album'
-
-            elif (4 <= total_trck <= 6 and album_dur < 1800) or (1 <= total_trck <= 3 and any(map(lambda dur: dur > 600, trck_dur))):
-                album.album_type = 'ep'
+    @api.depends(
+        'track_ids', 'track_ids.album_artist_id.name', 'track_ids.disk_no', 'track_ids.duration',
+        'track_ids.total_disk', 'track_ids.total_track'
+    )
+    def _compute_track_stats(self) -> None:
+        disk_stats = self._read_disk_stats()
 
-            elif (1 <= total_trck <= 3 and album_dur < 1800) or (any(map(lambda dur: dur > 600, trck_dur))):
-                album.album_type = 'single'
+        for album in self:
+            disks = disk_stats.get(album.id, {})
+
+            track_amount = sum(disk['count'] for disk in disks.values())
+            expected_tracks = sum(disk['total_track'] for disk in disks.values())
+            disk_amount = max((disk['total_disk'] for disk in disks.values()), default=0)
+            duration = sum(disk['duration'] for disk in disks.values())
+
+            album.track_amount = track_amount
+            album.duration = duration
+            album.disk_amount = disk_amount
+            album.progress = min(int(track_amount / expected_tracks * 100), 100) if expected_tracks > 0 else 0
+            album.is_complete = bool(disks) and len(disks) == disk_amount and track_amount == expected_tracks
+            album.album_type = self._get_album_type(
+                album.is_complete,
+                track_amount,
+                duration,
+                any(disk['compilation'] for disk in disks.values()),
+                any(disk['longest'] > 600 for disk in disks.values()),
+            )
 
     @api.depends('track_ids.year')
     def _compute_album_year(self) -> None:
@@ -229,11 +251,17 @@ class Album(Model, ProcessImageMixin):
 
     @api.depends('track_ids')
     def _compute_all_track_ids(self) -> None:
+        track_model = self.env['music_manager.track'].sudo()
+        album_ids = [album.id for album in self if album.id]
+        track_ids_by_album = defaultdict(list)
+
+        # One search for the whole recordset, split by album in memory
+        if album_ids:
+            for track in track_model.search_fetch([('album_id', 'in', album_ids)], ['album_id']):
+                track_ids_by_album[track.album_id.id].append(track.id)
+
         for album in self:
-            all_tracks = self.env['music_manager.track'].sudo().search([
-                ('album_id', '=', album.id)
-            ])
-            album.all_track_ids = all_tracks
+            album.all_track_ids = track_model.browse(track_ids_by_album[album.id])
 
     @api.depends('duration')
     def _compute_display_duration(self) -> None:
@@ -266,46 +294,65 @@ class Album(Model, ProcessImageMixin):
 
             album.display_name = f"{name}{album_type_label}{artist_label}"
 
-    @api.depends('track_ids.total_disk')
-    def _compute_disk_amount(self) -> None:
-        for album in self:
-            disk_amount = album.track_ids.mapped('total_disk')
-            album.disk_amount = max(disk_amount) if disk_amount else 0
-
-    @api.depends('track_ids.duration')
-    def _compute_disk_duration(self) -> None:
-        for album in self:
-            disk_duration = album.track_ids.mapped('duration')
-            album.duration = sum(disk_duration) if disk_duration else 0
-
-    @api.depends('track_ids', 'track_ids.track_no', 'track_ids.disk_no', 'track_ids.total_track', 'track_ids.total_disk')
-    def _compute_is_complete(self) -> None:
-        for album in self:
-            if not album.track_ids:
-                album.is_complete = False
-                continue
+    def _read_disk_stats(self):
+        disk_stats = {}
+        album_ids = [album.id for album in self if album.id]
+
+        if album_ids:
+            # One grouped query per recordset: tracks are never loaded into the cache
+            # noinspection PyProtectedMember
+            groups = self.env['music_manager.track'].sudo()._read_group(
+                [('album_id', 'in', album_ids)],
+                groupby=['album_id', 'disk_no'],
+                aggregates=[
+                    '__count', 'total_track:max', 'total_disk:max', 'duration:sum', 'duration:max',
+                    'album_artist_id:array_agg',
+                ],
+            )
 
-            total_expected_disks = max(album.track_ids.mapped('total_disk'))
-            max_track_per_disk = {}
+            # 'compilation' is not stored: it is read from the album artist, as the track computes it
+            various_artist_ids = set(self._get_various_artists().ids) if groups else set()
+
+            for album, disk_no, count, total_track, total_disk, duration, longest, artist_ids in groups:
+                disk_stats.setdefault(album.id, {})[disk_no] = {
+                    'count': count,
+                    'total_track': total_track or 0,
+                    'total_disk': total_disk or 0,
+                    'duration': duration or 0,
+                    'longest': longest or 0,
+                    'compilation': not various_artist_ids.isdisjoint(artist_ids or []),
+                }
 
+        # Albums not saved yet (form onchanges) only have their tracks in memory
+        for album in self.filtered(lambda record: not record.id):
             for track in album.track_ids:
-                disk_no = track.disk_no
-                total_track = track.total_track
-
-                if disk_no not in max_track_per_disk or total_track > max_track_per_disk[disk_no]:
-                    max_track_per_disk[disk_no] = total_track
-
-            total_album_tracks = sum(max_track_per_disk.values())
-
-            has_all_disks = len(max_track_per_disk) == total_expected_disks
-            match_track_amount = len(album.track_ids) == total_album_tracks
+                disk = disk_stats.setdefault(album.id, {}).setdefault(track.disk_no, {
+                    'count': 0, 'total_track': 0, 'total_disk': 0, 'duration': 0, 'longest': 0, 'compilation': False,
+                })
+                disk['count'] += 1
+                disk['total_track'] = max(disk['total_track'], track.total_track or 0)
+                disk['total_disk'] = max(disk['total_disk'], track.total_disk or 0)
+                disk['duration'] += track.duration or 0
+                disk['longest'] = max(disk['longest'], track.duration or 0)
+                disk['compilation'] = disk['compilation'] or track.compilation
+
+        return disk_stats
+
+    def _get_various_artists(self):
+        return self.env['music_manager.artist'].sudo().search([('name_key', '=', get_name_key("Various Artists"))])
+
+    def _filter_empty_albums(self):
+        if not self:
+            return self
+
+        # One grouped count for the whole recordset instead of one count per album
+        used_album_ids = {
+            group['album_id'][0] for group in self.env['music_manager.track'].sudo().read_group(
+                [('album_id', 'in', self.ids)], ['album_id'], ['album_id']
+            )
+        }
 
-            album.is_complete = has_all_disks and match_track_amount
-
-    @api.depends('track_ids')
-    def _compute_track_amount(self) -> None:
-        for album in self:
-            album.track_amount = len(album.track_ids) if album.track_ids else 0
+        return self.filtered(lambda album: album.id not in used_album_ids)
 
     def action_view_album_content(self):
         self.ensure_one()
@@ -332,40 +379,41 @@ class Album(Model, ProcessImageMixin):
                 }
             }
 
-        total_success_count = 0
-        total_failure_messages = []
-
-        for track in self.track_ids:
-            results = track._perform_save_changes()
-            total_success_count += results['success']
-
-            if results['messages']:
-                total_failure_messages.extend(results['messages'])
-
-        final_message = []
-
-        if total_success_count == len(self.track_ids):
-            final_message.append(
-                _("All tracks from this album have been updated!")
-            )
-
-        if total_failure_messages:
-            final_message.append(
-                _("Some tracks have been ignored:")
-            )
-            final_message.extend(total_failure_messages)
+        # Files are written by a background job, so big albums never block the request
+        job = self.env['music_manager.save_job'].enqueue(self.track_ids, self.name)
 
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': _("Music Manager says:"),
-                'message': " • ".join(final_message),
-                'type': 'warning' if total_failure_messages else 'success',
+                'message': _(
+                    "%s track(s) will be updated in background. You will be notified when it is done.", job.total_count
+                ),
+                'type': 'info',
                 'sticky': False,
             }
         }
 
+    @staticmethod
+    def _get_album_type(is_complete, track_amount, duration, has_compilation, has_long_track):
+        if not is_complete:
+            return 'uncategorized'
+
+        if has_compilation:
+            return 'compilation'
+
+        if track_amount >= 7 or duration > 1800:
+            return 'album'
+
+        if (4 <= track_amount <= 6 and duration < 1800) or (1 <= track_amount <= 3 and has_long_track):
+            return 'ep'
+
+        if (1 <= track_amount <= 3 and duration < 1800) or has_long_track:
+            return 'single'
+
+        return 'uncategorized'
+
     @staticmethod
     def _get_years_list():
         return get_years_list()
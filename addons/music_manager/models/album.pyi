@@ -6,11 +6,15 @@ from odoo.addons.base.models.res_users import Users
 from odoo.api import Environment
 
 from .artist import Artist
+from .cover import Cover
 from .genre import Genre
 from .track import Track
 from ..utils.custom_types import AlbumVals, CustomWarningMessage, DisplayNotification, WindowActionView, YearValue
 
 
+LIBRARY_STATS_FIELDS: Final[set[str]]
+
+
 class Album:
     """
     Represents an Album model into the system.
@@ -20,6 +24,7 @@ class Album:
     _name: Final[str]
     _description: str | None
     _order: str | None
+    _sql_constraints: list[tuple[str, str, str]] | None
 
     # Base model fields necessaries for context
     id: int
@@ -31,6 +36,7 @@ class Album:
 
     # Custom fields
     name: str
+    name_key: str | Literal[False]
 
     album_artist_id: Artist | int | Literal[False]
     genre_id: Genre | int | Literal[False]
@@ -42,6 +48,7 @@ class Album:
     duration: int
     is_complete: bool
     picture: bytes | Literal[False]
+    cover_id: Cover | int | Literal[False]
     progress: int
     track_amount: int
     year: YearValue | Literal[False]
@@ -57,6 +64,7 @@ class Album:
 
     def write(self: Self, vals: AlbumVals) -> Literal[True]:
         """Overrides 'write' method to update cover album & propagate to linked tracks, genre, or artist records.
+        Stats of old & new artist and genre are refreshed when any of them changes.
         :param vals: Dictionary with album values to update.
         :return: Confirms updated album record.
         """
@@ -71,28 +79,18 @@ class Album:
         :return: None
         """
 
-    def _compute_album_picture(self: Self) -> None:
-        """Calculates album cover. If cover image is not available for the album, it falls back to the cover
-        of the first track with an available cover.
+    def _compute_album_cover(self: Self) -> None:
+        """Chooses the album cover among the covers of its tracks, reading only their cover ids. The current cover is
+        kept while any track still uses it.
         :return: None
         """
 
-    def _inverse_album_picture(self: Self) -> None:
-        """Propagates the album cover to all linked tracks. If the album cover is not set, it clears
+    def _inverse_album_cover(self: Self) -> None:
+        """Links all album tracks to the album cover. If the album cover is not set, it clears
         the cover of the tracks.
         :return: None
         """
 
-    def _compute_album_progress(self: Self) -> None:
-        """Calculates album complete progress
-        :return: None
-        """
-
-    def _compute_album_type(self: Self) -> None:
-        """Calculates album type according to track amount & time duration.
-        :return: None
-        """
-
     def _compute_album_year(self: Self) -> None:
         """Computes album year. If year is not available for the album, it falls back to the `year` field
         of the first track with an available year.
@@ -106,7 +104,7 @@ class Album:
         """
 
     def _compute_all_track_ids(self: Self) -> None:
-        """Calculates all track ids.
+        """Calculates all track ids, regardless of their owner, with one search for the whole recordset.
         :return: None
         """
 
@@ -120,26 +118,26 @@ class Album:
         :return: None
         """
 
-    def _compute_disk_amount(self: Self) -> None:
-        """Calculates disk amount linked to itself according to track metadata.
-        Result is saved into `disk_amount` field.
+    def _compute_track_stats(self: Self) -> None:
+        """Calculates track amount, duration, disk amount, progress, completeness & album type from the tracks
+        grouped by disk. Results are stored and only recomputed for albums whose tracks changed.
         :return: None
         """
 
-    def _compute_disk_duration(self: Self) -> None:
-        """Calculates album total duration in minutes according to all track durations.
-        :return: None
+    def _read_disk_stats(self: Self) -> dict[int, dict[int, dict[str, int | bool]]]:
+        """Aggregates the tracks of the whole recordset by album & disk in one grouped query. Albums not saved yet
+        are aggregated from their tracks in memory. Compilation flag comes from the album artists of each disk.
+        :return: Stats by album id & disk number
         """
 
-    def _compute_is_complete(self: Self) -> None:
-        """Calculates if an album is complete or not
-        :return: None
+    def _get_various_artists(self: Self) -> Artist:
+        """Searches the 'Various Artists' artists by name key, used to flag compilation disks.
+        :return: Artist records
         """
 
-    def _compute_track_amount(self: Self) -> None:
-        """Calculates track amount linked to this album record.
-        Result is saved into `track_amount` field.
-        :return: None
+    def _filter_empty_albums(self: Self) -> Self:
+        """Returns the albums without any track, counting the tracks of the whole recordset in one grouped query.
+        :return: Albums without tracks
         """
 
     def action_view_album_content(self: Self) -> WindowActionView:
@@ -148,10 +146,23 @@ class Album:
         """
 
     def update_songs(self: Self) -> DisplayNotification | None:
-        """Update track metadata linked to this album. It calls to the `save_changes()` method for each track.
+        """Update track metadata linked to this album. Tracks are saved by a background job (see `SaveJob`).
         :return: None | Dictionary with UI information
         """
 
+    @staticmethod
+    def _get_album_type(
+            is_complete: bool, track_amount: int, duration: int, has_compilation: bool, has_long_track: bool
+    ) -> str:
+        """Calculates album type according to track amount & time duration.
+        :param is_complete: Album has all its tracks
+        :param track_amount: Tracks of the album
+        :param duration: Album duration (in seconds)
+        :param has_compilation: Any track belongs to a compilation
+        :param has_long_track: Any track lasts more than 10 minutes
+        :return: Album type
+        """
+
     def _get_years_list(self: Self) -> list[YearValue]:
         """Calls 'get_years_list' method from file_utils.py to get a years list.
         :return: Complete years list
@@ -7,6 +7,7 @@ from odoo.exceptions import AccessError, UserError
 from odoo.models import Model
 from odoo.fields import Binary, Boolean, Char, Html, Integer, Many2many, Many2one, One2many, Selection
 
+from .mixins.name_key_mixin import NameKeyMixin
 from .mixins.process_image_mixin import ProcessImageMixin
 from ..utils.file_utils import get_years_list
 
@@ -14,16 +15,20 @@ from ..utils.file_utils import get_years_list
 _logger = logging.getLogger(__name__)
 
 
-class Artist(Model, ProcessImageMixin):
+class Artist(Model, NameKeyMixin, ProcessImageMixin):
     _name = 'music_manager.artist'
     _description = 'artist_table'
     _order = 'is_group, name'
+    _sql_constraints = [
+        ('unique_artist_name_key', 'UNIQUE(name_key)', _("Artist name already exists.")),
+    ]
 
     # Basic fields
     biography = Html(string=_("Biography"))
     is_group = Boolean(string=_("Is group"))
     name = Char(string=_("Name"), required=True)
-    picture = Binary(string=_("Picture"))
+    name_key = Char(string=_("Name key"), compute='_compute_name_key', store=True, index=True, readonly=True)
+    picture = Binary(string=_("Picture"), compute='_compute_picture', inverse='_inverse_picture', store=False)
     real_name = Char(string=_("Real name"))
     start_year = Selection(string=_("Artist year"), selection='_get_years_list')
     website = Char(string=_("Website"))
@@ -31,6 +36,7 @@ class Artist(Model, ProcessImageMixin):
     # Relational fields
     album_ids = One2many(comodel_name='music_manager.album', inverse_name='album_artist_id', string=_("Album(s)"))
     country_id = Many2one(comodel_name='res.country', string=_("Country"))
+    cover_id = Many2one(comodel_name='music_manager.cover', string=_("Cover"), ondelete='restrict', index=True)
     group_ids = Many2many(
         comodel_name='music_manager.artist',
         relation='music_manager_artist_relatives',
@@ -49,9 +55,10 @@ class Artist(Model, ProcessImageMixin):
     track_ids = Many2many(comodel_name='music_manager.track', string=_("Track(s)"))
 
     # Computed fields
-    album_amount = Integer(string=_("Album amount"), compute='_compute_album_amount', default=0, store=False)
+    album_amount = Integer(string=_("Album amount"), compute='_compute_library_stats', default=0, store=False)
+    display_duration = Char(string=_("Duration (min)"), compute='_compute_library_stats', store=False)
     display_title = Char(string=_("Display title"), compute='_compute_display_title_form', store=True)
-    track_amount = Integer(string=_("Track amount"), compute='_compute_track_amount', default=0, store=False)
+    track_amount = Integer(string=_("Track amount"), compute='_compute_library_stats', default=0, store=False)
 
     # Related fields
     country_code = Char(related='country_id.code', string=_("Country code"))
@@ -98,23 +105,6 @@ class Artist(Model, ProcessImageMixin):
 
         return super().unlink()
 
-    @api.depends('album_ids')
-    def _compute_album_amount(self) -> None:
-        album_model = self.env['music_manager.album']
-
-        total_albums = album_model.read_group(
-            domain=[('album_artist_id', 'in', self.ids)],
-            fields=['album_artist_id'],
-            groupby=['album_artist_id'],
-        )
-
-        mapped_data = {
-            result['album_artist_id'][0]: result['album_artist_id_count'] for result in total_albums if result.get('album_artist_id')
-        }
-
-        for artist in self:
-            artist.album_amount = mapped_data.get(artist.id, 0)
-
     @api.depends('name', 'start_year', 'country_id')
     def _compute_display_name(self) -> None:
         for artist in self:
@@ -139,28 +129,29 @@ class Artist(Model, ProcessImageMixin):
             else:
                 artist.display_title = _("Artist - %s", artist.name)
 
-    @api.depends('track_ids')
-    def _compute_track_amount(self) -> None:
-        # noinspection PyProtectedMember
-        track_field = self.env['music_manager.track']._fields['track_artist_ids']
-
-        m2m_table = track_field.relation
-        col_track = track_field.column1
-        col_artist = track_field.column2
-
-        query = f"""
-            SELECT {col_artist}, COUNT({col_track})
-            FROM {m2m_table}
-            WHERE {col_artist} IN %s
-            GROUP BY {col_artist}
-        """
-
-        self.env.cr.execute(query, (tuple(self.ids), ))
-
-        mapped_data = dict(self.env.cr.fetchall())
+    @api.depends('album_ids', 'track_ids')
+    def _compute_library_stats(self) -> None:
+        artist_ids = [artist.id for artist in self if artist.id]
+        stats_by_artist = {}
+
+        # Amounts are kept by the stats table, so tracks & albums are not counted on every render
+        if artist_ids:
+            stats_by_artist = {
+                stats.artist_id.id: stats
+                for stats in self.env['music_manager.library_stats'].sudo().search_fetch(
+                    [('artist_id', 'in', artist_ids)], ['artist_id', 'album_amount', 'duration', 'track_amount']
+                )
+            }
 
         for artist in self:
-            artist.track_amount = mapped_data.get(artist.id, 0)
+            stats = stats_by_artist.get(artist.id)
+            duration = stats.duration if stats else 0
+            hours, remainder = divmod(duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
+
+            artist.album_amount = stats.album_amount if stats else 0
+            artist.display_duration = f"{hours:02}:{minutes:02}:{seconds:02}"
+            artist.track_amount = stats.track_amount if stats else 0
 
     def action_view_artist_albums(self):
         self.ensure_one()
@@ -199,36 +190,18 @@ class Artist(Model, ProcessImageMixin):
                 }
             }
 
-        total_success_count = 0
-        total_failure_messages = []
-
-        for track in self.track_ids:
-            results = track._perform_save_changes()
-            total_success_count += results['success']
-
-            if results['messages']:
-                total_failure_messages.extend(results['messages'])
-
-        final_message = []
-
-        if total_success_count == len(self.track_ids):
-            final_message.append(
-                _("All tracks from this artist have been updated!")
-            )
-
-        if total_failure_messages:
-            final_message.append(
-                _("Some tracks have been ignored:")
-            )
-            final_message.extend(total_failure_messages)
+        # Files are written by a background job, so big artists never block the request
+        job = self.env['music_manager.save_job'].enqueue(self.track_ids, self.name)
 
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': _("Music Manager says:"),
-                'message': " • ".join(final_message),
-                'type': 'warning' if total_failure_messages else 'success',
+                'message': _(
+                    "%s track(s) will be updated in background. You will be notified when it is done.", job.total_count
+                ),
+                'type': 'info',
                 'sticky': False,
             }
         }
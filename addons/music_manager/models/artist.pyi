@@ -7,6 +7,7 @@ from odoo.addons.base.models.res_users import Users
 from odoo.api import Environment
 
 from .album import Album
+from .cover import Cover
 from .track import Track
 from ..utils.custom_types import ArtistVals, DisplayNotification, CustomWarningMessage, WindowActionView, YearValue
 
@@ -20,6 +21,7 @@ class Artist:
     _name: Final[str]
     _description: str | None
     _order: str | None
+    _sql_constraints: list[tuple[str, str, str]] | None
 
     # Base model fields necessaries for context
     id: int
@@ -30,7 +32,9 @@ class Artist:
     biography: str | Literal[False]
     is_group: bool | Literal[False]
     name: str
+    name_key: str | Literal[False]
     picture: bytes | Literal[False]
+    cover_id: Cover | int | Literal[False]
     real_name: str | Literal[False]
     start_year: YearValue | Literal[False]
     website: str | Literal[False]
@@ -42,6 +46,7 @@ class Artist:
     track_ids: Sequence[Track] | Sequence[int]
 
     album_amount: int
+    display_duration: str | Literal[False]
     display_title: str | Literal[False]
     track_amount: int
 
@@ -67,12 +72,6 @@ class Artist:
         :return: Confirms deleted artist record.
         """
 
-    def _compute_album_amount(self: Self) -> None:
-        """Calculates album amount linked to this artist record.
-        Result is saved into `album_amount` field.
-        :return: None
-        """
-
     def _compute_display_name(self: Self) -> None:
         """Calculates the display name. It shows context info like artist's debut year or his country.
         :return: None
@@ -84,9 +83,9 @@ class Artist:
         :return: None
         """
 
-    def _compute_track_amount(self: Self) -> None:
-        """Calculates track amount linked to this artist record.
-        Result is saved into `track_amount` field.
+    def _compute_library_stats(self: Self) -> None:
+        """Reads album amount, track amount & total duration of the artist from the stats table.
+        Results are saved into `album_amount`, `track_amount` & `display_duration` fields.
         :return: None
         """
 
@@ -101,7 +100,7 @@ class Artist:
         """
 
     def update_songs(self: Self) -> DisplayNotification | None:
-        """Update track metadata linked to this artist. It calls to the `save_changes()` method for each track.
+        """Update track metadata linked to this artist. Tracks are saved by a background job (see `SaveJob`).
         :return: None | Dictionary with UI information
         """
 
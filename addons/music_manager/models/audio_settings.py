@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 import logging
+from dataclasses import fields as dataclass_fields
 from typing import Any, Dict
 
 # noinspection PyProtectedMember
-from odoo import _
+from odoo import _, api
+from odoo.exceptions import ValidationError
 from odoo.models import Model
 from odoo.fields import Boolean, Char, Integer, Selection
+from odoo.tools import ormcache, split_every
 
+from .mixins.process_image_mixin import PROCESSED_IMAGE_CACHE
 from ..adapters.file_service_adapter import FileServiceAdapter
+from ..adapters.track_service_adapter import TrackServiceAdapter
 from ..utils.custom_types import DisplayNotification
+from ..utils.settings_data import AudioSettingsData
 
 
 _logger = logging.getLogger(__name__)
@@ -70,13 +76,86 @@ class AudioSettings(Model):
         default='400',
         required=True,
     )
+    import_batch_size = Integer(string=_("Files per batch"), default=50, required=True)
+    import_chunk_size = Integer(string=_("Extraction chunk size"), default=10, required=True)
+    import_commit_interval = Integer(string=_("Commit interval (sec)"), default=10, required=True)
+    import_commit_size = Integer(string=_("Files per commit"), default=25, required=True)
+    import_lease_duration = Integer(string=_("Claim lease (sec)"), default=600, required=True)
+    import_time_budget = Integer(string=_("Time budget per run (sec)"), default=90, required=True)
+    import_workers = Integer(string=_("Extraction workers"), default=4, required=True)
     root_dir = Char(string="Root directory", default="/music", readonly=True, required=True)
+    save_chunk_size = Integer(string=_("Tracks per commit"), default=20, required=True)
+    save_workers = Integer(string=_("Save workers"), default=4, required=True)
+    tag_padding = Integer(string=_("Tag padding (KB)"), default=64, required=True)
     to_delete = Boolean(string=_("Delete files"), default=False, required=True)
 
+    # Computed fields
+    image_cache_hits = Integer(string=_("Image cache hits"), compute='_compute_image_cache_stats', store=False)
+    image_cache_misses = Integer(string=_("Image cache misses"), compute='_compute_image_cache_stats', store=False)
+
     # Technical fields
     name = Char(string="", default=' ', readonly=True, required=True)
     single_record = Integer(string="", default=1, required=True)
 
+    @api.model_create_multi
+    def create(self, list_vals):
+        settings = super().create(list_vals)
+
+        # Snapshots are cached per registry: every worker drops them on the next request
+        self.env.registry.clear_cache()
+
+        return settings
+
+    def write(self, vals):
+        res = super().write(vals)  # type: ignore[arg-type]
+        self.env.registry.clear_cache()
+
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+
+        return res
+
+    @api.constrains(
+        'import_batch_size', 'import_chunk_size', 'import_commit_interval', 'import_commit_size',
+        'import_lease_duration', 'import_time_budget', 'import_workers'
+    )
+    def _check_import_settings(self) -> None:
+        for settings in self:
+            if settings.import_workers < 1 or settings.import_chunk_size < 1:
+                raise ValidationError(_("\nExtraction workers and chunk size must be greater than zero."))
+
+            if settings.import_commit_size < 1 or settings.import_commit_interval < 0:
+                raise ValidationError(_("\nFiles per commit must be greater than zero and interval cannot be negative."))
+
+            if settings.import_lease_duration < 60:
+                raise ValidationError(_("\nClaim lease must last at least 60 seconds."))
+
+            if settings.import_batch_size < 1 or settings.import_time_budget < 10:
+                raise ValidationError(_("\nFiles per batch must be greater than zero and time budget at least 10 seconds."))
+
+            if settings.import_time_budget >= settings.import_lease_duration:
+                raise ValidationError(_("\nTime budget must be shorter than the claim lease."))
+
+    @api.constrains('save_chunk_size', 'save_workers', 'tag_padding')
+    def _check_save_settings(self) -> None:
+        for settings in self:
+            if settings.save_workers < 1 or settings.save_chunk_size < 1:
+                raise ValidationError(_("\nSave workers and tracks per commit must be greater than zero."))
+
+            if settings.tag_padding < 0:
+                raise ValidationError(_("\nTag padding cannot be negative."))
+
+    def _compute_image_cache_stats(self) -> None:
+        # Counters belong to the worker process serving this request
+        cache_stats = PROCESSED_IMAGE_CACHE.stats()
+
+        for settings in self:
+            settings.image_cache_hits = cache_stats['hits']
+            settings.image_cache_misses = cache_stats['misses']
+
     def action_open_settings(self) -> Dict[str, Any]:
         settings = self.search([], limit=1)
 
@@ -92,27 +171,73 @@ class AudioSettings(Model):
             'target': 'current',
         }
 
+    @api.model
+    def get_settings(self) -> AudioSettingsData:
+        return self._get_cached_settings()
+
+    @api.model
+    def get_file_service_adapter(self) -> FileServiceAdapter:
+        # Adapters have mutable state: only the settings snapshot is cached, every caller gets its own adapter. Building
+        # one costs no disk access, the root dir is only checked before file operations
+        settings = self.get_settings()
+
+        return FileServiceAdapter(str_root_dir=settings.root_dir, file_extension=settings.sound_format)
+
+    @api.model
+    def get_track_service_adapter(self) -> TrackServiceAdapter:
+        settings = self.get_settings()
+
+        return TrackServiceAdapter(file_type=settings.sound_format, tag_padding=settings.tag_padding * 1024)
+
+    @ormcache()
+    def _get_cached_settings(self) -> AudioSettingsData:
+        settings = self.sudo().search([], limit=1)
+
+        field_names = [field.name for field in dataclass_fields(AudioSettingsData)]
+
+        # Without a settings record, the model defaults apply: the snapshot never drifts from the form
+        if not settings:
+            return AudioSettingsData(
+                **{field_name: self._fields[field_name].default(self) for field_name in field_names}
+            )
+
+        return AudioSettingsData(**{field_name: settings[field_name] for field_name in field_names})
+
     def action_read_root_folder(self):
         self.ensure_one()
+        return self._scan_root_folder()
+
+    def action_read_root_folder_full(self):
+        self.ensure_one()
+        return self._scan_root_folder(force=True)
+
+    def _scan_root_folder(self, force=False):
+        file_service = self.get_file_service_adapter()
+        scan_index = self.env['music_manager.scan_index'].sudo()
 
-        file_service = FileServiceAdapter(self.root_dir, self.sound_format)
-        str_file_paths = [str(file_path) for file_path in file_service.get_all_file_paths()]
+        changed_paths = scan_index.scan_library(file_service, force=force)
 
-        if not str_file_paths:
+        if not scan_index.has_files():
             return self._notify_user(_("Root folder is empty, add some files first!"), 'info')
 
         track_model = self.env['music_manager.track']
+        track_model.sudo().refresh_file_presence(self.root_dir)
         import_queue_model = self.env['music_manager.music_import_queue']
 
-        existing_tracks = track_model.search_read([('file_path', 'in', str_file_paths)], ['file_path'])
-        existing_queue = import_queue_model.search_read(
-            [('file_path', 'in', str_file_paths), ('state', 'in', ['pending', 'error'])], ['file_path']
-        )
+        to_enqueue = []
+
+        for str_file_paths in split_every(1000, changed_paths, list):
+            existing_tracks = track_model.search_read([('file_path', 'in', str_file_paths)], ['file_path'])
+            existing_queue = import_queue_model.search_read(
+                [('file_path', 'in', str_file_paths), ('state', 'in', ['pending', 'processing', 'error'])], ['file_path']
+            )
 
-        processed_paths = {track['file_path'] for track in existing_tracks}
-        pending_paths = {track['file_path'] for track in existing_queue}
+            processed_paths = {track['file_path'] for track in existing_tracks}
+            pending_paths = {track['file_path'] for track in existing_queue}
 
-        to_enqueue = [path for path in str_file_paths if path not in processed_paths and path not in pending_paths]
+            to_enqueue.extend(
+                path for path in str_file_paths if path not in processed_paths and path not in pending_paths
+            )
 
         if not to_enqueue:
             return self._notify_user(_("All files are already in the library."), 'success')
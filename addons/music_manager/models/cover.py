@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.models import Model
+from odoo.fields import Binary, Char
+
+from ..utils.data_encoding import base64_decode
+
+
+_logger = logging.getLogger(__name__)
+
+
+COVER_REFERENCES = (
+    ('music_manager_album', 'cover_id'),
+    ('music_manager_artist', 'cover_id'),
+    ('music_manager_genre', 'cover_id'),
+    ('music_manager_track', 'cover_id'),
+)
+
+
+class Cover(Model):
+    _name = 'music_manager.cover'
+    _description = 'cover_table'
+    _rec_name = 'checksum'
+    _sql_constraints = [
+        ('unique_checksum', 'UNIQUE(checksum)', _("This cover already exists.")),
+    ]
+
+    # Basic fields
+    checksum = Char(string=_("Checksum (SHA-256)"), required=True, readonly=True, index=True)
+    image = Binary(string=_("Image"), attachment=True, required=True, readonly=True)
+
+    @api.model
+    def get_or_create(self, processed_image):
+        if not processed_image:
+            return self.browse()
+
+        checksum = self.compute_checksum(processed_image)
+        cover = self.sudo().search([('checksum', '=', checksum)], limit=1)
+
+        if not cover:
+            cover = self.sudo().create({'checksum': checksum, 'image': processed_image})
+
+        return cover.with_env(self.env)
+
+    @api.autovacuum
+    def _gc_unused_covers(self) -> None:
+        references = " AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM {table} WHERE {table}.{column} = cover.id)"
+            for table, column in COVER_REFERENCES
+        )
+
+        self.env.cr.execute(f"SELECT cover.id FROM {self._table} cover WHERE {references}")
+        unused_covers = self.browse([row[0] for row in self.env.cr.fetchall()])
+
+        if unused_covers:
+            _logger.info(f"Garbage Collector: Removing {len(unused_covers)} unused covers.")
+            unused_covers.sudo().unlink()
+
+    @staticmethod
+    def compute_checksum(processed_image) -> str:
+        return hashlib.sha256(base64_decode(processed_image)).hexdigest()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from typing import Final, Literal, Self
+
+from odoo.api import Environment
+
+
+COVER_REFERENCES: Final[tuple[tuple[str, str], ...]]
+
+
+class Cover:
+    """
+    Represents a Cover model into the system.
+    Stores each processed picture once, identified by its SHA-256 checksum, so tracks, albums, artists & genres
+    sharing the same image reference a single attachment.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _rec_name: Final[str]
+    _sql_constraints: list[tuple[str, str, str]] | None
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    checksum: str
+    image: bytes | Literal[False]
+
+    def get_or_create(self: Self, processed_image: str | bytes | Literal[False]) -> Self:
+        """Returns the cover holding the given processed image, creating it only if its checksum is unknown.
+        :param processed_image: Processed image encoded in base64
+        :return: Cover record (empty if no image is given)
+        """
+
+    def _gc_unused_covers(self: Self) -> None:
+        """Removes covers that are no longer referenced by any track, album, artist or genre.
+        :return: None
+        """
+
+    @staticmethod
+    def compute_checksum(processed_image: str | bytes) -> str:
+        """Calculates the SHA-256 checksum of the decoded image.
+        :param processed_image: Processed image encoded in base64
+        :return: Hexadecimal checksum
+        """
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# noinspection PyProtectedMember
+from odoo import _
+from odoo.models import Model
+from odoo.fields import Char, Many2one
+
+
+class CoverSource(Model):
+    _name = 'music_manager.cover_source'
+    _description = 'cover_source_table'
+    _rec_name = 'source_checksum'
+    _sql_constraints = [
+        ('unique_source',
+         'UNIQUE(source_checksum, image_format, image_size)',
+         _("This source image is already processed with these settings.")),
+    ]
+
+    # Basic fields
+    image_format = Char(string=_("Image format"), required=True, readonly=True)
+    image_size = Char(string=_("Image size"), required=True, readonly=True)
+    source_checksum = Char(string=_("Source checksum (SHA-256)"), required=True, readonly=True, index=True)
+
+    # Relational fields
+    cover_id = Many2one(
+        comodel_name='music_manager.cover', string=_("Cover"), ondelete='cascade', required=True, readonly=True
+    )
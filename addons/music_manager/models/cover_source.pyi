@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from typing import Final
+
+from odoo.api import Environment
+
+from .cover import Cover
+
+
+class CoverSource:
+    """
+    Represents a CoverSource model into the system.
+    Remembers which shared cover was produced from a source image with a given format & size, so the same
+    source never goes through the image pipeline twice.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _rec_name: Final[str]
+    _sql_constraints: list[tuple[str, str, str]] | None
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    image_format: str
+    image_size: str
+    source_checksum: str
+
+    cover_id: Cover | int
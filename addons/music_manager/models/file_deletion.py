@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import logging
+
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.models import Model
+from odoo.fields import Char, Text
+
+from ..utils.exceptions import InvalidPathError, MusicManagerError
+
+
+_logger = logging.getLogger(__name__)
+
+
+FILE_DELETION_BATCH = 500
+
+
+class FileDeletion(Model):
+    _name = 'music_manager.file_deletion'
+    _description = 'file_deletion_table'
+    _rec_name = 'file_path'
+
+    # Basic fields
+    file_path = Char(string=_("File path"), required=True, readonly=True, index=True)
+    error_message = Text(string=_("Error message"), readonly=True)
+
+    @api.model
+    def enqueue_paths(self, str_file_paths):
+        if not str_file_paths:
+            return self.browse()
+
+        deletions = self.sudo().create([{'file_path': path} for path in str_file_paths])
+
+        # Pending deletions are committed with the tracks removal: the cron only sees them once both are saved
+        self.env.ref('music_manager.ir_cron_music_file_cleaning').sudo()._trigger()
+
+        return deletions
+
+    @api.model
+    def _cron_delete_files(self, batch_size=FILE_DELETION_BATCH) -> None:
+        file_service = self.env['music_manager.audio_settings'].get_file_service_adapter()
+
+        try:
+            file_service.check_root_dir()
+
+        except InvalidPathError as invalid_path:
+            # An unmounted library would look like already deleted files: they are kept for the next run
+            _logger.warning(f"File cleaning: postponed, root folder not available: {invalid_path}")
+            return
+
+        deleted_count = 0
+        failed_count = 0
+        last_id = 0
+
+        while True:
+            deletions = self.sudo().search([('id', '>', last_id)], order='id', limit=batch_size)
+
+            if not deletions:
+                break
+
+            last_id = deletions[-1].id
+            deleted_count_batch, failed_deletions = self._delete_files(file_service, deletions)
+            deleted_count += deleted_count_batch
+            failed_count += len(failed_deletions)
+
+            (deletions - failed_deletions).unlink()
+            self.env.cr.commit()
+
+        if deleted_count or failed_count:
+            _logger.info(f"File cleaning: {deleted_count} files deleted, {failed_count} kept to retry.")
+
+    def _delete_files(self, file_service, deletions):
+        # Paths imported again after the deletion belong to a new track
+        used_paths = {
+            track['file_path'] for track in self.env['music_manager.track'].sudo().search_read(
+                [('file_path', 'in', deletions.mapped('file_path'))], ['file_path']
+            )
+        }
+        deleted_count = 0
+        failed_deletions = self.browse()
+
+        for deletion in deletions:
+            if deletion.file_path in used_paths:
+                continue
+
+            try:
+                file_service.delete_file(deletion.file_path)
+                deleted_count += 1
+
+            except InvalidPathError as invalid_path:
+                _logger.warning(f"File to delete not found, continuing: {invalid_path}")
+
+            except MusicManagerError as unknown_error:
+                _logger.error(f"Cannot delete the file, it will be retried: {unknown_error}")
+                deletion.error_message = str(unknown_error)
+                failed_deletions |= deletion
+
+        return deleted_count, failed_deletions
@@ -0,0 +1,48 @@
+from typing import Final, Literal, Self, Tuple
+
+from odoo.api import Environment
+
+from ..adapters.file_service_adapter import FileServiceAdapter
+
+
+FILE_DELETION_BATCH: Final[int]
+
+
+class FileDeletion:
+    """
+    Represents a music file waiting to be deleted from disk into the system.
+    Rows are created in the same transaction that removes the tracks, so a committed deletion always leaves its files
+    registered here. A cron drains them: files are only deleted once the database agrees, and failures are retried.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _rec_name: Final[str]
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    file_path: str
+    error_message: str | Literal[False]
+
+    def enqueue_paths(self: Self, str_file_paths: list[str]) -> Self:
+        """Registers the files to delete and triggers the cleaning cron.
+        :param str_file_paths: Paths of the files to delete
+        :return: Pending deletion records
+        """
+
+    def _cron_delete_files(self: Self, batch_size: int = ...) -> None:
+        """Deletes the pending files batch after batch, committing each one. Files that cannot be deleted keep their
+        row with the error, so next run retries them. Nothing is deleted while the root folder is not available.
+        :param batch_size: Amount of rows read per batch
+        :return: None
+        """
+
+    def _delete_files(self: Self, file_service: FileServiceAdapter, deletions: Self) -> Tuple[int, Self]:
+        """Deletes the files of the given rows, skipping the paths used again by a track.
+        :param file_service: File service adapter
+        :param deletions: Pending deletion records
+        :return: Amount of deleted files & rows that failed
+        """
@@ -5,10 +5,11 @@ from odoo.exceptions import AccessError, UserError
 from odoo.models import Model
 from odoo.fields import Binary, Char, Html, Integer, Many2one, One2many
 
+from .mixins.name_key_mixin import NameKeyMixin
 from .mixins.process_image_mixin import ProcessImageMixin
 
 
-class Genre(Model, ProcessImageMixin):
+class Genre(Model, NameKeyMixin, ProcessImageMixin):
     _name = 'music_manager.genre'
     _description = 'genre_table'
     _parent_name = "parent_id"
@@ -17,23 +18,27 @@ class Genre(Model, ProcessImageMixin):
     _rec_name = 'complete_name'
     _sql_constraints = [
         ('check_genre_name', 'UNIQUE(name)', _("Genre name must be unique.")),
+        ('unique_genre_name_key', 'UNIQUE(name_key)', _("Genre name must be unique.")),
     ]
 
     # Default fields
     description = Html(string=_("Description"))
     name = Char(string=_("Name"), required=True)
+    name_key = Char(string=_("Name key"), compute='_compute_name_key', store=True, index=True, readonly=True)
     parent_path = Char(string=_("Parent path"), index=True, unaccent=False)
-    picture = Binary(string=_("Picture"))
+    picture = Binary(string=_("Picture"), compute='_compute_picture', inverse='_inverse_picture', store=False)
 
     # Relationships
     album_ids = One2many(comodel_name='music_manager.album', inverse_name='genre_id', string=_("Album(s)"))
+    cover_id = Many2one(comodel_name='music_manager.cover', string=_("Cover"), ondelete='restrict', index=True)
     parent_id = Many2one(comodel_name='music_manager.genre', string=_("Parent genre"), index=True, ondelete='cascade')
     track_ids = One2many(comodel_name='music_manager.track', inverse_name='genre_id', string=_("Track(s)"))
 
     # Computed fields
     complete_name = Char(string=_("Full hierarchy"), compute='_compute_complete_name', recursive=True, store=True)
-    disk_amount = Integer(string=_("Disk amount"), compute='_compute_disk_amount', default=0)
-    track_amount = Integer(string=_("Track amount"), compute='_compute_track_amount', default=0)
+    disk_amount = Integer(string=_("Disk amount"), compute='_compute_library_stats', default=0)
+    display_duration = Char(string=_("Duration (min)"), compute='_compute_library_stats')
+    track_amount = Integer(string=_("Track amount"), compute='_compute_library_stats', default=0)
 
     # Technical fields
     custom_owner_id = Many2one(
@@ -57,8 +62,14 @@ class Genre(Model, ProcessImageMixin):
                     raise AccessError(_("\nCannot update this genre because you are not the owner. 🤷"))
 
         self._process_picture_image(vals)
+        old_parents = self.parent_id if 'parent_id' in vals else self.browse()
+        res = super().write(vals)  # type: ignore[arg-type]
 
-        return super().write(vals)  # type: ignore[arg-type]
+        # Moved genres change the totals of their old & new ancestors
+        if 'parent_id' in vals:
+            self.env['music_manager.library_stats'].refresh_stats(genres=self | old_parents)
+
+        return res
 
     def unlink(self):
         for genre in self:
@@ -75,7 +86,13 @@ class Genre(Model, ProcessImageMixin):
         if related_tracks > 0 or related_albums > 0:
             raise UserError(_("\nGenre(s) cannot be deleted as they are still in use. 🤷"))
 
-        return super().unlink()
+        parents = self.parent_id - self
+        res = super().unlink()
+
+        if parents:
+            self.env['music_manager.library_stats'].refresh_stats(genres=parents)
+
+        return res
 
     @api.depends('name', 'parent_id.complete_name')
     def _compute_complete_name(self) -> None:
@@ -86,39 +103,30 @@ class Genre(Model, ProcessImageMixin):
             else:
                 genre.complete_name = genre.name
 
-    @api.depends('album_ids')
-    def _compute_disk_amount(self) -> None:
-        album_model = self.env['music_manager.album']
-
-        total_albums = album_model.read_group(
-            domain=[('genre_id', 'in', self.ids)],
-            fields=['genre_id'],
-            groupby=['genre_id'],
-        )
-
-        mapped_data = {
-            result['genre_id'][0]: result['genre_id_count'] for result in total_albums if result.get('genre_id')
-        }
+    @api.depends('album_ids', 'track_ids')
+    def _compute_library_stats(self) -> None:
+        genre_ids = [genre.id for genre in self if genre.id]
+        stats_by_genre = {}
+
+        # Totals include every subgenre, as the albums & tracks shown by the smart buttons
+        if genre_ids:
+            stats_by_genre = {
+                stats.genre_id.id: stats
+                for stats in self.env['music_manager.library_stats'].sudo().search_fetch(
+                    [('genre_id', 'in', genre_ids)],
+                    ['genre_id', 'total_album_amount', 'total_duration', 'total_track_amount'],
+                )
+            }
 
         for genre in self:
-            genre.disk_amount = mapped_data.get(genre.id, 0)
+            stats = stats_by_genre.get(genre.id)
+            duration = stats.total_duration if stats else 0
+            hours, remainder = divmod(duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
 
-    @api.depends('track_ids')
-    def _compute_track_amount(self) -> None:
-        track_model = self.env['music_manager.track']
-
-        total_tracks = track_model.read_group(
-            domain=[('genre_id', 'in', self.ids)],
-            fields=['genre_id'],
-            groupby=['genre_id'],
-        )
-
-        mapped_data = {
-            result['genre_id'][0]: result['genre_id_count'] for result in total_tracks if result.get('genre_id')
-        }
-
-        for genre in self:
-            genre.track_amount = mapped_data.get(genre.id, 0)
+            genre.disk_amount = stats.total_album_amount if stats else 0
+            genre.display_duration = f"{hours:02}:{minutes:02}:{seconds:02}"
+            genre.track_amount = stats.total_track_amount if stats else 0
 
     def action_view_genre_albums(self):
         self.ensure_one()
@@ -157,37 +165,18 @@ class Genre(Model, ProcessImageMixin):
                 }
             }
 
-        total_success_count = 0
-        total_failure_messages = []
-
-        for track in self.track_ids:
-            # noinspection PyProtectedMember
-            results = track._perform_save_changes()
-            total_success_count += results['success']
-
-            if results['messages']:
-                total_failure_messages.extend(results['messages'])
-
-        final_message = []
-
-        if total_success_count == len(self.track_ids):
-            final_message.append(
-                _("All tracks from this genre have been updated!")
-            )
-
-        if total_failure_messages:
-            final_message.append(
-                _("Some tracks have been ignored:")
-            )
-            final_message.extend(total_failure_messages)
+        # Files are written by a background job, so big genres never block the request
+        job = self.env['music_manager.save_job'].enqueue(self.track_ids, self.name)
 
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': _("Music Manager says:"),
-                'message': " • ".join(final_message),
-                'type': 'warning' if total_failure_messages else 'success',
+                'message': _(
+                    "%s track(s) will be updated in background. You will be notified when it is done.", job.total_count
+                ),
+                'type': 'info',
                 'sticky': False,
             }
         }
@@ -6,6 +6,7 @@ from odoo.addons.base.models.res_users import Users
 from odoo.api import Environment
 
 from .album import Album
+from .cover import Cover
 from .track import Track
 from ..utils.custom_types import CustomWarningMessage, DisplayNotification, GenreVals, WindowActionView
 
@@ -32,8 +33,10 @@ class Genre:
     # Custom fields
     description: str | Literal[False]
     name: str
+    name_key: str | Literal[False]
     parent_path: str | Literal[False]
     picture: bytes | Literal[False]
+    cover_id: Cover | int | Literal[False]
 
     album_ids: Sequence[Album] | Sequence[int]
     parent_id: Genre | int | Literal[False]
@@ -42,6 +45,7 @@ class Genre:
     complete_name: str | Literal[False]
     track_amount: int
     disk_amount: int
+    display_duration: str | Literal[False]
 
     custom_owner_id: Users | int
 
@@ -52,13 +56,14 @@ class Genre:
         """
 
     def write(self: Self, vals: GenreVals) -> Literal[True]:
-        """Overrides 'write' method to ensure only owner can update records.
+        """Overrides 'write' method to ensure only owner can update records. Moving a genre refreshes the stats of
+        its old & new parent genres.
         :param vals: Dictionary with artist values to update.
         :return: Confirms updated artist record.
         """
 
     def unlink(self: Self) -> Literal[True]:
-        """Overrides 'unlink' method to ensure only owner can delete records.
+        """Overrides 'unlink' method to ensure only owner can delete records & refreshes the stats of parent genres.
         :return: Confirms deleted genre record.
         """
 
@@ -68,15 +73,9 @@ class Genre:
         :return: None
         """
 
-    def _compute_disk_amount(self: Self) -> None:
-        """Calculates disk amount linked to this genre record.
-        Result is saved into `disk_amount` field.
-        :return: None
-        """
-
-    def _compute_track_amount(self: Self) -> None:
-        """Calculates track amount linked to this genre record.
-        Result is saved into `track_amount` field.
+    def _compute_library_stats(self: Self) -> None:
+        """Reads disk amount, track amount & total duration of the genre and its subgenres from the stats table.
+        Results are saved into `disk_amount`, `track_amount` & `display_duration` fields.
         :return: None
         """
 
@@ -91,7 +90,7 @@ class Genre:
         """
 
     def update_songs(self: Self) -> DisplayNotification | None:
-        """Update track metadata linked to this genre. It calls to the `save_changes()` method for each track.
+        """Update track metadata linked to this genre. Tracks are saved by a background job (see `SaveJob`).
         :return: None | Dictionary with UI information
         """
 
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.models import Model
+from odoo.fields import Char, Integer
+
+
+class ImportCheckpoint(Model):
+    _name = 'music_manager.import_checkpoint'
+    _description = 'import_checkpoint_table'
+    _rec_name = 'worker_name'
+    _sql_constraints = [
+        ('unique_worker_name', 'UNIQUE(worker_name)', _("Import worker can only have one checkpoint.")),
+    ]
+
+    # Basic fields
+    worker_name = Char(string=_("Worker"), required=True, readonly=True)
+    claim_token = Char(string=_("Claim token"), copy=False, readonly=True)
+    failed_count = Integer(string=_("Failed"), default=0, readonly=True)
+    processed_count = Integer(string=_("Processed"), default=0, readonly=True)
+
+    @api.model
+    def get_checkpoint(self, worker_name):
+        checkpoint = self.sudo().search([('worker_name', '=', worker_name)], limit=1)
+
+        return checkpoint or self.sudo().create({'worker_name': worker_name})
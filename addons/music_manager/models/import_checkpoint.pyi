@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from typing import Final, Literal, Self
+
+from odoo.api import Environment
+
+
+class ImportCheckpoint:
+    """
+    Represents the progress of an import worker into the system.
+    Every batch updates the row of its worker, so a killed run can release its files & resume its counters. Rows live
+    in their own table: system parameters would clear the caches of every worker on each batch.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _rec_name: Final[str]
+    _sql_constraints: list[tuple[str, str, str]] | None
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    worker_name: str
+    claim_token: str | Literal[False]
+    failed_count: int
+    processed_count: int
+
+    def get_checkpoint(self: Self, worker_name: str) -> Self:
+        """Returns the checkpoint of the worker, creating it if it does not exist yet.
+        :param worker_name: Name of the worker
+        :return: Checkpoint record
+        """
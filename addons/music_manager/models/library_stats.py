@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+import logging
+
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.models import Model
+from odoo.fields import Integer, Many2one
+from odoo.tools import split_every
+
+
+_logger = logging.getLogger(__name__)
+
+
+STATS_FIELDS = ('album_amount', 'duration', 'track_amount')
+TOTAL_STATS_FIELDS = ('total_album_amount', 'total_duration', 'total_track_amount')
+
+
+class LibraryStats(Model):
+    _name = 'music_manager.library_stats'
+    _description = 'library_stats_table'
+    _log_access = False
+    _sql_constraints = [
+        ('unique_artist_stats', 'UNIQUE(artist_id)', _("Artist can only have one stats record.")),
+        ('unique_genre_stats', 'UNIQUE(genre_id)', _("Genre can only have one stats record.")),
+    ]
+
+    # Basic fields
+    album_amount = Integer(string=_("Album amount"), default=0, readonly=True)
+    duration = Integer(string=_("Duration (sec)"), default=0, readonly=True)
+    track_amount = Integer(string=_("Track amount"), default=0, readonly=True)
+
+    # Genre hierarchy totals: own stats plus the ones of every subgenre
+    total_album_amount = Integer(string=_("Total album amount"), default=0, readonly=True)
+    total_duration = Integer(string=_("Total duration (sec)"), default=0, readonly=True)
+    total_track_amount = Integer(string=_("Total track amount"), default=0, readonly=True)
+
+    # Relational fields
+    artist_id = Many2one(
+        comodel_name='music_manager.artist', string=_("Artist"), ondelete='cascade', index=True, readonly=True
+    )
+    genre_id = Many2one(
+        comodel_name='music_manager.genre', string=_("Genre"), ondelete='cascade', index=True, readonly=True
+    )
+
+    @api.model
+    def refresh_stats(self, artists=None, genres=None) -> None:
+        # Bulk imports refresh every stats row at once when they finish, through 'ir_cron_music_library_stats'
+        if self.env.context.get('defer_library_stats'):
+            return
+
+        # Deleted records lose their stats by cascade
+        artist_ids = artists.sudo().exists().ids if artists else []
+        genre_ids = genres.sudo().exists().ids if genres else []
+
+        if artist_ids:
+            self._refresh_artist_stats(artist_ids)
+
+        if genre_ids:
+            self._refresh_genre_stats(genre_ids)
+            self._rollup_genre_stats(genre_ids)
+
+    @api.model
+    def _cron_rebuild_stats(self) -> None:
+        self._rebuild_stats()
+
+    @api.model
+    def _rebuild_stats(self) -> None:
+        artists = self.env['music_manager.artist'].sudo().search([])
+        genres = self.env['music_manager.genre'].sudo().search([])
+
+        self.refresh_stats(artists=artists, genres=genres)
+
+        _logger.info(f"Library stats: rebuilt for {len(artists)} artists and {len(genres)} genres.")
+
+    def _refresh_artist_stats(self, artist_ids) -> None:
+        album_model = self.env['music_manager.album'].sudo()
+        track_model = self.env['music_manager.track'].sudo()
+        stats = {artist_id: dict.fromkeys(STATS_FIELDS, 0) for artist_id in artist_ids}
+
+        # noinspection PyProtectedMember
+        for artist, album_amount in album_model._read_group(
+                domain=[('album_artist_id', 'in', artist_ids)],
+                groupby=['album_artist_id'],
+                aggregates=['__count'],
+        ):
+            stats[artist.id]['album_amount'] = album_amount
+
+        # Tracks with several artists come back in every artist group, also in the ones not asked for
+        # noinspection PyProtectedMember
+        for artist, track_amount, duration in track_model._read_group(
+                domain=[('track_artist_ids', 'in', artist_ids)],
+                groupby=['track_artist_ids'],
+                aggregates=['__count', 'duration:sum'],
+        ):
+            if artist.id in stats:
+                stats[artist.id].update({'track_amount': track_amount, 'duration': duration or 0})
+
+        self._write_stats('artist_id', stats)
+
+    def _refresh_genre_stats(self, genre_ids) -> None:
+        album_model = self.env['music_manager.album'].sudo()
+        track_model = self.env['music_manager.track'].sudo()
+        stats = {genre_id: dict.fromkeys(STATS_FIELDS, 0) for genre_id in genre_ids}
+
+        # noinspection PyProtectedMember
+        for genre, album_amount in album_model._read_group(
+                domain=[('genre_id', 'in', genre_ids)],
+                groupby=['genre_id'],
+                aggregates=['__count'],
+        ):
+            stats[genre.id]['album_amount'] = album_amount
+
+        # noinspection PyProtectedMember
+        for genre, track_amount, duration in track_model._read_group(
+                domain=[('genre_id', 'in', genre_ids)],
+                groupby=['genre_id'],
+                aggregates=['__count', 'duration:sum'],
+        ):
+            stats[genre.id].update({'track_amount': track_amount, 'duration': duration or 0})
+
+        self._write_stats('genre_id', stats)
+
+    def _rollup_genre_stats(self, genre_ids) -> None:
+        genres = self.env['music_manager.genre'].sudo().browse(genre_ids)
+
+        # Every ancestor of a changed genre has its totals changed too
+        ancestor_ids = {
+            int(genre_id) for genre in genres for genre_id in (genre.parent_path or '').split('/') if genre_id
+        }
+
+        if not ancestor_ids:
+            return
+
+        totals = {ancestor_id: dict.fromkeys(TOTAL_STATS_FIELDS, 0) for ancestor_id in ancestor_ids}
+        subtree_stats = self.sudo().search_fetch(
+            [('genre_id', 'child_of', list(ancestor_ids))], ['genre_id', *STATS_FIELDS]
+        )
+
+        for stats in subtree_stats:
+            for genre_id in stats.genre_id.parent_path.split('/'):
+                if genre_id and int(genre_id) in totals:
+                    genre_totals = totals[int(genre_id)]
+                    genre_totals['total_album_amount'] += stats.album_amount
+                    genre_totals['total_duration'] += stats.duration
+                    genre_totals['total_track_amount'] += stats.track_amount
+
+        self._write_stats('genre_id', totals)
+
+    def _write_stats(self, field_name, values_by_id) -> None:
+        if not values_by_id:
+            return
+
+        column_names = list(next(iter(values_by_id.values())))
+        all_column_names = [*STATS_FIELDS, *TOTAL_STATS_FIELDS]
+        rows = [
+            (record_id, *(values.get(column_name, 0) for column_name in all_column_names))
+            for record_id, values in sorted(values_by_id.items())
+        ]
+
+        # Imports & the stats cron can refresh the same rows at once: an upsert never breaks the unique key.
+        # Stats are only written when they changed, so unrelated edits cost no update
+        for rows_group in split_every(1000, rows, list):
+            self.env.cr.execute(
+                f"""
+                INSERT INTO {self._table} ({field_name}, {", ".join(all_column_names)})
+                VALUES {", ".join(["%s"] * len(rows_group))}
+                ON CONFLICT ({field_name}) DO UPDATE
+                SET {", ".join(f"{column_name} = EXCLUDED.{column_name}" for column_name in column_names)}
+                WHERE ({", ".join(f"{self._table}.{column_name}" for column_name in column_names)})
+                    IS DISTINCT FROM ({", ".join(f"EXCLUDED.{column_name}" for column_name in column_names)})
+                """,
+                rows_group
+            )
+
+        self.invalidate_model([field_name, *all_column_names])
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from typing import Final, Literal, Self
+
+from odoo.api import Environment
+
+from .artist import Artist
+from .genre import Genre
+
+
+STATS_FIELDS: Final[tuple[str, ...]]
+TOTAL_STATS_FIELDS: Final[tuple[str, ...]]
+
+
+class LibraryStats:
+    """
+    Represents the precomputed numbers of an artist or a genre into the system.
+    Album amount, track amount & duration are refreshed whenever a track or an album is created, updated or deleted,
+    so list & kanban views never count them on render. Genres also keep totals of their whole subgenre hierarchy.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _sql_constraints: list[tuple[str, str, str]] | None
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    album_amount: int
+    duration: int
+    track_amount: int
+
+    total_album_amount: int
+    total_duration: int
+    total_track_amount: int
+
+    artist_id: Artist | int | Literal[False]
+    genre_id: Genre | int | Literal[False]
+
+    def refresh_stats(self: Self, artists: Artist | None = None, genres: Genre | None = None) -> None:
+        """Calculates again the stats of the given artists & genres, and the totals of every parent genre.
+        Skipped with the 'defer_library_stats' context key: bulk imports rebuild all stats once they finish.
+        :param artists: Artists whose albums or tracks changed
+        :param genres: Genres whose albums, tracks or parent genre changed
+        :return: None
+        """
+
+    def _cron_rebuild_stats(self: Self) -> None:
+        """Rebuilds every stats row. Triggered when an import run ends, so parallel import workers never update the
+        same rows, and daily to fix any drift.
+        :return: None
+        """
+
+    def _rebuild_stats(self: Self) -> None:
+        """Calculates the stats of every artist & genre. Called on module install or update.
+        :return: None
+        """
+
+    def _refresh_artist_stats(self: Self, artist_ids: list[int]) -> None:
+        """Counts albums, tracks & track duration of the artists with one grouped query per model.
+        :param artist_ids: Artist ids
+        :return: None
+        """
+
+    def _refresh_genre_stats(self: Self, genre_ids: list[int]) -> None:
+        """Counts albums, tracks & track duration of the genres, without subgenres.
+        :param genre_ids: Genre ids
+        :return: None
+        """
+
+    def _rollup_genre_stats(self: Self, genre_ids: list[int]) -> None:
+        """Sums the stats of every subgenre into the totals of the genres & all their ancestors, using `parent_path`.
+        :param genre_ids: Genre ids
+        :return: None
+        """
+
+    def _write_stats(self: Self, field_name: str, values_by_id: dict[int, dict[str, int]]) -> None:
+        """Upserts the stats records in a single query, updating only the ones whose values changed. Missing records
+        are created with zero in the other stats.
+        :param field_name: 'artist_id' or 'genre_id'
+        :param values_by_id: Values to write by artist or genre id
+        :return: None
+        """
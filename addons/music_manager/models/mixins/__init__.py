@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from .name_key_mixin import NameKeyMixin
 from .process_image_mixin import ProcessImageMixin
 
 __all__ = [
+    "NameKeyMixin",
     "ProcessImageMixin",
 ]
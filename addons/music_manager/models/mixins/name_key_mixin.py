@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+from odoo import api
+from odoo.models import AbstractModel
+
+from ...utils.file_utils import get_name_key
+
+
+class NameKeyMixin(AbstractModel):
+    _name = 'music_manager.name_key_mixin'
+    _description = 'shared_name_key_method'
+
+    @api.depends('name')
+    def _compute_name_key(self) -> None:
+        for record in self:
+            record.name_key = get_name_key(record.name) if record.name else False
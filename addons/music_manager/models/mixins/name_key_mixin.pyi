@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from typing import Final, Self
+
+
+class NameKeyMixin:
+    """
+    Helps to match records by name regardless of accents, case or extra spaces.
+    Inherited models store the normalized name into an indexed `name_key` field, used by every name lookup.
+    """
+
+    _name: Final[str]
+    _description: str | None
+
+    def _compute_name_key(self: Self) -> None:
+        """Calculates the normalized name of the record, so 'Beyoncé' & ' beyonce ' share the same key.
+        :return: None
+        """
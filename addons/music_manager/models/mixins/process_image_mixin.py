@@ -15,11 +15,16 @@ from ...utils.exceptions import (
     MusicManagerError
 )
 from ...utils.file_utils import validate_allowed_mimes
+from ...utils.lru_cache import LRUCache
 
 
 _logger = logging.getLogger(__name__)
 
 
+# Processed cover checksums by (source checksum, image format, image size), shared by every model of this worker
+PROCESSED_IMAGE_CACHE = LRUCache(max_size=512)
+
+
 class ProcessImageMixin(AbstractModel):
     _name = 'music_manager.process_image_mixin'
     _description = 'shared_process_image_method'
@@ -47,21 +52,85 @@ class ProcessImageMixin(AbstractModel):
 
         return None
 
-    def _get_image_service_adapter(self, image):
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+    @api.depends('cover_id')
+    def _compute_picture(self) -> None:
+        for record in self:
+            record.picture = record.cover_id.image if record.cover_id else False
+
+    def _inverse_picture(self) -> None:
+        for record in self:
+            values = {'picture': record.picture}
+            self._process_picture_image(values)
+            record.cover_id = values['cover_id']
 
-        image_format = settings.image_format if settings else 'png'
-        image_size = settings.image_size if settings else '400'
+    def _get_image_service_adapter(self, image):
+        image_format, image_size = self._get_image_settings()
 
         return ImageServiceAdapter(image, image_type=image_format, square_size=image_size)
 
+    def _get_image_settings(self):
+        settings = self.env['music_manager.audio_settings'].get_settings()
+
+        return settings.image_format, settings.image_size
+
+    def _get_processed_cover(self, picture):
+        cover_model = self.env['music_manager.cover']
+        cover_source_model = self.env['music_manager.cover_source'].sudo()
+
+        image_format, image_size = self._get_image_settings()
+        cache_key = (cover_model.compute_checksum(picture), image_format, image_size)
+
+        # 1. Memory: processed checksum of a recently seen source image
+        cover_checksum = PROCESSED_IMAGE_CACHE.get(cache_key)
+
+        if cover_checksum:
+            cover = cover_model.sudo().search([('checksum', '=', cover_checksum)], limit=1)
+
+            if cover:
+                return cover.with_env(self.env)
+
+            # Cover was removed or its transaction rolled back
+            PROCESSED_IMAGE_CACHE.discard(cache_key)
+
+        # 2. Database: source already processed by another worker or a previous run
+        source_checksum, image_format, image_size = cache_key
+        cover_source = cover_source_model.search([
+            ('source_checksum', '=', source_checksum),
+            ('image_format', '=', image_format),
+            ('image_size', '=', image_size),
+        ], limit=1)
+
+        if cover_source:
+            PROCESSED_IMAGE_CACHE.put(cache_key, cover_source.cover_id.checksum)
+            return cover_source.cover_id.with_env(self.env)
+
+        # 3. Full image pipeline
+        image = self._get_image_service_adapter(picture)
+        cover = cover_model.get_or_create(image.save_to_bytes())
+
+        cover_source_model.create({
+            'cover_id': cover.id,
+            'image_format': image_format,
+            'image_size': image_size,
+            'source_checksum': source_checksum,
+        })
+        PROCESSED_IMAGE_CACHE.put(cache_key, cover.checksum)
+
+        return cover
+
     def _process_picture_image(self, values) -> None:
-        if not 'picture' in values or not values['picture']:
+        if not 'picture' in values:
+            return
+
+        # Pictures are stored once in the shared cover store, records only keep a reference
+        picture = values.pop('picture')
+
+        if not picture:
+            values['cover_id'] = False
             return
 
         try:
-            image = self._get_image_service_adapter(values['picture'])
-            values['picture'] = image.save_to_bytes()
+            values['cover_id'] = self._get_processed_cover(picture).id
 
         except InvalidImageFormatError as format_error:
             _logger.error(f"Image has an invalid format or file is corrupt: {format_error}.")
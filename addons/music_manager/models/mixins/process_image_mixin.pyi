@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, Final, Self
+from typing import Any, Dict, Final, Self, Tuple
 
 from ...adapters import ImageServiceAdapter
+from ..cover import Cover
 from ...utils.custom_types import CustomWarningMessage
+from ...utils.lru_cache import LRUCache
+
+
+PROCESSED_IMAGE_CACHE: LRUCache
 
 
 class ProcessImageMixin:
@@ -20,16 +25,38 @@ class ProcessImageMixin:
         :return: Warning Message (dict) | None
         """
 
+    def _compute_picture(self: Self) -> None:
+        """Reads the picture from the shared cover referenced by the record.
+        :return: None
+        """
+
+    def _inverse_picture(self: Self) -> None:
+        """Processes the assigned picture and links the record to the matching shared cover.
+        :return: None
+        """
+
     def _get_image_service_adapter(self: Self, image: str) -> ImageServiceAdapter:
         """Ensure image service adapter has its settings updated
         :param image: Image bytes in string format
         :return: ImageServiceAdapter with updated settings
         """
 
+    def _get_image_settings(self: Self) -> Tuple[str, str]:
+        """Reads the image format & size from audio settings.
+        :return: Image format & image size
+        """
+
+    def _get_processed_cover(self: Self, picture: str | bytes) -> Cover:
+        """Returns the shared cover for the given source image. Looks first into the in-memory LRU cache, then into
+        the persistent source index and, only if both miss, runs the image pipeline and remembers the result.
+        :param picture: Source image encoded in base64
+        :return: Cover record
+        """
+
     @staticmethod
     def _process_picture_image(values: Dict[str, Any]) -> None:
         """Ensure value 'picture' is in given dictionary. Then process the image with default values (400x400)
-        and assign the result to the given dictionary.
+        and replaces it with the 'cover_id' of the shared cover holding the result.
         :param values: Dictionary with vals to write
         :return: None
         """
@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
 import logging
+import time
 import traceback
+import uuid
+from contextlib import contextmanager
 from datetime import timedelta
 
+from psycopg2.errors import UniqueViolation
+
 # noinspection PyProtectedMember
 from odoo import _, api
 from odoo.models import Model
 from odoo.fields import Char, Datetime, Many2one, Selection, Text
 
-from ..adapters.file_service_adapter import FileServiceAdapter
-from ..adapters.track_service_adapter import TrackServiceAdapter
-from ..utils.data_encoding import base64_encode_in_bytes
-from ..utils.file_utils import get_years_list
+from ..adapters.track_extraction_adapter import TrackExtractionAdapter
+from ..utils.file_utils import get_name_key, get_years_list
 
 
 _logger = logging.getLogger(__name__)
@@ -28,28 +31,40 @@ class MusicImportQueue(Model):
         string=_("State"),
         selection=[
             ('pending', _("Pending")),
+            ('processing', _("Processing")),
             ('processed', _("Processed")),
             ('error', _("Error")),
         ],
-        default='pending'
+        default='pending',
+        index=True,
     )
 
     # Techincal fields
+    claim_token = Char(string=_("Claim token"), copy=False, readonly=True)
     custom_owner_id = Many2one(
         comodel_name='res.users', string="Owner", default=lambda self: self.env.user, required=True
     )
+    lease_expires_at = Datetime(string=_("Lease expiration"), copy=False, readonly=True)
 
-    def create_track_from_scan(self, file_path, data) -> None:
+    def create_track_from_scan(self, file_path, data, resolver=None) -> None:
         track_model = self.env['music_manager.track']
 
+        if resolver is None:
+            resolver = ImportNameResolver(self.env)
+            resolver.preload([data])
+
+        # ⬇️ HERE creates a new TRACK record ⬇️
+        track_model.create(self._prepare_track_vals(file_path, data, resolver))
+
+    def _prepare_track_vals(self, file_path, data, resolver):
         found_year = self._match_track_year(data.get('tmp_year', ""))
-        album_artist_id = self._match_artist_id(data.get('tmp_album_artist', "Unknown"))
-        album_id = self._match_album_id(data.get('tmp_album', "Unknown"), album_artist_id)
-        genre_id = self._match_genre_id(data.get('tmp_genre', "Unknown"))
-        original_artist_id = self._match_artist_id(data.get('tmp_original_artist', "Unknown"))
-        artist_ids = self._match_various_artists_ids(data.get('tmp_artists', "Unknown"))
+        album_artist_id = resolver.get_artist_id(data.get('tmp_album_artist', "Unknown"))
+        album_id = resolver.get_album_id(data.get('tmp_album', "Unknown"), album_artist_id)
+        genre_id = resolver.get_genre_id(data.get('tmp_genre', "Unknown"))
+        original_artist_id = resolver.get_artist_id(data.get('tmp_original_artist', "Unknown"))
+        artist_ids = resolver.get_artist_ids(data.get('tmp_artists', "Unknown"))
 
-        track_vals = {
+        return {
             'disk_no': data.get('tmp_disk_no', 1),
             'name': data.get('tmp_name', "Unknown"),
             'picture': data.get('picture', False),
@@ -63,11 +78,11 @@ class MusicImportQueue(Model):
             'duration': data.get('duration', 0),
             'mime_type': data.get('mime_type', "Unknown"),
             'sample_rate': data.get('sample_rate', 0),
-            'album_artist_id': album_artist_id.id,
-            'album_id': album_id.id,
-            'genre_id': genre_id.id,
-            'original_artist_id': original_artist_id.id,
-            'track_artist_ids': getattr(artist_ids, 'ids', []),
+            'album_artist_id': album_artist_id,
+            'album_id': album_id,
+            'genre_id': genre_id,
+            'original_artist_id': original_artist_id,
+            'track_artist_ids': artist_ids,
             'compilation': data.get('tmp_compilation', False),
             'file_path': file_path,
             'old_path': file_path,
@@ -75,9 +90,6 @@ class MusicImportQueue(Model):
             'custom_owner_id': self.custom_owner_id.id,
         }
 
-        # ⬇️ HERE creates a new TRACK record ⬇️
-        track_model.create(track_vals)
-
     @api.model
     def _cron_garbage_collector(self) -> None:
         limit = Datetime.now() - timedelta(hours=24)
@@ -88,87 +100,199 @@ class MusicImportQueue(Model):
             records_to_delete.unlink()
 
     @api.model
-    def _cron_process_music_queue(self) -> None:
-        pending_count = self.search_count([('state', '=', 'pending')])
+    def _cron_process_music_queue(self, worker_name='main') -> None:
+        settings = self.env['music_manager.audio_settings'].get_settings()
+
+        deadline = time.monotonic() + settings.import_time_budget
+        checkpoint = self._resume_import_checkpoint(worker_name)
+        imported_count = 0
+
+        # Tags are parsed in parallel; every ORM write stays in this cursor
+        with TrackExtractionAdapter(
+            settings.sound_format, settings.import_workers, settings.import_chunk_size
+        ) as extraction_adapter:
+            while time.monotonic() < deadline:
+                claim_token = uuid.uuid4().hex
+                files = self._claim_pending_files(
+                    settings.import_batch_size, settings.import_lease_duration, claim_token
+                )
 
-        if pending_count == 0:
-            return
+                if not files:
+                    break
 
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+                checkpoint.claim_token = claim_token
 
-        root = settings.root_dir if settings else '/music'
-        file_extension = settings.sound_format if settings else 'mp3'
+                # Publishes the claim & releases row locks before the slow work starts
+                self.env.cr.commit()
 
-        files = self.search([('state', '=', 'pending')], limit=50)
+                # Parallel workers would fight over the same stats rows: they are refreshed once the run ends
+                failed_count = files.with_context(defer_library_stats=True)._import_claimed_files(
+                    extraction_adapter, settings
+                )
+                imported_count += len(files) - failed_count
 
-        file_service = FileServiceAdapter(root, file_extension)
-        track_service = TrackServiceAdapter(file_extension)
+                checkpoint.write({
+                    'claim_token': False,
+                    'processed_count': checkpoint.processed_count + len(files) - failed_count,
+                    'failed_count': checkpoint.failed_count + failed_count,
+                })
+                self.env.cr.commit()
 
-        for music_file in files:
-            try:
-                file_bytes = file_service.read_file(music_file.file_path)
-                track_data = track_service.read_audio_info(base64_encode_in_bytes(file_bytes))
+        if imported_count:
+            self.env.ref('music_manager.ir_cron_music_library_stats').sudo()._trigger()
 
-                music_file.create_track_from_scan(music_file.file_path, track_data)
-                music_file.state = 'processed'
+        if self.search_count([('state', '=', 'pending')], limit=1):
+            _logger.info(f"Import worker '{worker_name}': time budget spent, rescheduling to continue right away.")
+            self.env.ref('music_manager.ir_cron_music_import_queue').sudo()._trigger()
+            return
 
-            except Exception as unknown_error:
-                traceback_error = traceback.format_exc()
-                _logger.error(traceback_error)
+        if self.search_count([('state', '=', 'processing')], limit=1):
+            return
 
-                self.env.cr.rollback()
-                music_file.write({
-                    'state': 'error',
-                    'error_message': _("Message: %s", str(unknown_error))
-                })
+        if checkpoint.processed_count or checkpoint.failed_count:
+            error_count = self.search_count([('state', '=', 'error')])
+            self._notify_user(error_count)
 
-            finally:
-                self.env.cr.commit()
+        # Queue drained: next run starts its counters from scratch
+        checkpoint.unlink()
 
-        remaining = self.search_count([('state', '=', 'pending')], limit=1)
+    @api.model
+    def _claim_pending_files(self, limit, lease_duration, claim_token):
+        # Rows locked by other workers are skipped; expired leases belong to crashed workers and are reclaimed
+        self.env.cr.execute(
+            f"""
+            UPDATE {self._table}
+            SET state = 'processing',
+                claim_token = %s,
+                lease_expires_at = (NOW() AT TIME ZONE 'UTC') + %s * INTERVAL '1 second',
+                write_date = NOW() AT TIME ZONE 'UTC'
+            WHERE id IN (
+                SELECT id
+                FROM {self._table}
+                WHERE state = 'pending'
+                   OR (state = 'processing' AND lease_expires_at < (NOW() AT TIME ZONE 'UTC'))
+                ORDER BY id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING id
+            """,
+            (claim_token, lease_duration, limit)
+        )
+        claimed_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        self.invalidate_model(['state', 'claim_token', 'lease_expires_at', 'write_date'])
+
+        return self.browse(claimed_ids)
+
+    def _import_claimed_files(self, extraction_adapter, settings) -> int:
+        commit_size = settings.import_commit_size
+        commit_interval = settings.import_commit_interval
+
+        started_at = time.monotonic()
+        failed_count = 0
+
+        extracted_files = extraction_adapter.extract_all(self.mapped('file_path'))
+        scanned_files = []
+
+        for music_file, result in zip(self, extracted_files):
+            if result['error']:
+                # noinspection PyProtectedMember
+                music_file._set_error_state(result['error'], result['traceback'])
+                failed_count += 1
+                continue
 
-        if remaining == 0:
-            error_count = self.search_count([('state', '=', 'error')])
-            self._notify_user(error_count)
+            scanned_files.append((music_file, result['track_data']))
+
+        # Resolve every artist, album & genre name of the batch at once
+        resolver = ImportNameResolver(self.env)
+        resolver.preload([track_data for _music_file, track_data in scanned_files])
 
-    def _match_album_id(self, album_name, album_artist):
-        album_model = self.env['music_manager.album']
-        target_album = album_model.search([('name', '=', album_name), ('album_artist_id', '=', album_artist.id)], limit=1)
+        group_size = commit_size
+        position = 0
 
-        if not target_album:
-            target_album = album_model.create({'name': album_name, 'album_artist_id': album_artist.id})
+        while position < len(scanned_files):
+            scanned_group = scanned_files[position:position + group_size]
+            group_started_at = time.monotonic()
 
-        return target_album
+            failed_count += self._create_scanned_tracks(scanned_group, resolver)
+            self.env.cr.commit()
+            position += len(scanned_group)
 
-    def _match_artist_id(self, artist_name):
-        artist_model = self.env['music_manager.artist']
-        target_artist = artist_model.search([('name', '=', artist_name)], limit=1)
+            # Covers & bulk creates take variable time: slow groups shrink so commits stay within the interval
+            group_time = time.monotonic() - group_started_at
 
-        if not target_artist:
-            target_artist = artist_model.create({'name': artist_name})
+            if group_time > 0:
+                group_size = max(1, min(commit_size, int(len(scanned_group) * commit_interval / group_time)))
 
-        return target_artist
+        # Timing is logged as is, so the commit settings can be tuned against a real library
+        elapsed_time = max(time.monotonic() - started_at, 0.001)
+        _logger.info(
+            f"Import batch: {len(self)} files in {elapsed_time:.2f}s ({len(self) / elapsed_time:.1f} files/s). "
+            f"Name resolver: {resolver.hits} lookups served from cache, {resolver.misses} resolved against database."
+        )
 
-    def _match_various_artists_ids(self, artist_names):
-        artist_model = self.env['music_manager.artist']
+        return failed_count
 
-        names = [name.strip() for name in artist_names.split(",")]
-        artist_ids = []
+    def _create_scanned_tracks(self, scanned_files, resolver) -> int:
+        processed_vals = {'state': 'processed', 'claim_token': False, 'lease_expires_at': False}
+        track_model = self.env['music_manager.track']
 
-        for name in names:
-            target_artist = self._match_artist_id(name)
-            artist_ids.append(target_artist.id)
+        try:
+            # Whole group at once: album sync & album recomputes run once per album, not once per track
+            with resolver.savepoint():
+                track_model.create([
+                    music_file._prepare_track_vals(music_file.file_path, track_data, resolver)
+                    for music_file, track_data in scanned_files
+                ])
+                self.browse([music_file.id for music_file, _track_data in scanned_files]).write(processed_vals)
 
-        return artist_model.browse(artist_ids)
+            return 0
 
-    def _match_genre_id(self, genre_name):
-        genre_model = self.env['music_manager.genre']
-        target_model = genre_model.search([('name', '=', genre_name)], limit=1)
+        except Exception as bulk_error:
+            _logger.warning(f"Bulk import of {len(scanned_files)} files failed, retrying one by one: {bulk_error}")
 
-        if not target_model:
-            target_model = genre_model.create({'name': genre_name})
+        failed_count = 0
 
-        return target_model
+        for music_file, track_data in scanned_files:
+            try:
+                # A failing file only rolls back its own savepoint, not the previous ones
+                with resolver.savepoint():
+                    music_file.create_track_from_scan(music_file.file_path, track_data, resolver)
+                    music_file.write(processed_vals)
+
+            except Exception as unknown_error:
+                # noinspection PyProtectedMember
+                music_file._set_error_state(str(unknown_error), traceback.format_exc())
+                failed_count += 1
+
+        return failed_count
+
+    @api.model
+    def _resume_import_checkpoint(self, worker_name):
+        checkpoint = self.env['music_manager.import_checkpoint'].get_checkpoint(worker_name)
+
+        if not checkpoint.claim_token:
+            return checkpoint
+
+        # The previous run of this worker was killed mid-batch: its uncommitted files go back to the queue
+        self.env.cr.execute(
+            f"""
+            UPDATE {self._table}
+            SET state = 'pending', claim_token = NULL, lease_expires_at = NULL
+            WHERE state = 'processing' AND claim_token = %s
+            """,
+            (checkpoint.claim_token,)
+        )
+        _logger.warning(
+            f"Import worker '{worker_name}': resuming interrupted run, {self.env.cr.rowcount} files released "
+            f"({checkpoint.processed_count} processed so far)."
+        )
+
+        self.invalidate_model(['state', 'claim_token', 'lease_expires_at'])
+        checkpoint.claim_token = False
+
+        return checkpoint
 
     def _notify_user(self, error_count=0) -> None:
         user_id = self.env.user.id
@@ -201,6 +325,16 @@ class MusicImportQueue(Model):
 
         self.env.cr.postcommit.add(send_notification)
 
+    def _set_error_state(self, error_message, traceback_error) -> None:
+        _logger.error(traceback_error)
+
+        self.write({
+            'state': 'error',
+            'error_message': _("Message: %s", error_message),
+            'claim_token': False,
+            'lease_expires_at': False,
+        })
+
     @staticmethod
     def _match_track_year(year: str):
         allowed_years = [year[0] for year in get_years_list()]
@@ -209,3 +343,186 @@ class MusicImportQueue(Model):
             year = str(year)
 
         return year if year in allowed_years else ""
+
+
+class ImportNameResolver:
+
+    def __init__(self, env) -> None:
+        self.env = env
+        self.hits = 0
+        self.misses = 0
+
+        # Ids by name key, so every spelling of a name resolves to the same record
+        self._artist_ids = {}
+        self._album_ids = {}
+        self._genre_ids = {}
+
+        # Every (cache, key) pair filled with a new record, so a rolled back savepoint can forget them
+        self._created_keys = []
+
+    def preload(self, batch_data) -> None:
+        artist_names = set()
+        genre_names = set()
+
+        for data in batch_data:
+            artist_names.add(data.get('tmp_album_artist', "Unknown"))
+            artist_names.add(data.get('tmp_original_artist', "Unknown"))
+            artist_names.update(self._split_artist_names(data.get('tmp_artists', "Unknown")))
+            genre_names.add(data.get('tmp_genre', "Unknown"))
+
+        self._preload_names('music_manager.artist', artist_names, self._artist_ids)
+        self._preload_names('music_manager.genre', genre_names, self._genre_ids)
+
+        album_names = {}
+
+        for data in batch_data:
+            album_name = data.get('tmp_album', "Unknown")
+            album_artist_id = self._artist_ids[get_name_key(data.get('tmp_album_artist', "Unknown"))]
+            album_names.setdefault((get_name_key(album_name), album_artist_id), album_name)
+
+        self._preload_albums(album_names)
+
+    def get_album_id(self, album_name, album_artist_id) -> int:
+        key = (get_name_key(album_name), album_artist_id)
+
+        if key not in self._album_ids:
+            self.misses += 1
+            self._preload_albums({key: album_name})
+
+        else:
+            self.hits += 1
+
+        return self._album_ids[key]
+
+    def get_artist_id(self, artist_name) -> int:
+        return self._get_name_id('music_manager.artist', artist_name, self._artist_ids)
+
+    def get_artist_ids(self, artist_names) -> list[int]:
+        return [self.get_artist_id(name) for name in self._split_artist_names(artist_names)]
+
+    def get_genre_id(self, genre_name) -> int:
+        return self._get_name_id('music_manager.genre', genre_name, self._genre_ids)
+
+    @contextmanager
+    def savepoint(self):
+        created_count = len(self._created_keys)
+
+        try:
+            with self.env.cr.savepoint():
+                yield
+
+        except Exception:
+            # Records created inside the rolled back savepoint do not exist anymore
+            for cache, key in self._created_keys[created_count:]:
+                cache.pop(key, None)
+
+            del self._created_keys[created_count:]
+            raise
+
+    def _get_name_id(self, model_name, name, cache) -> int:
+        name_key = get_name_key(name)
+
+        if name_key not in cache:
+            self.misses += 1
+            self._preload_names(model_name, {name}, cache)
+
+        else:
+            self.hits += 1
+
+        return cache[name_key]
+
+    def _preload_albums(self, album_names) -> None:
+        missing_keys = album_names.keys() - self._album_ids.keys()
+
+        if not missing_keys:
+            return
+
+        self._album_ids.update(self._find_album_ids(missing_keys))
+        # Sorted, so workers creating the same names lock them in the same order
+        keys_to_create = sorted(key for key in missing_keys if key not in self._album_ids)
+
+        if keys_to_create:
+            new_ids = self._create_missing(
+                'music_manager.album',
+                {key: {'name': album_names[key], 'album_artist_id': key[1]} for key in keys_to_create},
+                self._find_album_ids,
+            )
+            self._album_ids.update(new_ids)
+            self._created_keys.extend((self._album_ids, key) for key in new_ids)
+
+    def _preload_names(self, model_name, names, cache) -> None:
+        names_by_key = {}
+
+        # New records keep the first spelling found for their key
+        for name in sorted(names):
+            names_by_key.setdefault(get_name_key(name), name)
+
+        missing_keys = names_by_key.keys() - cache.keys()
+
+        if not missing_keys:
+            return
+
+        cache.update(self._find_name_ids(model_name, missing_keys))
+        keys_to_create = sorted(name_key for name_key in missing_keys if name_key not in cache)
+
+        if keys_to_create:
+            new_ids = self._create_missing(
+                model_name,
+                {name_key: {'name': names_by_key[name_key]} for name_key in keys_to_create},
+                lambda name_keys: self._find_name_ids(model_name, name_keys),
+            )
+            cache.update(new_ids)
+            self._created_keys.extend((cache, name_key) for name_key in new_ids)
+
+    def _create_missing(self, model_name, vals_by_key, find_ids) -> dict:
+        target_model = self.env[model_name]
+
+        # Another import worker may create the same names meanwhile: the unique name key makes the slower one fail
+        try:
+            with self.env.cr.savepoint():
+                new_records = target_model.create(list(vals_by_key.values()))
+
+            return dict(zip(vals_by_key, new_records.ids))
+
+        except UniqueViolation:
+            _logger.info(f"Some '{model_name}' names were created by another worker, resolving them one by one.")
+
+        record_ids = {}
+
+        for key, vals in vals_by_key.items():
+            try:
+                with self.env.cr.savepoint():
+                    record_ids[key] = target_model.create(vals).id
+
+            except UniqueViolation:
+                record_ids.update(find_ids([key]))
+
+        return record_ids
+
+    def _find_album_ids(self, keys) -> dict:
+        existing_albums = self.env['music_manager.album'].search_read(
+            [
+                ('name_key', 'in', list({name_key for name_key, _artist_id in keys})),
+                ('album_artist_id', 'in', list({artist_id for _name_key, artist_id in keys})),
+            ],
+            ['name_key', 'album_artist_id']
+        )
+        album_ids = {}
+
+        for album in existing_albums:
+            key = (album['name_key'], album['album_artist_id'][0] if album['album_artist_id'] else False)
+
+            if key in keys:
+                album_ids.setdefault(key, album['id'])
+
+        return album_ids
+
+    def _find_name_ids(self, model_name, name_keys) -> dict:
+        return {
+            record['name_key']: record['id']
+            for record in self.env[model_name].search_read([('name_key', 'in', list(name_keys))], ['name_key'])
+        }
+
+    @staticmethod
+    def _split_artist_names(artist_names) -> list[str]:
+        return [name.strip() for name in artist_names.split(",")]
@@ -1,9 +1,11 @@
-from collections.abc import Sequence
-from typing import Dict, Final, Literal, Self
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, Final, Iterable, List, Literal, Self, Tuple
 
-from .album import Album
-from .artist import Artist
-from .genre import Genre
+from odoo.api import Environment
+
+from .import_checkpoint import ImportCheckpoint
+from ..adapters.track_extraction_adapter import TrackExtractionAdapter
+from ..utils.settings_data import AudioSettingsData
 
 
 class MusicImportQueue:
@@ -18,48 +20,74 @@ class MusicImportQueue:
     # Custom fields
     error_message: str | Literal[False]
     file_path: str | Literal[False]
-    state: Literal['pending', 'processed', 'error'] | Literal[False]
+    state: Literal['pending', 'processing', 'processed', 'error'] | Literal[False]
+
+    claim_token: str | Literal[False]
+    lease_expires_at: datetime | Literal[False]
 
-    def create_track_from_scan(self: Self, file_path: str, data: Dict[str, str | bytes | int | bool | None]) -> None:
+    def create_track_from_scan(
+            self: Self,
+            file_path: str,
+            data: Dict[str, str | bytes | int | bool | None],
+            resolver: ImportNameResolver | None = None
+    ) -> None:
         """Creates new record automatically according to metadata found in file_path.
         :param file_path: Actual file path found when main folder was scanned
         :param data: Data dictionary according to metadata found
+        :param resolver: Name resolver already preloaded with the batch names. A new one is created if not given
         :return: None
         """
 
+    def _prepare_track_vals(self: Self, file_path: str, data: Dict[str, Any], resolver: ImportNameResolver) -> Dict[str, Any]:
+        """Builds the values of a new track from the extracted file data.
+        :param file_path: Path of the audio file
+        :param data: Extracted metadata
+        :param resolver: Cache of artist, album & genre IDs
+        :return: Track values
+        """
+
     def _cron_garbage_collector(self: Self) -> None:
         """Delete records which write date is over than 24h.
         :return: None
         """
 
-    def _cron_process_music_queue(self: Self) -> None:
-        """Each 2 minutes create 50 new records into the system.
+    def _cron_process_music_queue(self: Self, worker_name: str = ...) -> None:
+        """Claims & imports queued files batch after batch until the time budget is spent. Progress is checkpointed
+        after every batch so a killed run can be resumed, and the cron triggers itself again while files are pending.
+        Library stats are not refreshed per batch: the stats cron is triggered once the run imported any file.
+        :param worker_name: Name of the worker, used to keep a checkpoint per worker
         :return: None
         """
 
-    def _match_album_id(self: Self, album_name: str, album_artist: Artist) -> Album:
-        """Matches album ID with given temporary album name & artist ID.
-        :param album_name: Album name found in metadata
-        :param album_artist: Artist object to interact with
-        :return: An album object
+    def _claim_pending_files(self: Self, limit: int, lease_duration: int, claim_token: str) -> Self:
+        """Claims pending files (or files whose lease expired) with 'FOR UPDATE SKIP LOCKED', so several workers can
+        drain the queue without processing the same file twice. The caller must commit the claim.
+        :param limit: Maximum amount of files to claim
+        :param lease_duration: Seconds before a claimed file can be reclaimed by another worker
+        :param claim_token: Token that identifies this claim
+        :return: Claimed queue records
         """
 
-    def _match_artist_id(self: Self, artist_name: str) -> Artist:
-        """Matches album artist ID with given temporary album artist name.
-        :param artist_name: Artist name found in metadata
-        :return: An artist object
+    def _import_claimed_files(self: Self, extraction_adapter: TrackExtractionAdapter, settings: AudioSettingsData) -> int:
+        """Extracts the metadata of the claimed files and creates their tracks, committing in small groups. Groups
+        shrink when they take longer than the commit interval.
+        :param extraction_adapter: Adapter used to parse the audio files
+        :param settings: Audio settings snapshot
+        :return: Amount of files that failed
         """
 
-    def _match_genre_id(self: Self, genre_name: str) -> Genre:
-        """Matches genre ID with given temporary genre name.
-        :param genre_name: Genre name found in metadata
-        :return: A genre object
+    def _create_scanned_tracks(self: Self, scanned_files: List[Tuple[Self, Dict[str, Any]]], resolver: ImportNameResolver) -> int:
+        """Creates the tracks of a group of files with a single 'create' call. If it fails, files are imported one by
+        one so only the broken ones end in error.
+        :param scanned_files: Queue records with their extracted metadata
+        :param resolver: Cache of artist, album & genre IDs
+        :return: Amount of files that failed
         """
 
-    def _match_various_artists_ids(self: Self, artist_names: str) -> Sequence[Artist]:
-        """Matches all track artists IDs with given temporary track artist names separated with commas.
-        :param artist_names: Artist names found in metadata separated with commas.
-        :return: A sequence of artists objects
+    def _resume_import_checkpoint(self: Self, worker_name: str) -> ImportCheckpoint:
+        """Loads the worker checkpoint. If the previous run died mid-batch, its unfinished files go back to pending.
+        :param worker_name: Name of the worker
+        :return: Checkpoint record
         """
 
     def _notify_user(self: Self, error_count: int = 0) -> None:
@@ -68,7 +96,118 @@ class MusicImportQueue:
         :return: None
         """
 
+    def _set_error_state(self: Self, error_message: str, traceback_error: str) -> None:
+        """Marks the queue record as failed with the given error. The failed work must already be rolled back.
+        :param error_message: Error description
+        :param traceback_error: Formatted traceback to log
+        :return: None
+        """
+
     def _match_track_year(self: Self, year: str) -> str:
         """Matches the year found in metadata according to years' list.
         :return: Year in string format as "YYYY" | Empty string if no year found
         """
+
+
+class ImportNameResolver:
+    """
+    Resolves artist, album & genre names into record IDs for a whole import batch.
+    Names are preloaded with one search per model and missing records are created with a single 'create' call.
+    Names are matched by their normalized key, so 'Beyoncé' & 'beyonce ' resolve to the same artist.
+    """
+
+    env: Environment
+    hits: int
+    misses: int
+
+    def preload(self: Self, batch_data: Iterable[Dict[str, Any]]) -> None:
+        """Searches or creates every artist, album & genre found in the given batch and keeps their IDs in memory.
+        :param batch_data: Data dictionaries according to metadata found
+        :return: None
+        """
+
+    def get_album_id(self: Self, album_name: str, album_artist_id: int) -> int:
+        """Matches album ID with given album name & artist ID.
+        :param album_name: Album name found in metadata
+        :param album_artist_id: Album artist ID
+        :return: Album ID
+        """
+
+    def get_artist_id(self: Self, artist_name: str) -> int:
+        """Matches artist ID with given artist name.
+        :param artist_name: Artist name found in metadata
+        :return: Artist ID
+        """
+
+    def get_artist_ids(self: Self, artist_names: str) -> list[int]:
+        """Matches all track artists IDs with given artist names separated with commas.
+        :param artist_names: Artist names found in metadata separated with commas
+        :return: Artist IDs list
+        """
+
+    def get_genre_id(self: Self, genre_name: str) -> int:
+        """Matches genre ID with given genre name.
+        :param genre_name: Genre name found in metadata
+        :return: Genre ID
+        """
+
+    def savepoint(self: Self) -> ContextManager[None]:
+        """Runs the block inside a database savepoint. If the block fails, names created inside it are dropped from
+        the cache too, so later files do not point to rolled back records.
+        :return: Savepoint context
+        """
+
+    def _get_name_id(self: Self, model_name: str, name: str, cache: Dict[str, int]) -> int:
+        """Returns the cached ID for a given name. Counts a hit if it was preloaded, otherwise resolves it.
+        :param model_name: Model to search into
+        :param name: Record name
+        :param cache: Name key dictionary of the model
+        :return: Record ID
+        """
+
+    def _create_missing(
+            self: Self,
+            model_name: str,
+            vals_by_key: Dict[Any, Dict[str, Any]],
+            find_ids: Callable[[Iterable[Any]], Dict[Any, int]]
+    ) -> Dict[Any, int]:
+        """Creates the missing records at once. If another worker created some of them meanwhile, the unique name key
+        rejects the group and records are created one by one, reading back the ones that already exist.
+        :param model_name: Model to create into
+        :param vals_by_key: Values of the new records by their key
+        :param find_ids: Function that searches existing record IDs by key
+        :return: Record IDs by key
+        """
+
+    def _find_album_ids(self: Self, keys: Iterable[tuple[str, int]]) -> Dict[tuple[str, int], int]:
+        """Searches existing albums by name key & artist ID.
+        :param keys: (album name key, album artist ID) pairs
+        :return: Album IDs by key
+        """
+
+    def _find_name_ids(self: Self, model_name: str, name_keys: Iterable[str]) -> Dict[str, int]:
+        """Searches existing records by name key.
+        :param model_name: Model to search into
+        :param name_keys: Name keys to search
+        :return: Record IDs by name key
+        """
+
+    def _preload_albums(self: Self, album_names: Dict[tuple[str, int], str]) -> None:
+        """Searches albums by name key & artist ID and creates the missing ones at once.
+        :param album_names: Album names by (album name key, album artist ID) pairs
+        :return: None
+        """
+
+    def _preload_names(self: Self, model_name: str, names: set[str], cache: Dict[str, int]) -> None:
+        """Searches records by name key and creates the missing ones at once.
+        :param model_name: Model to search into
+        :param names: Names to resolve
+        :param cache: Name key dictionary of the model
+        :return: None
+        """
+
+    def _split_artist_names(self: Self, artist_names: str) -> list[str]:
+        """Splits artist names separated with commas.
+        :param artist_names: Artist names found in metadata
+        :return: Artist names list
+        """
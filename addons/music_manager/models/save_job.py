@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.exceptions import UserError
+from odoo.models import Model
+from odoo.fields import Char, Integer, Many2many, Many2one, Selection, Text
+
+from ..adapters.track_save_adapter import TrackSaveAdapter
+from ..utils.exceptions import MusicManagerError
+
+
+_logger = logging.getLogger(__name__)
+
+
+class SaveJob(Model):
+    _name = 'music_manager.save_job'
+    _description = 'save_job_table'
+    _order = 'create_date desc, id desc'
+
+    # Basic fields
+    name = Char(string=_("Name"), required=True, readonly=True)
+    messages = Text(string=_("Messages"), readonly=True)
+    state = Selection(
+        string=_("State"),
+        selection=[
+            ('pending', _("Pending")),
+            ('running', _("Running")),
+            ('done', _("Done")),
+        ],
+        default='pending',
+        index=True,
+        readonly=True,
+    )
+
+    # Relational fields
+    track_ids = Many2many(
+        comodel_name='music_manager.track',
+        relation='music_manager_save_job_track_rel',
+        column1='job_id',
+        column2='track_id',
+        string=_("Pending tracks"),
+        readonly=True,
+    )
+    user_id = Many2one(
+        comodel_name='res.users', string=_("Requested by"), default=lambda self: self.env.user, readonly=True
+    )
+
+    # Techincal fields
+    failed_count = Integer(string=_("Failed"), default=0, readonly=True)
+    processed_count = Integer(string=_("Processed"), default=0, readonly=True)
+    total_count = Integer(string=_("Total"), default=0, readonly=True)
+
+    @api.model
+    def enqueue(self, tracks, name):
+        job = self.sudo().create({
+            'name': name,
+            'track_ids': [(6, 0, tracks.ids)],
+            'total_count': len(tracks),
+            'user_id': self.env.user.id,
+        })
+
+        self.env.ref('music_manager.ir_cron_music_save_jobs').sudo()._trigger()
+
+        return job
+
+    @api.model
+    def _cron_process_save_jobs(self) -> None:
+        settings = self.env['music_manager.audio_settings'].get_settings()
+        settings_model = self.env['music_manager.audio_settings']
+
+        deadline = time.monotonic() + settings.import_time_budget
+
+        # Saves interrupted by a crash are settled before new files are touched
+        # noinspection PyProtectedMember
+        self.env['music_manager.save_journal']._replay_pending_entries()
+        self.env.cr.commit()
+
+        jobs = self.search([('state', 'in', ['pending', 'running'])], order='id')
+
+        # Tags & moves are written by threads; every ORM write stays in this cursor
+        with TrackSaveAdapter(
+            settings_model.get_track_service_adapter(), settings_model.get_file_service_adapter(), settings.save_workers
+        ) as save_adapter:
+            for job in jobs:
+                if time.monotonic() >= deadline:
+                    break
+
+                job.state = 'running'
+                self.env.cr.commit()
+
+                while job.track_ids and time.monotonic() < deadline:
+                    job._process_chunk(save_adapter, settings.save_chunk_size)
+                    self.env.cr.commit()
+
+                if not job.track_ids:
+                    job.state = 'done'
+                    job._notify_user()
+                    self.env.cr.commit()
+
+        if self.search_count([('state', 'in', ['pending', 'running'])], limit=1):
+            _logger.info("Save jobs: time budget spent, rescheduling to continue right away.")
+            self.env.ref('music_manager.ir_cron_music_save_jobs').sudo()._trigger()
+
+    def _process_chunk(self, save_adapter, chunk_size) -> None:
+        self.ensure_one()
+
+        # Tracks are read & written as the requester, so their access rules still apply
+        tracks = self.track_ids[:chunk_size].with_user(self.user_id)
+        failure_messages = []
+        success_counter = 0
+
+        try:
+            with self.env.cr.savepoint():
+                # noinspection PyProtectedMember
+                operations, failure_messages = tracks._prepare_save_changes(strict=False)
+                journal_entries = self.env['music_manager.save_journal'].open_entries(operations)
+                results = save_adapter.apply_all(operations)
+
+                # noinspection PyProtectedMember
+                success_counter, result_messages = tracks._finalize_save_changes(results)
+                failure_messages.extend(result_messages)
+                journal_entries.close_entries()
+
+        except (MusicManagerError, UserError) as save_error:
+            _logger.error(f"Save job '{self.name}': cannot update {len(tracks)} tracks: {save_error}")
+            failure_messages = [_("%s track(s) could not be updated: %s", len(tracks), str(save_error).strip())]
+            success_counter = 0
+
+        self.write({
+            'track_ids': [(3, track_id) for track_id in tracks.ids],
+            'processed_count': self.processed_count + len(tracks),
+            'failed_count': self.failed_count + len(tracks) - success_counter,
+            'messages': "\n".join(filter(None, [self.messages, *failure_messages])),
+        })
+
+        if self.track_ids:
+            self._send_progress()
+
+    def _notify_user(self) -> None:
+        self.ensure_one()
+
+        if self.failed_count:
+            message = _(
+                "'%s': %s of %s track(s) could not be updated. Check the save jobs for details.",
+                self.name, self.failed_count, self.total_count
+            )
+        else:
+            message = _("All tracks from '%s' have been updated!", self.name)
+
+        # noinspection PyProtectedMember
+        self.env['bus.bus']._sendone(
+            self.user_id.partner_id,
+            'simple_notification',
+            {
+                'title': _("Music Manager says:"),
+                'message': message,
+                'type': 'warning' if self.failed_count else 'success',
+                'sticky': True,
+            }
+        )
+
+    def _send_progress(self) -> None:
+        self.ensure_one()
+
+        # noinspection PyProtectedMember
+        self.env['bus.bus']._sendone(
+            self.user_id.partner_id,
+            'simple_notification',
+            {
+                'title': _("Music Manager says:"),
+                'message': _("'%s': %s of %s track(s) updated...", self.name, self.processed_count, self.total_count),
+                'type': 'info',
+                'sticky': False,
+            }
+        )
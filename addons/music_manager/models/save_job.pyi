@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from collections.abc import Sequence
+from typing import Final, Literal, Self
+
+from odoo.addons.base.models.res_users import Users
+from odoo.api import Environment
+
+from .track import Track
+from ..adapters import TrackSaveAdapter
+
+
+class SaveJob:
+    """
+    Represents a bulk save job into the system.
+    Keeps the tracks of an album, artist or genre that still have to be written, so a cron can update their files
+    in chunks instead of blocking the request that asked for it.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _order: Final[str]
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    name: str
+    messages: str | Literal[False]
+    state: str
+
+    track_ids: Sequence[Track]
+    user_id: Users
+
+    failed_count: int
+    processed_count: int
+    total_count: int
+
+    def enqueue(self: Self, tracks: Sequence[Track], name: str) -> Self:
+        """Creates a job with the given tracks & wakes up the bulk save cron.
+        :param tracks: Tracks to update
+        :param name: Job name shown to the user
+        :return: New save job
+        """
+
+    def _cron_process_save_jobs(self: Self) -> None:
+        """Writes pending jobs chunk by chunk until the time budget is spent, committing after each chunk.
+        :return: None
+        """
+
+    def _process_chunk(self: Self, save_adapter: TrackSaveAdapter, chunk_size: int) -> None:
+        """Updates the next tracks of the job as its requester & removes them from the pending ones.
+        :param save_adapter: Adapter writing tags & moving files
+        :param chunk_size: Tracks to update
+        :return: None
+        """
+
+    def _notify_user(self: Self) -> None:
+        """Sends a sticky notification to the requester once the job is done.
+        :return: None
+        """
+
+    def _send_progress(self: Self) -> None:
+        """Sends the current job progress to the requester.
+        :return: None
+        """
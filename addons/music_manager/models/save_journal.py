@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import logging
+from datetime import timedelta
+from pathlib import Path
+
+# noinspection PyProtectedMember
+from odoo import _, api, SUPERUSER_ID
+from odoo.models import Model
+from odoo.fields import Boolean, Char, Datetime, Many2one
+
+
+_logger = logging.getLogger(__name__)
+
+
+# Entries younger than this may still belong to a save in progress in another worker
+JOURNAL_REPLAY_DELAY = timedelta(minutes=10)
+
+
+class SaveJournal(Model):
+    _name = 'music_manager.save_journal'
+    _description = 'save_journal_table'
+    _rec_name = 'new_path'
+
+    # Basic fields
+    old_path = Char(string=_("Old path"), required=True, readonly=True)
+    new_path = Char(string=_("New path"), required=True, readonly=True)
+    writes_metadata = Boolean(string=_("Writes metadata"), default=False, readonly=True)
+
+    # Relational fields
+    track_id = Many2one(
+        comodel_name='music_manager.track', string=_("Track"), ondelete='cascade', required=True, readonly=True
+    )
+
+    def _register_hook(self) -> None:
+        super()._register_hook()
+
+        try:
+            with self.env.cr.savepoint():
+                self._replay_pending_entries()
+
+        except Exception as unknown_error:  # Never prevent the server from starting
+            _logger.error(f"Save journal: cannot replay pending entries at startup: {unknown_error}")
+
+    @api.model
+    def open_entries(self, operations):
+        values = [
+            {
+                'track_id': operation['track_id'],
+                'old_path': operation['old_path'],
+                'new_path': operation['new_path'],
+                'writes_metadata': bool(operation['metadata']),
+            }
+            for operation in operations if operation['metadata'] or operation['old_path'] != operation['new_path']
+        ]
+
+        if not values:
+            return self.browse()
+
+        # Entries are committed before any file is touched, whatever happens to the current transaction
+        with self.env.registry.cursor() as journal_cr:
+            journal_env = api.Environment(journal_cr, SUPERUSER_ID, {})
+            entry_ids = journal_env[self._name].create(values).ids
+
+        return self.browse(entry_ids)
+
+    def close_entries(self) -> None:
+        entry_ids = self.ids
+
+        if not entry_ids:
+            return
+
+        def remove_entries():
+            with self.env.registry.cursor() as close_cr:
+                close_env = api.Environment(close_cr, SUPERUSER_ID, {})
+                close_env[self._name].browse(entry_ids).exists().unlink()
+
+        # Files & database agree once the transaction is committed; a rollback leaves the entries to be replayed
+        self.env.cr.postcommit.add(remove_entries)
+
+    @api.model
+    def _replay_pending_entries(self, delay=JOURNAL_REPLAY_DELAY) -> int:
+        entries = self.sudo().search([('create_date', '<', Datetime.now() - delay)], order='id')
+
+        for entry in entries:
+            old_exists = Path(entry.old_path).is_file()
+            new_exists = Path(entry.new_path).is_file()
+            values = {}
+
+            # Tags may have been written only partly: next save rewrites the whole file
+            if entry.writes_metadata:
+                values['metadata_fingerprint'] = False
+
+            if entry.old_path != entry.new_path and new_exists and not old_exists:
+                values.update({'old_path': entry.new_path, 'file_present': True})
+
+            elif not old_exists:
+                _logger.warning(f"Save journal: file of track {entry.track_id.id} not found in '{entry.old_path}'.")
+
+            if values:
+                track = entry.track_id.with_user(entry.track_id.custom_owner_id)
+                track.with_context(skip_physical_check=True).write(values)
+
+        if entries:
+            _logger.info(f"Save journal: {len(entries)} interrupted saves replayed.")
+            entries.unlink()
+
+        return len(entries)
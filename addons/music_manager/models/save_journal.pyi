@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from typing import Final, Self
+
+from odoo.api import Environment
+
+from .track import Track
+from ..utils.custom_types import SaveOperation
+
+
+JOURNAL_REPLAY_DELAY: Final[timedelta]
+
+
+class SaveJournal:
+    """
+    Represents a pending file save into the system.
+    Every tag write or file move is recorded here, in its own transaction, before the file is touched. Entries are
+    removed once the database records the result, so the ones left behind belong to interrupted saves.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _rec_name: Final[str]
+
+    # Base model fields necessaries for context
+    id: int
+    env: Environment
+
+    # Custom fields
+    old_path: str
+    new_path: str
+    writes_metadata: bool
+
+    track_id: Track
+
+    def _register_hook(self: Self) -> None:
+        """Replays the entries left by interrupted saves when the server starts.
+        :return: None
+        """
+
+    def open_entries(self: Self, operations: list[SaveOperation]) -> Self:
+        """Records & commits the operations that will touch a file, using a separate cursor.
+        :param operations: Operations for TrackSaveAdapter
+        :return: Journal entries
+        """
+
+    def close_entries(self: Self) -> None:
+        """Removes the entries once the current transaction is committed.
+        :return: None
+        """
+
+    def _replay_pending_entries(self: Self, delay: timedelta = ...) -> int:
+        """Brings tracks of interrupted saves in line with the disk: moved files update their path & files whose
+        tags may be half-written lose their metadata fingerprint, so they are fully rewritten on next save.
+        :param delay: Minimum age of the entries to replay, so saves still in progress are not touched
+        :return: Replayed entries
+        """
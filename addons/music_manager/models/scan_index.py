@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import logging
+from collections import defaultdict
+
+# noinspection PyProtectedMember
+from odoo import _, api
+from odoo.models import Model
+from odoo.fields import Char, Integer, Selection
+from odoo.tools import split_every
+
+
+_logger = logging.getLogger(__name__)
+
+
+class ScanIndex(Model):
+    _name = 'music_manager.scan_index'
+    _description = 'scan_index_table'
+    _auto = False
+    _log_access = False
+    _rec_name = 'path'
+
+    # Basic fields
+    path = Char(string=_("Path"), readonly=True)
+    parent_path = Char(string=_("Parent path"), readonly=True)
+    entry_type = Selection(
+        string=_("Entry type"),
+        selection=[
+            ('dir', _("Directory")),
+            ('file', _("File")),
+        ],
+        readonly=True,
+    )
+    size = Integer(string=_("Size (bytes)"), readonly=True)
+    mtime_ns = Integer(string=_("Modified (ns)"), readonly=True)
+    inode = Integer(string=_("Inode"), readonly=True)
+
+    def init(self) -> None:
+        # Raw table: nanosecond timestamps & inodes do not fit into Odoo 'int4' columns
+        self.env.cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self._table} (
+                id SERIAL PRIMARY KEY,
+                path VARCHAR NOT NULL UNIQUE,
+                parent_path VARCHAR,
+                entry_type VARCHAR NOT NULL,
+                size BIGINT NOT NULL DEFAULT 0,
+                mtime_ns BIGINT NOT NULL DEFAULT 0,
+                inode BIGINT NOT NULL DEFAULT 0
+            )
+        """)
+        self.env.cr.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self._table}_parent_path_index ON {self._table} (parent_path, entry_type)
+        """)
+
+    @api.model
+    def scan_library(self, file_service, force=False):
+        # A missing root would look like an empty library & mark every track as missing
+        file_service.check_root_dir()
+        root_dir = str(file_service.root_dir)
+
+        if force:
+            self.env.cr.execute(f"DELETE FROM {self._table}")
+
+        known_dirs, known_children = self._load_directories()
+
+        changed_paths = []
+        seen_dirs = set()
+        dirs_to_visit = [(root_dir, None)]
+
+        while dirs_to_visit:
+            dir_path, parent_path = dirs_to_visit.pop()
+            fingerprint = file_service.get_fingerprint(dir_path)
+
+            if not fingerprint:
+                continue
+
+            seen_dirs.add(dir_path)
+
+            # Unchanged directory: no entry was added, removed or renamed inside it
+            if known_dirs.get(dir_path) == fingerprint.mtime_ns:
+                dirs_to_visit.extend((child, dir_path) for child in known_children[dir_path])
+                continue
+
+            subdirs, files = file_service.scan_directory(dir_path)
+            dirs_to_visit.extend((subdir, dir_path) for subdir in subdirs)
+
+            changed_paths.extend(self._sync_directory_files(dir_path, files))
+            self._upsert_entries([(dir_path, parent_path, 'dir', 0, fingerprint.mtime_ns, fingerprint.inode)])
+
+        removed_dirs = [dir_path for dir_path in known_dirs if dir_path not in seen_dirs]
+
+        if removed_dirs:
+            self._delete_directories(removed_dirs)
+
+        _logger.info(
+            f"Library scan: {len(seen_dirs)} directories checked, {len(changed_paths)} new or changed files found."
+        )
+
+        return changed_paths
+
+    @api.model
+    def has_files(self) -> bool:
+        self.env.cr.execute(f"SELECT 1 FROM {self._table} WHERE entry_type = 'file' LIMIT 1")
+        return bool(self.env.cr.fetchone())
+
+    def _delete_directories(self, dir_paths) -> None:
+        for paths in split_every(1000, dir_paths, list):
+            self.env.cr.execute(
+                f"DELETE FROM {self._table} WHERE path = ANY(%s) OR parent_path = ANY(%s)", (paths, paths)
+            )
+
+    def _load_directories(self):
+        known_dirs = {}
+        known_children = defaultdict(list)
+
+        self.env.cr.execute(f"SELECT path, parent_path, mtime_ns FROM {self._table} WHERE entry_type = 'dir'")
+
+        for path, parent_path, mtime_ns in self.env.cr.fetchall():
+            known_dirs[path] = mtime_ns
+            known_children[parent_path].append(path)
+
+        return known_dirs, known_children
+
+    def _sync_directory_files(self, dir_path, files):
+        self.env.cr.execute(
+            f"SELECT path, size, mtime_ns, inode FROM {self._table} WHERE parent_path = %s AND entry_type = 'file'",
+            (dir_path,)
+        )
+        known_files = {path: (size, mtime_ns, inode) for path, size, mtime_ns, inode in self.env.cr.fetchall()}
+
+        changed_files = [
+            file for file in files if known_files.get(file.path) != (file.size, file.mtime_ns, file.inode)
+        ]
+        current_paths = {file.path for file in files}
+        removed_paths = [path for path in known_files if path not in current_paths]
+
+        if removed_paths:
+            self.env.cr.execute(f"DELETE FROM {self._table} WHERE path = ANY(%s)", (removed_paths,))
+
+        self._upsert_entries(
+            [(file.path, dir_path, 'file', file.size, file.mtime_ns, file.inode) for file in changed_files]
+        )
+
+        return [file.path for file in changed_files]
+
+    def _upsert_entries(self, entries) -> None:
+        for rows in split_every(1000, entries, list):
+            self.env.cr.execute(
+                f"""
+                INSERT INTO {self._table} (path, parent_path, entry_type, size, mtime_ns, inode)
+                VALUES {", ".join(["%s"] * len(rows))}
+                ON CONFLICT (path) DO UPDATE SET
+                    parent_path = EXCLUDED.parent_path,
+                    entry_type = EXCLUDED.entry_type,
+                    size = EXCLUDED.size,
+                    mtime_ns = EXCLUDED.mtime_ns,
+                    inode = EXCLUDED.inode
+                """,
+                rows
+            )
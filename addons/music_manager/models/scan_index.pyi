@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+from typing import Final, Iterable, Literal, Self
+
+from ..adapters import FileServiceAdapter
+from ..utils.file_data import FileFingerprint
+
+
+ScanEntry = tuple[str, str | None, Literal['dir', 'file'], int, int, int]
+
+
+class ScanIndex:
+    """
+    Represents a ScanIndex model into the system.
+    Keeps a fingerprint (size, mtime & inode) of every directory and music file found in root folder, so library
+    rescans only read the directories that have changed.
+    """
+
+    _name: Final[str]
+    _description: str | None
+    _auto: bool
+    _log_access: bool
+
+    # Custom fields
+    path: str
+    parent_path: str | Literal[False]
+    entry_type: Literal['dir', 'file']
+    size: int
+    mtime_ns: int
+    inode: int
+
+    def init(self: Self) -> None:
+        """Creates the index table with 'bigint' columns if it does not exist yet.
+        :return: None
+        """
+
+    def scan_library(self: Self, file_service: FileServiceAdapter, force: bool = False) -> list[str]:
+        """Walks the root folder and lists only directories whose modification time changed since last scan. Raises
+        InvalidPathError when the root folder is missing.
+        :param file_service: File service adapter pointing to the root folder
+        :param force: Clears the index before scanning to read every directory again
+        :return: New or changed file paths
+        """
+
+    def has_files(self: Self) -> bool:
+        """Checks if any music file has been indexed.
+        :return: Boolean
+        """
+
+    def _delete_directories(self: Self, dir_paths: Iterable[str]) -> None:
+        """Removes given directories and their files from the index.
+        :param dir_paths: Removed directory paths
+        :return: None
+        """
+
+    def _load_directories(self: Self) -> tuple[dict[str, int], defaultdict[str | None, list[str]]]:
+        """Loads every indexed directory with its modification time and its known subdirectories.
+        :return: Directory modification times & subdirectories grouped by parent path
+        """
+
+    def _sync_directory_files(self: Self, dir_path: str, files: list[FileFingerprint]) -> list[str]:
+        """Compares the files found in a directory with the index, updates it and removes missing entries.
+        :param dir_path: Scanned directory
+        :param files: Fingerprints of the files found
+        :return: New or changed file paths
+        """
+
+    def _upsert_entries(self: Self, entries: Iterable[ScanEntry]) -> None:
+        """Inserts or updates index entries in chunks.
+        :param entries: Rows as (path, parent path, entry type, size, mtime_ns, inode)
+        :return: None
+        """
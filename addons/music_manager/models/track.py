@@ -1,22 +1,28 @@
 # -*- coding: utf-8 -*-
 import logging
+from collections import defaultdict
 from pathlib import Path
 
 # noinspection PyProtectedMember
 from odoo import _, api
 from odoo.exceptions import AccessError, UserError, ValidationError
-from odoo.fields import Binary, Boolean, Char, Integer, Many2many, Many2one, Selection
+from odoo.fields import Binary, Boolean, Char, Datetime, Integer, Many2many, Many2one, Selection
 from odoo.models import Model
 
 from .mixins.process_image_mixin import ProcessImageMixin
-from ..adapters import FileServiceAdapter, TrackServiceAdapter
-from ..utils.exceptions import FilePersistenceError, InvalidPathError, MusicManagerError
-from ..utils.file_utils import get_years_list
+from ..adapters import FileServiceAdapter, TrackSaveAdapter, TrackServiceAdapter
+from ..utils.file_utils import get_name_key, get_years_list
+from ..utils.metadata_fingerprint import dump_fingerprint, get_changed_frames, get_frame_fingerprints
 
 
 _logger = logging.getLogger(__name__)
 
 
+ALBUM_SYNC_FIELDS = {'album_artist_id', 'album_id', 'compilation', 'genre_id'}
+LIBRARY_STATS_FIELDS = {'duration', 'genre_id', 'track_artist_ids'}
+OWNER_SYNC_FIELDS = {'album_artist_id', 'album_id', 'custom_owner_id'}
+
+
 class Track(Model, ProcessImageMixin):
     _name = 'music_manager.track'
     _description = 'track_table'
@@ -30,7 +36,7 @@ class Track(Model, ProcessImageMixin):
     # Basic fields
     disk_no = Integer(string=_("Disk no"))
     name = Char(string=_("Title"), required=True)
-    picture = Binary(string=_("Picture"), attachment=True)
+    picture = Binary(string=_("Picture"), compute='_compute_picture', inverse='_inverse_picture', store=False)
     total_disk = Integer(string=_("Total disk no"))
     total_track = Integer(string=_("Total track no"))
     track_no = Integer(string=_("Track no"), required=True)
@@ -47,6 +53,7 @@ class Track(Model, ProcessImageMixin):
     # Relational fields
     album_artist_id = Many2one(comodel_name='music_manager.artist', string=_("Album artist"), copy=False, required=True)
     album_id = Many2one(comodel_name='music_manager.album', string=_("Album"), ondelete='cascade', required=True)
+    cover_id = Many2one(comodel_name='music_manager.cover', string=_("Cover"), ondelete='restrict', index=True)
     genre_id = Many2one(comodel_name='music_manager.genre', string=_("Genre"))
     original_artist_id = Many2one(comodel_name='music_manager.artist', string=_("Original artist"))
     track_artist_ids = Many2many(comodel_name='music_manager.artist', string=_("Track artist(s)"))
@@ -73,36 +80,48 @@ class Track(Model, ProcessImageMixin):
     album_artist = Char(string="Album artist name", related='album_artist_id.name', store=True)
 
     # Technical fields
+    file_checked_at = Datetime(string=_("File checked at"), copy=False, readonly=True)
+    file_present = Boolean(string=_("File present"), default=True, copy=False, index=True, readonly=True)
     has_valid_path = Boolean(string=_("Valid path"), default=False, readonly=True)
+    metadata_fingerprint = Char(string=_("Metadata fingerprint"), copy=False, readonly=True)
     is_saved = Boolean(string=_("Is saved"), default=False, readonly=True)
     custom_owner_id = Many2one(
         comodel_name='res.users', string="Owner", default=lambda self: self.env.user, required=True
     )
 
     def _search_is_deleted(self, operator, value):
-        matching_ids = []
-        saved_records = self.search([('is_saved', operator, True)])
-
-        for track in saved_records:
-            deleted = not track.file_exists(track.old_path)
+        if operator not in ('=', '!='):
+            raise UserError(_("\nOperation not supported."))
 
-            if (value and deleted) or (not value and not deleted):
-                matching_ids.append(track.id)
+        # Presence is kept by the library scanner: no file is touched while searching
+        if (operator == '=') == bool(value):
+            return [('old_path', '!=', False), ('file_present', '=', False)]
 
-        return [("id", "in", matching_ids)]
+        return ['|', ('old_path', '=', False), ('file_present', '=', True)]
 
     @api.model_create_multi
     def create(self, list_vals):
+        processed_covers = {}
+
         for vals in list_vals:
+            raw_picture = vals.get('picture')
+
+            # Tracks from the same album usually share the cover: process it only once per batch
+            if raw_picture and raw_picture in processed_covers:
+                del vals['picture']
+                vals['cover_id'] = processed_covers[raw_picture]
+                continue
+
             self._process_picture_image(vals)
 
+            if raw_picture:
+                processed_covers[raw_picture] = vals['cover_id']
+
         tracks = super().create(list_vals)
 
-        for track in tracks:
-            # noinspection PyProtectedMember
-            track._sync_album_with_artist()
-            # noinspection PyProtectedMember
-            track._sync_album_with_genre()
+        # noinspection PyProtectedMember
+        tracks._sync_albums_with_tracks()
+        self.env['music_manager.library_stats'].refresh_stats(artists=tracks.track_artist_ids, genres=tracks.genre_id)
 
         return tracks
 
@@ -120,77 +139,65 @@ class Track(Model, ProcessImageMixin):
                 raise UserError(_("You cannot modify a deleted file."))
 
         self._process_picture_image(vals)
+        refresh_stats = bool(LIBRARY_STATS_FIELDS.intersection(vals))
+        old_artists, old_genres = (self.track_artist_ids, self.genre_id) if refresh_stats else (None, None)
         res = super().write(vals)  # type: ignore[arg-type]
 
-        for track in self:
-            # noinspection PyProtectedMember
-            track._sync_album_with_artist()
+        # Stats of the artists & genres the tracks leave are refreshed too
+        if refresh_stats:
+            self.env['music_manager.library_stats'].refresh_stats(
+                artists=old_artists | self.track_artist_ids, genres=old_genres | self.genre_id
+            )
+
+        # Albums are synced once per affected album, and only when a related field changed
+        if ALBUM_SYNC_FIELDS.intersection(vals):
             # noinspection PyProtectedMember
-            track._sync_album_with_genre()
+            self._sync_albums_with_tracks()
+
+        if OWNER_SYNC_FIELDS.intersection(vals):
             # noinspection PyProtectedMember
-            track._sync_album_with_owner()
+            self._sync_albums_with_owner()
 
         return res
 
     def unlink(self):
-        for track in self:
-            if not self.env.user.has_group('music_manager.group_music_manager_user_admin'):
+        if not self.env.user.has_group('music_manager.group_music_manager_user_admin'):
+            for track in self:
                 if track.custom_owner_id != self.env.user:
                     raise AccessError(_("\nCannot delete this track because you are not the owner. 🤷"))
 
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
-        deletion_active = settings.to_delete if settings else False
-        track_model = self.env['music_manager.track'].sudo()
-        file_service = self._get_file_service_adapter()
+        deletion_active = self.env['music_manager.audio_settings'].get_settings().to_delete
 
         # Preparing DB variables
-        files_to_check = [(track.file_path, track.is_deleted) for track in self]
+        paths_to_check = {track.file_path for track in self if track.file_path and not track.is_deleted}
         albums_to_check = self.mapped('album_id')
+        artists_to_refresh = self.track_artist_ids
+        genres_to_refresh = self.genre_id
 
         # Delete track records
         res = super().unlink()
+        self.env['music_manager.library_stats'].refresh_stats(artists=artists_to_refresh, genres=genres_to_refresh)
 
         # Ensure empty albums
-        empty_albums = albums_to_check.exists().filtered(
-            lambda album: track_model.search_count([('album_id', '=', album.id)]) == 0
-        )
+        # noinspection PyProtectedMember
+        empty_albums = albums_to_check.exists()._filter_empty_albums()
 
         if empty_albums:
             empty_albums.sudo().with_context(skip_album_sync=True).unlink()
 
-        if not deletion_active:
+        if not deletion_active or not paths_to_check:
             return res
 
-        # File cleaning
-        for path, is_deleted in files_to_check:
-            if not path or is_deleted:
-                continue
-
-            still_used = track_model.search_count([('file_path', '=', path)])
-
-            if still_used != 0:
-                continue
-
-            try:
-                file_service.delete_file(path)
-
-            except InvalidPathError as invalid_path:
-                _logger.warning(f"File to delete not found, continuing: {invalid_path}")
-                continue
-
-            except FilePersistenceError as not_allowed:
-                _logger.error(f"Cannot delete the file: {not_allowed}")
-                raise ValidationError(
-                    _("\nAn internal issue ocurred while trying to delete the file."
-                      "\nPlease, try it again with a different record.")
-                )
+        # File cleaning: one grouped count for every path, files are removed by a cron once the deletion is committed
+        used_paths = {
+            group['file_path'] for group in self.sudo().read_group(
+                [('file_path', 'in', list(paths_to_check))], ['file_path'], ['file_path']
+            )
+        }
+        paths_to_delete = sorted(paths_to_check - used_paths)
 
-            except MusicManagerError as unknown_error:
-                _logger.error(f"Unespected error while trying to delete the file: {unknown_error}")
-                raise ValidationError(
-                    _("\nDamn! Something went wrong while deleting the file."
-                      "\nPlease, contact with your Admin.")
-                )
+        if paths_to_delete:
+            self.env['music_manager.file_deletion'].enqueue_paths(paths_to_delete)
 
         return res
 
@@ -243,14 +250,10 @@ class Track(Model, ProcessImageMixin):
         for track in self:
             track.display_sample_rate = f"{track.sample_rate} kHz"
 
-    @api.depends('old_path')
+    @api.depends('old_path', 'file_present')
     def _compute_file_is_deleted(self) -> None:
         for track in self:
-            if track.old_path and isinstance(track.old_path, str):
-                track.is_deleted = not track.file_exists(track.old_path)
-
-            else:
-                track.is_deleted = False
+            track.is_deleted = bool(track.old_path and isinstance(track.old_path, str)) and not track.file_present
 
     @api.depends('name', 'album_artist_id.name', 'album_id.name', 'track_no', 'disk_no')
     def _compute_file_path(self) -> None:
@@ -271,22 +274,58 @@ class Track(Model, ProcessImageMixin):
 
     @api.constrains('track_artist_ids', 'name', 'album_id', 'custom_owner_id')
     def _check_track_name(self) -> None:
-        for current_track in self:
-            if not current_track.track_artist_ids:
-                continue
+        if not self:
+            return
 
-            existing_tracks = self.search([
-                ('id', '!=', current_track.id),
-                ('name', '=', current_track.name),
-                ('album_id', '=', current_track.album_id.id),
-                ('custom_owner_id', '=', current_track.custom_owner_id.id)
-            ])
+        self.flush_model(['name', 'album_id', 'custom_owner_id', 'track_artist_ids'])
 
-            for track in existing_tracks:
-                if set(current_track.track_artist_ids.ids) == set(track.track_artist_ids.ids):
-                    raise ValidationError(
-                        _("\nThe track '%s' already exists with the same artist(s).", current_track.name)
-                    )
+        # noinspection PyProtectedMember
+        artist_field = self._fields['track_artist_ids']
+
+        m2m_table = artist_field.relation
+        col_track = artist_field.column1
+        col_artist = artist_field.column2
+
+        # Whole recordset in one round trip: same title, album & owner plus identical artist set
+        self.env.cr.execute(
+            f"""
+            WITH candidate_tracks AS (
+                SELECT other.id
+                FROM {self._table} current
+                JOIN {self._table} other
+                  ON other.name = current.name
+                 AND other.album_id = current.album_id
+                 AND other.custom_owner_id = current.custom_owner_id
+                WHERE current.id = ANY(%s)
+            ),
+            track_artists AS (
+                SELECT {col_track} AS track_id, array_agg(DISTINCT {col_artist} ORDER BY {col_artist}) AS artist_ids
+                FROM {m2m_table}
+                WHERE {col_track} IN (SELECT id FROM candidate_tracks)
+                GROUP BY {col_track}
+            )
+            SELECT current.name
+            FROM {self._table} current
+            JOIN track_artists current_artists ON current_artists.track_id = current.id
+            JOIN {self._table} other
+              ON other.id != current.id
+             AND other.name = current.name
+             AND other.album_id = current.album_id
+             AND other.custom_owner_id = current.custom_owner_id
+            JOIN track_artists other_artists
+              ON other_artists.track_id = other.id
+             AND other_artists.artist_ids = current_artists.artist_ids
+            WHERE current.id = ANY(%s)
+            LIMIT 1
+            """,
+            (self.ids, self.ids)
+        )
+        duplicated_track = self.env.cr.fetchone()
+
+        if duplicated_track:
+            raise ValidationError(
+                _("\nThe track '%s' already exists with the same artist(s).", duplicated_track[0])
+            )
 
     @api.constrains('file_path')
     def _validate_file_path(self) -> None:
@@ -299,6 +338,41 @@ class Track(Model, ProcessImageMixin):
 
             track.has_valid_path = file_service.is_valid(track.file_path)
 
+    @api.model
+    def refresh_file_presence(self, root_dir):
+        scan_index_table = self.env['music_manager.scan_index']._table
+        self.flush_model(['old_path', 'file_present', 'file_checked_at'])
+
+        # Only tracks under the scanned root whose presence changed (or was never checked) are written
+        self.env.cr.execute(
+            f"""
+            UPDATE {self._table} track
+            SET file_present = presence.is_present,
+                file_checked_at = NOW() AT TIME ZONE 'UTC'
+            FROM (
+                SELECT candidate.id, EXISTS (
+                    SELECT 1
+                    FROM {scan_index_table} entry
+                    WHERE entry.path = candidate.old_path AND entry.entry_type = 'file'
+                ) AS is_present
+                FROM {self._table} candidate
+                WHERE starts_with(candidate.old_path, %s)
+            ) presence
+            WHERE track.id = presence.id
+              AND (track.file_checked_at IS NULL OR track.file_present IS DISTINCT FROM presence.is_present)
+            RETURNING presence.is_present
+            """,
+            (f"{root_dir.rstrip('/')}/",)
+        )
+        missing_count = sum(1 for is_present, in self.env.cr.fetchall() if not is_present)
+
+        self.invalidate_model(['file_present', 'file_checked_at'])
+
+        if missing_count:
+            _logger.warning(f"Library scan: {missing_count} tracks point to files that no longer exist.")
+
+        return missing_count
+
     def save_changes(self):
         track = self.ensure_one()
 
@@ -355,37 +429,55 @@ class Track(Model, ProcessImageMixin):
             return fallback_ids[:1]
 
         artists = self.env['music_manager.artist']
-        artist = artists.search([('name', '=', artist_name)], limit=1)
+        artist = artists.search([('name_key', '=', get_name_key(artist_name))], limit=1)
 
         if artist:
             return artist
 
         return artists.create({'name': artist_name})
 
-    def _get_file_service_adapter(self):
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+    def _get_file_service_adapter(self) -> FileServiceAdapter:
+        return self.env['music_manager.audio_settings'].get_file_service_adapter()
 
-        root = settings.root_dir if settings else '/music'
-        file_extension = settings.sound_format if settings else 'mp3'
+    def _get_track_service_adapter(self) -> TrackServiceAdapter:
+        return self.env['music_manager.audio_settings'].get_track_service_adapter()
 
-        return FileServiceAdapter(str_root_dir=root, file_extension=file_extension)
+    def _perform_save_changes(self):
+        # noinspection PyProtectedMember
+        operations, failure_messages = self._prepare_save_changes()
+        journal_entries = self.env['music_manager.save_journal'].open_entries(operations)
 
-    def _get_track_service_adapter(self) -> TrackServiceAdapter:
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+        with TrackSaveAdapter(self._get_track_service_adapter(), self._get_file_service_adapter()) as save_adapter:
+            results = save_adapter.apply_all(operations)
 
-        file_extension = settings.sound_format if settings else 'mp3'
+        for result in results:
+            if result['error']:
+                raise ValidationError(self._get_save_error_message(result))
 
-        return TrackServiceAdapter(file_type=file_extension)
+        # noinspection PyProtectedMember
+        success_counter, _result_messages = self._finalize_save_changes(results)
+        journal_entries.close_entries()
 
-    def _perform_save_changes(self):
-        failure_messages = []
-        success_counter = 0
+        return {
+            'success': success_counter,
+            'messages': failure_messages
+        }
 
-        file_service = self._get_file_service_adapter()
+    def _prepare_save_changes(self, strict=True):
+        operations = []
+        failure_messages = []
 
         for track in self:
-            # noinspection PyProtectedMember
-            track._ensure_optional_fields()
+            try:
+                # noinspection PyProtectedMember
+                track._ensure_optional_fields()
+
+            except ValidationError as missing_field:
+                if strict:
+                    raise
+
+                failure_messages.append(_("Track '%s' was skipped: %s", track.name, str(missing_field).strip()))
+                continue
 
             if not isinstance(track.old_path, str):
                 failure_messages.append(
@@ -399,117 +491,200 @@ class Track(Model, ProcessImageMixin):
                 )
                 continue
 
-            try:
-                # noinspection PyProtectedMember
-                track._update_metadata()
+            # noinspection PyProtectedMember
+            metadata, fingerprint = track._get_metadata_changes()
+
+            # Everything the file operations need is read here, so they can run away from the cursor
+            operations.append({
+                'track_id': track.id,
+                'track_name': track.name,
+                'old_path': track.old_path,
+                'new_path': track.file_path,
+                'metadata': metadata,
+                'partial': bool(track.metadata_fingerprint),
+                'fingerprint': fingerprint,
+            })
+
+        return operations, failure_messages
+
+    def _finalize_save_changes(self, results):
+        failure_messages = []
+        success_counter = 0
 
-                if track.old_path != track.file_path:
-                    file_service.update_file_path(track.old_path, track.file_path)
-                    track.with_context(skip_physical_check=True).write({'old_path': track.file_path})
+        for result in results:
+            if result['error']:
+                failure_messages.append(self._get_save_error_message(result).strip())
+                continue
 
-                success_counter += 1
+            values = {}
 
-            except InvalidPathError as invalid_path:
-                _logger.error(f"There was an issue with file path: {invalid_path}")
-                raise ValidationError(_("\nActually, the file path of '%s' is not valid.", track.name))
+            if result['written']:
+                values['metadata_fingerprint'] = result['fingerprint']
 
-            except FilePersistenceError as not_allowed:
-                _logger.error(f"Cannot update the file: {not_allowed}")
-                raise ValidationError(
-                    _("\nAn internal issue ocurred while trying to update the file '%s'."
-                      "\nPlease, try it again with a different record.", track.name)
-                )
+            if result['moved']:
+                values.update({'old_path': result['new_path'], 'file_present': True})
 
-            except MusicManagerError as unknown_error:
-                _logger.error(f"Unespected error while trying to update the file: {unknown_error}")
-                raise ValidationError(
-                    _("\nDamn! Something went wrong while updating the file '%s'."
-                      "\nPlease, contact with your Admin.", track.name)
-                )
+            if values:
+                self.browse(result['track_id']).with_context(skip_physical_check=True).write(values)
 
-        return {
-            'success': success_counter,
-            'messages': failure_messages
-        }
+            success_counter += 1
 
-    def _sync_album_with_artist(self) -> None:
-        self.ensure_one()
+        return success_counter, failure_messages
+
+    def _sync_albums_with_tracks(self) -> None:
+        album_values = {}
+
+        # Last track of each album wins, as if tracks were synced one by one
+        for track in self:
+            if not track.album_id:
+                continue
+
+            values = album_values.setdefault(track.album_id, {})
+
+            if track.album_artist_id:
+                values['album_artist_id'] = track.album_artist_id.id
 
-        if not self.album_id or not self.album_artist_id:
+            if track.genre_id:
+                values['genre_id'] = track.genre_id.id
+
+        albums_by_changes = defaultdict(list)
+
+        for album, values in album_values.items():
+            changes = tuple(sorted(
+                (field_name, value) for field_name, value in values.items() if album[field_name].id != value
+            ))
+
+            if changes:
+                albums_by_changes[changes].append(album.id)
+
+        # One write per distinct change instead of one per track
+        for changes, album_ids in albums_by_changes.items():
+            self.env['music_manager.album'].sudo().browse(album_ids).write(dict(changes))
+
+    def _sync_albums_with_owner(self) -> None:
+        tracks_to_move = self.filtered(
+            lambda track: track.custom_owner_id and track.album_id
+            and track.custom_owner_id not in track.album_id.custom_owner_ids
+        )
+
+        if not tracks_to_move:
             return
 
-        if self.album_id.album_artist_id != self.album_artist_id:
-            self.album_id.sudo().write(
-                {'album_artist_id': self.album_artist_id.id}
-            )
+        album_model = self.env['music_manager.album']
+        album_keys = {(track.album_id.name_key, track.album_artist_id.id) for track in tracks_to_move}
 
-    def _sync_album_with_genre(self) -> None:
-        self.ensure_one()
+        # One search for every target album instead of one per track
+        target_albums = {}
+        candidate_albums = album_model.sudo().search([
+            ('name_key', 'in', list({name_key for name_key, _artist_id in album_keys})),
+            ('album_artist_id', 'in', list({artist_id for _name_key, artist_id in album_keys})),
+        ], order='id')
+
+        for album in candidate_albums:
+            target_albums.setdefault((album.name_key, album.album_artist_id.id), album)
+
+        tracks_by_album = defaultdict(list)
+
+        for track in tracks_to_move:
+            album_key = (track.album_id.name_key, track.album_artist_id.id)
+
+            if album_key not in target_albums:
+                target_albums[album_key] = album_model.create({
+                    'name': track.album_id.name,
+                    'album_artist_id': track.album_artist_id.id if track.album_artist_id else False,
+                    'genre_id': track.genre_id.id if track.genre_id else False,
+                })
 
-        if not self.album_id or not self.genre_id:
+            if target_albums[album_key] != track.album_id:
+                tracks_by_album[target_albums[album_key]].append(track.id)
+
+        if not tracks_by_album:
             return
 
-        if self.album_id.genre_id != self.genre_id:
-            self.album_id.sudo().write(
-                {'genre_id': self.genre_id.id}
-            )
+        previous_albums = tracks_to_move.mapped('album_id')
 
-    def _sync_album_with_owner(self) -> None:
+        for target_album, track_ids in tracks_by_album.items():
+            self.browse(track_ids).write({'album_id': target_album.id})
+
+        # noinspection PyProtectedMember
+        empty_albums = previous_albums.exists()._filter_empty_albums()
+
+        if empty_albums:
+            empty_albums.sudo().with_context(skip_album_sync=True).unlink()
+
+    def _get_metadata(self, with_picture=True):
         self.ensure_one()
 
-        if not self.custom_owner_id or not self.album_id:
-            return
+        metadata = {
+            'TIT2': self.name or "",
+            'TPE1': [record.name for record in self.track_artist_ids] if self.track_artist_ids else [],
+            'TPE2': ("Various Artists" if self.compilation else self.album_artist_id.name) or "",
+            'TALB': self.album_id.name or "",
+            'TRCK': (self.track_no or 0, self.total_track or 0),
+            'TOPE': self.original_artist_id.name,
+            'TCMP': self.compilation,
+            'TPOS': (self.disk_no or 0, self.total_disk or 0),
+            'TDRC': self.year,
+            'TCON': self.genre_id.name,
+        }
 
-        if self.custom_owner_id in self.album_id.custom_owner_ids:
-            return
+        if with_picture:
+            metadata['APIC'] = self.picture
 
-        actual_album = self.album_id
-        album_class = self.env['music_manager.album'].sudo()
-
-        target_album = album_class.search([
-            ('name', '=', self.album_id.name),
-            ('album_artist_id', '=', self.album_artist_id.id),
-        ], limit=1)
-
-        if not target_album:
-            target_album = self.env['music_manager.album'].create(
-                {
-                    'name': self.album_id.name,
-                    'album_artist_id': self.album_artist_id.id if self.album_artist_id else False,
-                    'genre_id': self.genre_id.id if self.genre_id else False,
-                }
-            )
+        return metadata
 
-        if target_album != actual_album:
-            self.album_id = target_album.id
+    def _get_frame_fingerprints(self):
+        self.ensure_one()
+
+        fingerprints = get_frame_fingerprints(self._get_metadata(with_picture=False))
+
+        # Covers are deduplicated by checksum, so the picture never has to be loaded to compare it
+        fingerprints['APIC'] = self.cover_id.checksum or ""
+
+        return fingerprints
 
-            tracks_count = self.env['music_manager.track'].sudo().search_count([
-                ('album_id', '=', actual_album.id)
-            ])
+    def _get_metadata_changes(self):
+        self.ensure_one()
+
+        metadata = self._get_metadata(with_picture=False)
+        fingerprints = self._get_frame_fingerprints()
+        changed_frames = get_changed_frames(fingerprints, self.metadata_fingerprint)
 
-            if tracks_count == 0:
-                actual_album.sudo().with_context(skip_album_sync=True).unlink()
+        if 'APIC' in changed_frames:
+            metadata['APIC'] = self.picture
+
+        return {frame: metadata[frame] for frame in changed_frames}, dump_fingerprint(fingerprints)
 
     def _update_metadata(self) -> None:
 
         track_service = self._get_track_service_adapter()
 
         for track in self:
-            metadata = {
-                'TIT2': track.name or "",
-                'TPE1': [record.name for record in track.track_artist_ids] if track.track_artist_ids else [],
-                'TPE2': ("Various Artists" if track.compilation else track.album_artist_id.name) or "",
-                'TALB': track.album_id.name or "",
-                'TRCK': (track.track_no or 0, track.total_track or 0),
-                'TOPE': track.original_artist_id.name,
-                'TCMP': track.compilation,
-                'TPOS': (track.disk_no or 0, track.total_disk or 0),
-                'TDRC': track.year,
-                'TCON': track.genre_id.name,
-                'APIC': track.picture,
-            }
+            # noinspection PyProtectedMember
+            track_service.write_metadata(track.old_path, track._get_metadata())
+            track.with_context(skip_physical_check=True).write(
+                # noinspection PyProtectedMember
+                {'metadata_fingerprint': dump_fingerprint(track._get_frame_fingerprints())}
+            )
+
+    @staticmethod
+    def _get_save_error_message(result):
+        if result['error_type'] == 'invalid_path':
+            return _("\nActually, the file path of '%s' is not valid.", result['track_name'])
+
+        if result['error_type'] == 'persistence':
+            return _(
+                "\nAn internal issue ocurred while trying to update the file '%s'."
+                "\nPlease, try it again with a different record.", result['track_name']
+            )
 
-            track_service.write_metadata(track.old_path, metadata)
+        if result['error_type'] == 'metadata':
+            return result['error']
+
+        return _(
+            "\nDamn! Something went wrong while updating the file '%s'."
+            "\nPlease, contact with your Admin.", result['track_name']
+        )
 
     @staticmethod
     def file_exists(filepath: str) -> bool:
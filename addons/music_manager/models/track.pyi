@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 from collections.abc import Callable, Sequence
-from typing import Final, Literal, Self
+from datetime import datetime
+from typing import Any, Dict, Final, List, Literal, Self, Tuple
 
 from odoo.addons.base.models.res_users import Users
 from odoo.api import Environment
 
 from .album import Album
 from .artist import Artist
+from .cover import Cover
 from .genre import Genre
 from ..adapters import FileServiceAdapter, TrackServiceAdapter
 from ..utils.custom_types import (
@@ -14,11 +16,18 @@ from ..utils.custom_types import (
     DisplayNotification,
     DomainCustomFilter,
     MessageCounter,
+    SaveOperation,
+    SaveResult,
     TrackVals,
     YearValue
 )
 
 
+ALBUM_SYNC_FIELDS: Final[set[str]]
+LIBRARY_STATS_FIELDS: Final[set[str]]
+OWNER_SYNC_FIELDS: Final[set[str]]
+
+
 class Track:
     """
     Represents a Track model into the system.
@@ -39,6 +48,7 @@ class Track:
     disk_no: int | Literal[False]
     name: str
     picture: bytes | Literal[False]
+    cover_id: Cover | int | Literal[False]
     total_disk: int | Literal[False]
     total_track: int | Literal[False]
     track_no: int
@@ -69,12 +79,15 @@ class Track:
     album_name: str | Literal[False]
     album_artist: str | Literal[False]
 
+    file_checked_at: datetime | Literal[False]
+    file_present: bool
     has_valid_path: bool
+    metadata_fingerprint: str | Literal[False]
     is_saved: bool
     custom_owner_id: Users | int
 
     def _search_is_deleted(self: Self, operator: str, value: bool) -> DomainCustomFilter:
-        """This method returns a record list according to the given filter.
+        """Returns a SQL domain over the stored file presence according to the given filter.
         :param operator: Representative string from different operators like '=' or '!='.
         :param value: Boolean value
         :return: List with diferent records according to filter.
@@ -88,14 +101,16 @@ class Track:
 
     def write(self: Self, vals: TrackVals) -> Literal[True]:
         """Overrides 'write' method to update cover track & syncronizes with album & artist ids.
+        Stats of old & new artists and genre are refreshed when any of them or the duration changes.
         :param vals: Dictionary with track values to update.
         :return: Confirms updated album record.
         """
 
     def unlink(self: Self) -> Literal[True]:
         """Overrides the 'unlink' method to delete all linked albums and genres that no longer have
-        associated tracks. It also deletes the track's file path before the record itself is deleted.
-        The MP3 file is also removed if the user has the necessary permissions.
+        associated tracks. Remaining tracks per album & per path are counted with one grouped query each.
+        The MP3 files no longer used are removed in a background thread once the deletion is committed,
+        if file deletion is enabled.
         :return: Deleted records.
         """
 
@@ -130,7 +145,7 @@ class Track:
         """
 
     def _compute_file_is_deleted(self: Self) -> None:
-        """Determines if the file no longer exists.
+        """Determines if the file no longer exists, according to the presence stored by the library scanner.
         :return: None
         """
 
@@ -145,7 +160,8 @@ class Track:
         """
 
     def _check_track_name(self: Self) -> None:
-        """Checks track title, album name & track artist to avoid duplicates.
+        """Checks track title, album name & track artist to avoid duplicates. The whole recordset is validated with
+        a single SQL query that compares the aggregated artist IDs of each track.
         :return: None
         """
 
@@ -154,6 +170,13 @@ class Track:
         :return: None
         """
 
+    def refresh_file_presence(self: Self, root_dir: str) -> int:
+        """Updates 'file_present' of every track under the root directory against the library scan index, in a
+        single SQL statement. Only tracks whose presence changed are written.
+        :param root_dir: Scanned root directory
+        :return: Amount of tracks whose file disappeared
+        """
+
     def save_changes(self: Self) -> DisplayNotification:
         """Updates track metadata & path file.
         :return: Dictionary with notification data
@@ -165,7 +188,8 @@ class Track:
         """
 
     def _find_or_create_single_artist(self: Self, artist_name: str, fallback_artists: Sequence[Artist]) -> Artist | Literal[False]:
-        """Tries to find a given single artist name. If there is not any, sets the first one finded on fall back list.
+        """Tries to find a given single artist name by its name key. If there is not any, sets the first one finded
+        on fall back list.
         :param artist_name: Artist name
         :param fallback_artists: A list with various Artists
         :return: Artist (created or finded) | False if there is not any name
@@ -173,12 +197,34 @@ class Track:
 
     def _get_file_service_adapter(self: Self) -> FileServiceAdapter:
         """Ensure file adapter has its settings updated
-        :return: FileServiceAdapter with updated settings
+        :return: New FileServiceAdapter built from the cached settings
         """
 
     def _get_track_service_adapter(self: Self) -> TrackServiceAdapter:
         """Ensure track service adapter has its settings updated
-        :return: TrackServiceAdapter with updated settings
+        :return: New TrackServiceAdapter built from the cached settings
+        """
+
+    def _finalize_save_changes(self: Self, results: List[SaveResult]) -> Tuple[int, List[str]]:
+        """Writes back the new path of every moved file & collects the failed ones.
+        :param results: Results returned by TrackSaveAdapter
+        :return: Success counter & failure messages
+        """
+
+    def _get_frame_fingerprints(self: Self) -> Dict[str, str]:
+        """Hashes every ID3 frame of the track. The cover is identified by its checksum.
+        :return: Dictionary with ID3 frames & their hashes
+        """
+
+    def _get_metadata(self: Self, with_picture: bool = True) -> Dict[str, Any]:
+        """Builds the metadata that will be written into the track file
+        :param with_picture: Include the cover (APIC), which has to be loaded from its attachment
+        :return: Dictionary with ID3 frames & their values
+        """
+
+    def _get_metadata_changes(self: Self) -> Tuple[Dict[str, Any], str]:
+        """Compares the current metadata with the fingerprint of the last one written into the file.
+        :return: Changed frames only (all of them if the file was never written) & the new fingerprint
         """
 
     def _perform_save_changes(self: Self) -> MessageCounter | None:
@@ -186,26 +232,35 @@ class Track:
         :return: Custom dictonary
         """
 
-    def _sync_album_with_artist(self: Self) -> None:
-        """Syncronizes album ID with artist ID.
-        :return: None
+    def _prepare_save_changes(self: Self, strict: bool = True) -> Tuple[List[SaveOperation], List[str]]:
+        """Reads everything needed to update the track files, so files can be written without the cursor.
+        :param strict: Raise when a track has missing fields instead of skipping it
+        :return: Operations for TrackSaveAdapter & skipped tracks messages
         """
 
-    def _sync_album_with_genre(self: Self) -> None:
-        """Syncronizes album ID with genre ID.
+    def _sync_albums_with_tracks(self: Self) -> None:
+        """Syncronizes album artist & genre of every album touched by these tracks, writing each album once.
         :return: None
         """
 
-    def _sync_album_with_owner(self: Self) -> None:
-        """Syncronizes album owner ID with owner ID if album exists else creates a new one.
+    def _sync_albums_with_owner(self: Self) -> None:
+        """Moves tracks whose owner is not an album owner to the album with the same name key & artist, creating it
+        if it does not exist. Target albums are searched at once and emptied albums are removed together.
         :return: None
         """
 
     def _update_metadata(self: Self) -> None:
-        """Send metadata to track service
+        """Send all metadata to track service & stores its fingerprint
         :return: None
         """
 
+    @staticmethod
+    def _get_save_error_message(result: SaveResult) -> str:
+        """Translates a failed save result into a message for the user
+        :param result: Result returned by TrackSaveAdapter
+        :return: Error message
+        """
+
     def file_exists(self: Self) -> bool:
         """Checks if the file exists.
         :return: Boolean
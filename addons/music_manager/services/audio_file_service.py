@@ -1,16 +1,24 @@
 import io
 import logging
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 import mutagen.id3 as tag_type
 import mutagen.mp3 as exception
+from mutagen import PaddingInfo
 from mutagen.id3 import ID3
 from mutagen.mp3 import MP3
 
 from ..utils.track_data import FullTrackData, TrackInfo, TrackMetadata
-from ..utils.exceptions import InvalidFileFormatError, MetadataPersistenceError, MusicManagerError, ReadingFileError
+from ..utils.exceptions import (
+    InvalidFileFormatError,
+    InvalidPathError,
+    MetadataPersistenceError,
+    MusicManagerError,
+    ReadingFileError
+)
 
 
 _logger = logging.getLogger(__name__)
@@ -23,7 +31,13 @@ class AudioFileService(ABC):
         ...
 
     @abstractmethod
-    def set_track_metadata(self, output_path: Path, new_data: Dict[str, str | int | None]) -> None:
+    def probe_file(self, file_path: Path) -> FullTrackData:
+        ...
+
+    @abstractmethod
+    def set_track_metadata(
+            self, output_path: Path, new_data: Dict[str, str | int | None], frames: Iterable[str] | None = None
+    ) -> None:
         ...
 
 
@@ -45,24 +59,29 @@ class MP3AudioFileService(AudioFileService):
         'APIC': tag_type.APIC,
     }
 
-    def get_full_data(self, buffered_file: io.BytesIO) -> FullTrackData:
+    def __init__(self, tag_padding: int = 0) -> None:
+        # Bytes reserved after the tag when it must grow. Zero keeps mutagen's default policy
+        self.tag_padding = max(int(tag_padding or 0), 0)
 
+    def get_full_data(self, buffered_file: io.BytesIO) -> FullTrackData:
         track = self._open_mp3_file(buffered_file)
-        metadata = self._extract_metadata(track)
+        return self._build_full_data(track)
 
-        info = TrackInfo(
-            bitrate=track.info.bitrate // 1000,
-            channels=track.info.channels,
-            codec="MP3",
-            duration=round(track.info.length),
-            mime_type=self.MIME_TYPE,
-            sample_rate=track.info.sample_rate,
-        )
+    def probe_file(self, file_path: Path) -> FullTrackData:
+        if not file_path.is_file():
+            _logger.error(f"Cannot probe the file. File not found or it is not a file: '{file_path}'.")
+            raise InvalidPathError(f"Unavailable to probe the file: not found or it is not a file.")
 
-        return FullTrackData(info=info, metadata=metadata)
+        # Mutagen opens the path itself and only reads the ID3v2 block plus the first MPEG frames (Xing/VBRI)
+        track = self._open_mp3_file(file_path)
+        return self._build_full_data(track)
 
     def set_track_metadata(
-            self, output_path: Path, new_metadata: Dict[str, str | int | None], preserve_unknown_tags: bool = False
+            self,
+            output_path: Path,
+            new_metadata: Dict[str, str | int | None],
+            frames: Iterable[str] | None = None,
+            preserve_unknown_tags: bool = False
     ) -> None:
         tag_writers = {
             'APIC': self._write_apic_image,
@@ -73,22 +92,43 @@ class MP3AudioFileService(AudioFileService):
 
         track = self._open_mp3_file(output_path)
 
-        if not preserve_unknown_tags:  # If in a future we want to save unknown metadata
-            self._normalize_metadata(track)
+        if frames is None:
+            frames = self.ID3_TAG_MAPPING.keys()
+
+            if not preserve_unknown_tags:  # If in a future we want to save unknown metadata
+                self._normalize_metadata(track)
 
-        new_data = TrackMetadata(**new_metadata)
+        else:
+            # Partial update: only the given frames are replaced, the rest of the tag stays untouched
+            self._remove_frames(track, frames)
+
+        new_data = TrackMetadata(**{name: value for name, value in new_metadata.items() if name in frames})
 
-        for name, tag in self.ID3_TAG_MAPPING.items():
+        for name in frames:
             value = getattr(new_data, name)
 
             if value is None:
                 continue
 
             writer = tag_writers.get(name, self._write_text)
-            writer(track, tag, value)
+            writer(track, self.ID3_TAG_MAPPING[name], value)
 
         self._save(track)
 
+    def _build_full_data(self, track: MP3) -> FullTrackData:
+        metadata = self._extract_metadata(track)
+
+        info = TrackInfo(
+            bitrate=track.info.bitrate // 1000,
+            channels=track.info.channels,
+            codec="MP3",
+            duration=round(track.info.length),
+            mime_type=self.MIME_TYPE,
+            sample_rate=track.info.sample_rate,
+        )
+
+        return FullTrackData(info=info, metadata=metadata)
+
     def _extract_metadata(self, track: MP3) -> TrackMetadata:
         tag_parsers = {
             'APIC': self._parse_apic_image,
@@ -156,14 +196,22 @@ class MP3AudioFileService(AudioFileService):
         track, total_track = data.split("/")
         return int(track), int(total_track)
 
-    def _normalize_metadata(self, track: MP3) -> None:
+    @staticmethod
+    def _normalize_metadata(track: MP3) -> None:
+        # Tags are cleared in memory; the file is written once with the new ones
         if track.tags:
             track.tags.clear()
 
         else:
             track.add_tags()
 
-        self._save(track)
+    @staticmethod
+    def _remove_frames(track: MP3, frames: Iterable[str]) -> None:
+        if track.tags is None:
+            track.add_tags()
+
+        for name in frames:
+            track.tags.delall(name)
 
     @staticmethod
     def _open_mp3_file(track_file: Path | io.BytesIO) -> MP3:
@@ -184,10 +232,17 @@ class MP3AudioFileService(AudioFileService):
             _logger.error(f"Something went wrong while analyzing file metadata: {unknown_error}")
             raise MusicManagerError(unknown_error)
 
-    @staticmethod
-    def _save(track: MP3) -> None:
+    def _get_padding(self, info: PaddingInfo) -> int:
+        # While the new tag fits, its padding is kept as is: the tag is rewritten in place, never the whole file
+        if info.padding >= 0:
+            return info.padding
+
+        return self.tag_padding
+
+    def _save(self, track: MP3) -> None:
         try:
-            track.save()
+            track.save(padding=self._get_padding if self.tag_padding else None)
+            self._sync_file(track.filename)
 
         except (PermissionError, OSError) as not_allowed:
             _logger.error(f"Cannot save metadata to file: {not_allowed}")
@@ -197,6 +252,20 @@ class MP3AudioFileService(AudioFileService):
             _logger.error(f"Unexpected error during metadata writing: {unknown_error}")
             raise MusicManagerError(unknown_error)
 
+    @staticmethod
+    def _sync_file(file_name: str | None) -> None:
+        # Tags are flushed to disk before the database records them as written
+        if not isinstance(file_name, str):
+            return
+
+        file_fd = os.open(file_name, os.O_RDONLY)
+
+        try:
+            os.fsync(file_fd)
+
+        finally:
+            os.close(file_fd)
+
     @staticmethod
     def _write_apic_image(track: MP3, tag: Any, value: bytes) -> None:
         track.tags.add(
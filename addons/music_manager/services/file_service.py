@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from ..utils.enums import FileType
+from ..utils.file_data import FileFingerprint
 from ..utils.exceptions import FilePersistenceError, InvalidPathError, MusicManagerError
 
 
@@ -33,10 +35,73 @@ class FolderManager:
     def get_all_file_paths(self) -> List[Path]:
         return list(self._root_dir.rglob(f"*.{self.file_extension}"))
 
+    def scan_directory(self, dir_path: Path) -> Tuple[List[Path], List[FileFingerprint]]:
+        subdirs = []
+        files = []
+        suffix = f".{self.file_extension}"
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.append(Path(entry.path))
+
+                    elif entry.is_file() and entry.name.endswith(suffix):
+                        file_stat = entry.stat()
+                        files.append(
+                            FileFingerprint(entry.path, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino)
+                        )
+
+        except FileNotFoundError as not_found:
+            _logger.error(f"Directory not found. Impossible to scan: {not_found}")
+            raise InvalidPathError(not_found)
+
+        except PermissionError as not_allowed:
+            _logger.error(f"Is not allowed to scan directory: {not_allowed}")
+            raise FilePersistenceError(not_allowed)
+
+        except Exception as unknown_error:
+            _logger.error(f"Something went wrong while scanning directory: {unknown_error}")
+            raise MusicManagerError(unknown_error)
+
+        return subdirs, files
+
+    @staticmethod
+    def get_fingerprint(path: Path) -> FileFingerprint | None:
+        try:
+            path_stat = path.stat()
+
+        except FileNotFoundError:
+            return None
+
+        except PermissionError as not_allowed:
+            _logger.error(f"Is not allowed to read path information: {not_allowed}")
+            raise FilePersistenceError(not_allowed)
+
+        return FileFingerprint(str(path), path_stat.st_size, path_stat.st_mtime_ns, path_stat.st_ino)
+
     def set_path(self, artist: str, album: str, disk: str, track: str, title: str) -> Path:
         new_path = self._root_dir / artist / album / f'{disk}{track}_{title}'
         return new_path.with_suffix(f'.{self._file_extension.value}')
 
+    @staticmethod
+    def _sync_directory(dir_path: Path) -> None:
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY)
+
+        except OSError as not_supported:
+            _logger.debug(f"Cannot open directory to sync it: {not_supported}")
+            return
+
+        try:
+            os.fsync(dir_fd)
+
+        except OSError as not_supported:  # Some filesystems do not allow syncing directories
+            _logger.debug(f"Cannot sync directory: {not_supported}")
+
+        finally:
+            os.close(dir_fd)
+
     def _clean_empty_dirs(self, path: Path) -> None:
         if path == self._root_dir:
             return
@@ -60,8 +125,17 @@ class FolderManager:
 
     @staticmethod
     def save_file(file_path: Path, data: bytes) -> None:
+        # Data is written aside & renamed over the target, so a crash never leaves a half-written file
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+
         try:
-            file_path.write_bytes(data)
+            with open(tmp_path, 'wb') as tmp_file:
+                tmp_file.write(data)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+
+            os.replace(tmp_path, file_path)
+            FolderManager._sync_directory(file_path.parent)
 
         except PermissionError as not_allowed:
             _logger.error(f"Is not allowed to write file: {not_allowed}")
@@ -71,6 +145,10 @@ class FolderManager:
             _logger.error(f"Something went wrong while saving the file: {unknown_error}")
             raise MusicManagerError(unknown_error)
 
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     @staticmethod
     def read_file(file_path: Path) -> bytes:
         try:
@@ -91,7 +169,12 @@ class FolderManager:
     def update_file_path(self, old_path: Path, new_path: Path) -> None:
         try:
             self.create_folders(new_path)
+
+            # Rename is atomic within the library; both directories are synced so the move survives a crash
             old_path.replace(new_path)
+            self._sync_directory(new_path.parent)
+            self._sync_directory(old_path.parent)
+
             self._clean_empty_dirs(old_path.parent)
 
         except FileNotFoundError as not_found:
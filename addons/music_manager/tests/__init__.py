@@ -2,8 +2,16 @@
 from . import test_adapter_download_service_adapter
 from . import test_adapter_file_service_adapter
 from . import test_adapter_image_service_adapter
+from . import test_adapter_track_extraction_adapter
+from . import test_adapter_track_save_adapter
 from . import test_adapter_track_service_adapter
+from . import test_migration_cover_store
+from . import test_model_album
+from . import test_model_file_deletion
+from . import test_model_library_stats
+from . import test_model_music_import_queue
 from . import test_service_download_service
 from . import test_service_file_service
 from . import test_service_image_service
 from . import test_service_audio_file_service
+from . import test_service_audio_file_service_benchmark
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock, patch
+
+from odoo.tests.common import TransactionCase
+
+
+class MusicLibraryCase(TransactionCase):
+    """
+    Base case for model tests that create albums & tracks. Track paths are built by a mocked file service,
+    so the library folder is never touched.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.album_model = self.env['music_manager.album']
+        self.artist_model = self.env['music_manager.artist']
+        self.track_model = self.env['music_manager.track']
+
+        self.file_service = MagicMock()
+        self.file_service.is_valid.return_value = True
+        self.file_service.set_new_path.side_effect = (
+            lambda artist, album, disk, track, title: f"/music/{artist}/{album}/{disk}{track}_{title}.mp3"
+        )
+
+        file_service_patcher = patch.object(
+            type(self.track_model), '_get_file_service_adapter', return_value=self.file_service
+        )
+        file_service_patcher.start()
+        self.addCleanup(file_service_patcher.stop)
+
+    def _create_album(self, name: str, artist, durations: list[int], genre=None):
+        genre_id = genre.id if genre else False
+        album = self.album_model.create({'name': name, 'album_artist_id': artist.id, 'genre_id': genre_id})
+
+        self.track_model.create([
+            {
+                'name': f"{name} {track_no}",
+                'album_id': album.id,
+                'album_artist_id': artist.id,
+                'duration': duration,
+                'genre_id': genre_id,
+                'track_artist_ids': [(6, 0, [artist.id])],
+                'track_no': track_no,
+            }
+            for track_no, duration in enumerate(durations, start=1)
+        ])
+
+        return album
@@ -0,0 +1,97 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from odoo.tests.common import TransactionCase
+
+from ..adapters.track_extraction_adapter import TrackExtractionAdapter
+from ..services.audio_file_service import MP3AudioFileService
+from ..utils.exceptions import InvalidPathError
+
+
+# One MPEG-1 Layer III frame (128 kbps, 44.1 kHz) with silent payload
+MP3_FRAME = b'\xff\xfb\x90\x64' + b'\x00' * 413
+
+
+class TestAdapterTrackExtraction(TransactionCase):
+
+    patch_path = 'odoo.addons.music_manager.adapters.track_extraction_adapter._init_extraction_worker'
+    services_path = 'odoo.addons.music_manager.adapters.track_extraction_adapter._worker_services'
+
+    def setUp(self) -> None:
+        self.fake_paths = ["/music/artist/album/101_title.mp3", "/music/artist/album/102_title.mp3"]
+        self.track_data = {'tmp_name': "Title", 'tmp_album': "Album"}
+
+        self.adapter = TrackExtractionAdapter("mp3", max_workers=1, chunk_size=1)
+
+    def tearDown(self) -> None:
+        self.adapter.close()
+
+    # =========================================================================================
+    # Testing for '__init__'
+    # =========================================================================================
+
+    def test_init_with_invalid_values(self) -> None:
+        adapter = TrackExtractionAdapter("mp3", max_workers=0, chunk_size=None)
+
+        self.assertEqual(1, adapter.max_workers, msg=f"Workers must be at least 1, got '{adapter.max_workers}'.")
+        self.assertEqual(1, adapter.chunk_size, msg=f"Chunk size must be at least 1, got '{adapter.chunk_size}'.")
+
+    def test_init_executor_instance(self) -> None:
+        self.assertIsNone(self.adapter._executor, msg="Executor must be None when instantiate the adapter.")
+
+    # =========================================================================================
+    # Testing for 'extract_all'
+    # =========================================================================================
+
+    def test_extract_all_without_paths(self) -> None:
+        self.assertListEqual([], self.adapter.extract_all([]))
+
+    def test_extract_all_success(self) -> None:
+        services = {'track_service': MagicMock()}
+        services['track_service'].probe_audio_info.return_value = self.track_data
+
+        with patch(self.patch_path), patch.dict(self.services_path, services):
+            results = self.adapter.extract_all(self.fake_paths)
+
+        self.assertEqual(len(self.fake_paths), len(results))
+        self.assertListEqual(self.fake_paths, [result['file_path'] for result in results])
+
+        for result in results:
+            self.assertIsNone(result['error'], msg=f"Error must be None, got '{result['error']}' instead.")
+            self.assertDictEqual(self.track_data, result['track_data'])
+
+    def test_extract_all_with_error(self) -> None:
+        services = {'track_service': MagicMock()}
+        services['track_service'].probe_audio_info.side_effect = InvalidPathError("File not found")
+
+        with patch(self.patch_path), patch.dict(self.services_path, services):
+            results = self.adapter.extract_all(self.fake_paths[:1])
+
+        self.assertIsNone(results[0]['track_data'], msg="Track data must be None when extraction fails.")
+        self.assertEqual("File not found", results[0]['error'])
+        self.assertIn("InvalidPathError", results[0]['traceback'])
+
+    def test_extract_all_with_worker_pool(self) -> None:
+        adapter = TrackExtractionAdapter("mp3", max_workers=2, chunk_size=1)
+        self.addCleanup(adapter.close)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_paths = []
+
+            for track_no in (1, 2):
+                file_path = Path(tmp_dir) / f"10{track_no}_title.mp3"
+                file_path.write_bytes(MP3_FRAME * 100)
+                MP3AudioFileService().set_track_metadata(
+                    file_path, {'TIT2': f"Title {track_no}", 'TRCK': (track_no, 2)}, frames=('TIT2', 'TRCK')
+                )
+                file_paths.append(str(file_path))
+
+            # Workers run in their own processes: nothing patched here reaches them
+            results = adapter.extract_all(file_paths)
+
+        self.assertListEqual(file_paths, [result['file_path'] for result in results])
+
+        for track_no, result in enumerate(results, start=1):
+            self.assertIsNone(result['error'], msg=f"Error must be None, got '{result['error']}' instead.")
+            self.assertEqual(f"Title {track_no}", result['track_data']['tmp_name'])
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock
+
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase
+
+from ..adapters.track_save_adapter import TrackSaveAdapter
+from ..utils.exceptions import FilePersistenceError, InvalidPathError
+
+
+class TestAdapterTrackSave(TransactionCase):
+
+    def setUp(self) -> None:
+        self.track_service = MagicMock()
+        self.file_service = MagicMock()
+
+        self.operations = [
+            {
+                'track_id': 1,
+                'track_name': "Title",
+                'old_path': "/music/artist/album/101_title.mp3",
+                'new_path': "/music/artist/album/101_title.mp3",
+                'metadata': {'TIT2': "Title"},
+            },
+            {
+                'track_id': 2,
+                'track_name': "Other title",
+                'old_path': "/music/artist/album/102_title.mp3",
+                'new_path': "/music/artist/album/102_other_title.mp3",
+                'metadata': {'TIT2': "Other title"},
+            },
+        ]
+
+        self.adapter = TrackSaveAdapter(self.track_service, self.file_service, max_workers=1)
+
+    def tearDown(self) -> None:
+        self.adapter.close()
+
+    # =========================================================================================
+    # Testing for '__init__'
+    # =========================================================================================
+
+    def test_init_with_invalid_values(self) -> None:
+        adapter = TrackSaveAdapter(self.track_service, self.file_service, max_workers=None)
+
+        self.assertEqual(1, adapter.max_workers, msg=f"Workers must be at least 1, got '{adapter.max_workers}'.")
+        self.assertIsNone(adapter._executor, msg="Executor must be None when instantiate the adapter.")
+
+    # =========================================================================================
+    # Testing for 'apply_all'
+    # =========================================================================================
+
+    def test_apply_all_without_operations(self) -> None:
+        self.assertListEqual([], self.adapter.apply_all([]))
+
+    def test_apply_all_success(self) -> None:
+        results = self.adapter.apply_all(self.operations)
+
+        self.assertListEqual([1, 2], [result['track_id'] for result in results])
+        self.assertListEqual([False, True], [result['moved'] for result in results])
+        self.assertEqual(2, self.track_service.write_metadata.call_count)
+        self.file_service.update_file_path.assert_called_once_with(
+            "/music/artist/album/102_title.mp3", "/music/artist/album/102_other_title.mp3"
+        )
+
+        for result in results:
+            self.assertIsNone(result['error'], msg=f"Error must be None, got '{result['error']}' instead.")
+
+    def test_apply_all_with_workers(self) -> None:
+        with TrackSaveAdapter(self.track_service, self.file_service, max_workers=2) as adapter:
+            results = adapter.apply_all(self.operations)
+
+        self.assertListEqual([1, 2], [result['track_id'] for result in results])
+        self.assertIsNone(adapter._executor, msg="Executor must be closed when leaving the context.")
+
+    # =========================================================================================
+    # Testing for 'apply'
+    # =========================================================================================
+
+    def test_apply_without_changed_frames(self) -> None:
+        operation = dict(self.operations[0], metadata={})
+        result = self.adapter.apply(operation)
+
+        self.assertFalse(result['written'], msg="Unchanged tags must not be written again.")
+        self.assertIsNone(result['error'], msg=f"Error must be None, got '{result['error']}' instead.")
+        self.track_service.write_metadata.assert_not_called()
+
+    def test_apply_with_partial_metadata(self) -> None:
+        operation = dict(self.operations[0], partial=True, fingerprint='{"TIT2":"hash"}')
+        result = self.adapter.apply(operation)
+
+        self.assertTrue(result['written'], msg="Changed frames must be written.")
+        self.assertEqual('{"TIT2":"hash"}', result['fingerprint'])
+        self.track_service.write_metadata.assert_called_once_with(
+            "/music/artist/album/101_title.mp3", {'TIT2': "Title"}, partial=True
+        )
+
+    def test_apply_with_invalid_path(self) -> None:
+        self.track_service.write_metadata.side_effect = InvalidPathError("File not found")
+        result = self.adapter.apply(self.operations[1])
+
+        self.assertEqual('invalid_path', result['error_type'])
+        self.assertFalse(result['moved'], msg="File must not be moved when its metadata cannot be written.")
+        self.file_service.update_file_path.assert_not_called()
+
+    def test_apply_with_persistence_error(self) -> None:
+        self.file_service.update_file_path.side_effect = FilePersistenceError("Permission denied")
+        result = self.adapter.apply(self.operations[1])
+
+        self.assertEqual('persistence', result['error_type'])
+        self.assertEqual("Permission denied", result['error'])
+
+    def test_apply_with_metadata_error(self) -> None:
+        self.track_service.write_metadata.side_effect = ValidationError("Invalid metadata")
+        result = self.adapter.apply(self.operations[0])
+
+        self.assertEqual('metadata', result['error_type'])
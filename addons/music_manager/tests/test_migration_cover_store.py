@@ -0,0 +1,47 @@
+import importlib.util
+from pathlib import Path
+
+from .common import MusicLibraryCase
+
+
+MIGRATION_PATH = Path(__file__).parent.parent / 'migrations' / '1.1.0' / 'post-migrate.py'
+
+
+class TestMigrationCoverStore(MusicLibraryCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.png_img = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+ip1sAAAAASUVORK5CYII="
+        self.artist = self.artist_model.create({'name': "Migration artist"})
+
+        spec = importlib.util.spec_from_file_location('music_manager_post_migrate_1_1_0', MIGRATION_PATH)
+        self.migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.migration)
+
+    # =========================================================================================
+    # Testing for 'migrate'
+    # =========================================================================================
+
+    def test_migrate_keeps_album_cover_from_track_pictures(self) -> None:
+        album = self._create_album("Covered album", self.artist, [100, 200])
+        track = album.track_ids[0]
+
+        # Old installs kept track pictures as field attachments & albums had no cover yet
+        self.env['ir.attachment'].create({
+            'name': 'picture',
+            'res_model': 'music_manager.track',
+            'res_field': 'picture',
+            'res_id': track.id,
+            'datas': self.png_img,
+        })
+        self.env.flush_all()
+        self.env.cr.execute(f"UPDATE {self.album_model._table} SET cover_id = NULL WHERE id = %s", (album.id,))
+        self.env.cr.execute(f"UPDATE {self.track_model._table} SET cover_id = NULL WHERE album_id = %s", (album.id,))
+        self.env.invalidate_all()
+
+        self.migration.migrate(self.env.cr, '1.0.0')
+        self.env.invalidate_all()
+
+        self.assertTrue(track.cover_id, msg="Track must point to the migrated cover.")
+        self.assertEqual(track.cover_id, album.cover_id, msg="Album must take the cover of its tracks.")
@@ -0,0 +1,58 @@
+from .common import MusicLibraryCase
+
+
+class TestModelAlbum(MusicLibraryCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.artist = self.artist_model.create({'name': "Album artist"})
+
+    def _create_albums(self, amount: int, tracks_per_album: int = 3):
+        albums = self.album_model.browse()
+
+        for index in range(amount):
+            albums |= self._create_album(f"Album {index}", self.artist, [180] * tracks_per_album)
+
+        self.env.flush_all()
+        self.env.invalidate_all()
+
+        return albums
+
+    def _count_compute_queries(self, album_ids: list[int]) -> int:
+        # New recordset, so the computation is not shared with other prefetched albums
+        albums = self.album_model.browse(album_ids)
+        query_count = self.env.cr.sql_log_count
+
+        albums.mapped('all_track_ids')
+
+        return self.env.cr.sql_log_count - query_count
+
+    # =========================================================================================
+    # Testing for '_compute_all_track_ids'
+    # =========================================================================================
+
+    def test_compute_all_track_ids_success(self) -> None:
+        albums = self._create_albums(3)
+
+        for album in albums:
+            self.assertEqual(3, len(album.all_track_ids), msg=f"Album '{album.name}' must have 3 tracks.")
+            self.assertEqual(album, album.all_track_ids.album_id, msg="Tracks must belong to their own album.")
+
+    def test_compute_all_track_ids_without_tracks(self) -> None:
+        album = self.album_model.create({'name': "Empty album"})
+
+        self.assertFalse(album.all_track_ids, msg="An album without tracks must not have any track.")
+
+    def test_compute_all_track_ids_query_count(self) -> None:
+        albums = self._create_albums(20)
+
+        single_album_queries = self._count_compute_queries(albums[:1].ids)
+        self.env.invalidate_all()
+        many_albums_queries = self._count_compute_queries(albums.ids)
+
+        self.assertEqual(
+            single_album_queries,
+            many_albums_queries,
+            msg=f"Queries must not grow with albums: {single_album_queries} for 1, {many_albums_queries} for 20."
+        )
@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock
+
+from .common import MusicLibraryCase
+from ..utils.exceptions import FilePersistenceError
+
+
+class TestModelFileDeletion(MusicLibraryCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.deletion_model = self.env['music_manager.file_deletion']
+        self.artist = self.artist_model.create({'name': "Deletion artist"})
+
+    # =========================================================================================
+    # Testing for '_delete_files'
+    # =========================================================================================
+
+    def test_delete_files_keeps_failed_rows(self) -> None:
+        file_service = MagicMock()
+        file_service.delete_file.side_effect = lambda path: self._raise_if_locked(path)
+        deletions = self.deletion_model.enqueue_paths(["/music/deleted.mp3", "/music/locked.mp3"])
+
+        deleted_count, failed_deletions = deletions._delete_files(file_service, deletions)
+
+        self.assertEqual(1, deleted_count, msg="Only the file that can be removed must be counted.")
+        self.assertEqual("/music/locked.mp3", failed_deletions.file_path, msg="Failed file must be kept to retry.")
+        self.assertEqual("Permission denied", failed_deletions.error_message)
+
+    def test_delete_files_skips_paths_imported_again(self) -> None:
+        file_service = MagicMock()
+        track = self._create_album("Imported again", self.artist, [100]).track_ids
+        deletions = self.deletion_model.enqueue_paths([track.file_path])
+
+        deleted_count, failed_deletions = deletions._delete_files(file_service, deletions)
+
+        file_service.delete_file.assert_not_called()
+        self.assertEqual(0, deleted_count, msg="File used by a track must never be deleted.")
+        self.assertFalse(failed_deletions, msg="File used by a track is not a failure.")
+
+    @staticmethod
+    def _raise_if_locked(path: str) -> None:
+        if path.endswith("locked.mp3"):
+            raise FilePersistenceError("Permission denied")
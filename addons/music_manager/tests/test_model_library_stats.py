@@ -0,0 +1,76 @@
+from .common import MusicLibraryCase
+
+
+class TestModelLibraryStats(MusicLibraryCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.genre_model = self.env['music_manager.genre']
+        self.stats_model = self.env['music_manager.library_stats']
+
+        self.artist = self.artist_model.create({'name': "Stats artist"})
+        self.rock = self.genre_model.create({'name': "Stats rock"})
+        self.punk = self.genre_model.create({'name': "Stats punk", 'parent_id': self.rock.id})
+
+    def _get_stats(self, field_name: str, record):
+        return self.stats_model.search([(field_name, '=', record.id)])
+
+    # =========================================================================================
+    # Testing for 'refresh_stats'
+    # =========================================================================================
+
+    def test_refresh_stats_on_track_create(self) -> None:
+        self._create_album("First", self.artist, [100, 200], genre=self.rock)
+        self._create_album("Second", self.artist, [300], genre=self.rock)
+
+        stats = self._get_stats('artist_id', self.artist)
+
+        self.assertEqual(2, stats.album_amount, msg="Artist must have 2 albums.")
+        self.assertEqual(3, stats.track_amount, msg="Artist must have 3 tracks.")
+        self.assertEqual(600, stats.duration, msg="Artist duration must be the sum of its tracks.")
+
+    def test_refresh_stats_rollup_genre_hierarchy(self) -> None:
+        self._create_album("Rock album", self.artist, [100], genre=self.rock)
+        self._create_album("Punk album", self.artist, [200, 300], genre=self.punk)
+
+        rock_stats = self._get_stats('genre_id', self.rock)
+        punk_stats = self._get_stats('genre_id', self.punk)
+
+        self.assertEqual(1, rock_stats.track_amount, msg="Parent genre own stats must not include subgenres.")
+        self.assertEqual(3, rock_stats.total_track_amount, msg="Parent genre totals must include subgenres.")
+        self.assertEqual(2, rock_stats.total_album_amount, msg="Parent genre totals must include subgenre albums.")
+        self.assertEqual(600, rock_stats.total_duration, msg="Parent genre duration must include subgenres.")
+        self.assertEqual(2, punk_stats.total_track_amount, msg="Subgenre totals must only include itself.")
+
+    def test_refresh_stats_on_genre_move(self) -> None:
+        self._create_album("Punk album", self.artist, [200, 300], genre=self.punk)
+
+        self.punk.parent_id = False
+        self.rock.invalidate_recordset()
+
+        rock_stats = self._get_stats('genre_id', self.rock)
+
+        self.assertEqual(0, rock_stats.total_track_amount, msg="Old parent must lose subgenre totals.")
+        self.assertEqual(0, self.rock.track_amount, msg="Old parent must show no tracks.")
+
+    def test_refresh_stats_on_track_unlink(self) -> None:
+        album = self._create_album("First", self.artist, [100, 200], genre=self.punk)
+
+        album.track_ids[0].unlink()
+        self.rock.invalidate_recordset()
+
+        self.assertEqual(1, self._get_stats('artist_id', self.artist).track_amount, msg="Artist must have 1 track.")
+        self.assertEqual(1, self.rock.track_amount, msg="Parent genre must show the subgenre track left.")
+
+    # =========================================================================================
+    # Testing for '_compute_library_stats'
+    # =========================================================================================
+
+    def test_compute_library_stats_without_records(self) -> None:
+        new_artist = self.artist_model.new({'name': "New artist"})
+
+        self.artist_model.browse()._compute_library_stats()
+
+        self.assertEqual(0, new_artist.track_amount, msg="Unsaved artist must have no tracks.")
+        self.assertEqual(0, new_artist.album_amount, msg="Unsaved artist must have no albums.")
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+from odoo.tools import mute_logger
+
+from ..models.music_import_queue import ImportNameResolver
+
+
+class TestImportNameResolver(TransactionCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.artist_model = self.env['music_manager.artist']
+        self.resolver = ImportNameResolver(self.env)
+
+    # =========================================================================================
+    # Testing for 'name_key'
+    # =========================================================================================
+
+    def test_name_key_is_normalized(self) -> None:
+        artist = self.artist_model.create({'name': "  Sigur   Rós "})
+
+        self.assertEqual("sigur ros", artist.name_key, msg="Name key must be unaccented, casefolded & collapsed.")
+
+    # =========================================================================================
+    # Testing for 'get_artist_id'
+    # =========================================================================================
+
+    def test_get_artist_id_matches_existing_spelling(self) -> None:
+        artist = self.artist_model.create({'name': "Beyoncé"})
+
+        self.assertEqual(artist.id, self.resolver.get_artist_id("beyonce "), msg="Spellings must match the artist.")
+
+    @mute_logger('odoo.sql_db')
+    def test_get_artist_id_created_by_another_worker(self) -> None:
+        artist = self.artist_model.create({'name': "Björk"})
+        find_name_ids = self.resolver._find_name_ids
+        missed_lookups = [{}]
+
+        # First search misses, as if another worker created the artist right after it
+        def fake_find_name_ids(model_name, name_keys):
+            return missed_lookups.pop() if missed_lookups else find_name_ids(model_name, name_keys)
+
+        with patch.object(self.resolver, '_find_name_ids', side_effect=fake_find_name_ids):
+            artist_id = self.resolver.get_artist_id("bjork")
+
+        self.assertEqual(artist.id, artist_id, msg="Artist created meanwhile must be read back, not duplicated.")
+        self.assertEqual(1, self.artist_model.search_count([('name_key', '=', "bjork")]))
+
+    def test_preload_creates_one_artist_per_name_key(self) -> None:
+        self.resolver.preload([
+            {'tmp_album_artist': "Beyoncé", 'tmp_artists': "Beyonce , BEYONCÉ", 'tmp_album': "Lemonade"},
+        ])
+
+        artists = self.artist_model.search([('name_key', '=', "beyonce")])
+
+        self.assertEqual(1, len(artists), msg="Every spelling of a name must create a single artist.")
+        self.assertEqual([artists.id, artists.id], self.resolver.get_artist_ids("Beyonce , BEYONCÉ"))
+
+    # =========================================================================================
+    # Testing for 'savepoint'
+    # =========================================================================================
+
+    def test_savepoint_forgets_rolled_back_names(self) -> None:
+        with self.assertRaises(ValueError), self.resolver.savepoint():
+            self.resolver.get_artist_id("Rolled back artist")
+            raise ValueError("File failed")
+
+        artist_id = self.resolver.get_artist_id("Rolled back artist")
+
+        self.assertTrue(self.artist_model.browse(artist_id).exists(), msg="Artist must be created again, not reused.")
@@ -3,12 +3,13 @@ from pathlib import Path
 from unittest.mock import patch, ANY, MagicMock
 from typing import Dict
 
+from mutagen import PaddingInfo
 from mutagen.id3 import ID3
 from odoo.tests.common import TransactionCase
 
 from .mocks.mp3_mock import MP3Mock
 from ..services.audio_file_service import MP3AudioFileService
-from ..utils.exceptions import InvalidFileFormatError, MusicManagerError, ReadingFileError
+from ..utils.exceptions import InvalidFileFormatError, InvalidPathError, MusicManagerError, ReadingFileError
 from ..utils.track_data import FullTrackData, TrackMetadata
 
 
@@ -114,6 +115,58 @@ class TestMP3AudioService(TransactionCase):
 
         mock.assert_called_once_with(ANY, ID3=ID3)
 
+    # =========================================================================================
+    # Testing for 'probe_file'
+    # =========================================================================================
+
+    def test_probe_file_success(self) -> None:
+        with patch.object(Path, 'is_file', return_value=True), MP3Mock.read_mp3_file_success() as mock:
+            audio_info = self.service.probe_file(self.fake_path)
+
+        mock.assert_called_once_with(self.fake_path, ID3=ID3)
+
+        self.assertIsInstance(
+            audio_info,
+            FullTrackData,
+            msg=f"Return value must be a 'FullTrackData' instance, got '{type(audio_info)}' instead."
+        )
+        self.assertEqual(self.MOCK_TAG_VALUES, audio_info.metadata.__dict__)
+
+    def test_probe_file_with_file_not_found(self) -> None:
+        with patch.object(Path, 'is_file', return_value=False), MP3Mock.read_mp3_file_success() as mock:
+            with self.assertRaises(InvalidPathError) as caught_error:
+                self.service.probe_file(self.fake_path)
+
+            self.assertIsInstance(caught_error.exception, InvalidPathError)
+
+        mock.assert_not_called()
+
+    # =========================================================================================
+    # Testing for '_get_padding'
+    # =========================================================================================
+
+    def test_get_padding_when_tag_fits(self) -> None:
+        service = MP3AudioFileService(tag_padding=65536)
+
+        self.assertEqual(
+            2048, service._get_padding(PaddingInfo(2048, 10485760)), msg="Existing padding must be kept while it fits."
+        )
+
+    def test_get_padding_when_tag_grows(self) -> None:
+        service = MP3AudioFileService(tag_padding=65536)
+
+        self.assertEqual(
+            65536,
+            service._get_padding(PaddingInfo(-512, 10485760)),
+            msg="Configured padding must be reserved when the tag does not fit anymore."
+        )
+
+    def test_save_with_default_padding(self) -> None:
+        track = MagicMock()
+        self.service._save(track)
+
+        track.save.assert_called_once_with(padding=None)
+
     # =========================================================================================
     # Testing for 'set_metadata'
     # =========================================================================================
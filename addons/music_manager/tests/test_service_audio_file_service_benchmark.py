@@ -0,0 +1,80 @@
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..services.audio_file_service import MP3AudioFileService
+
+
+_logger = logging.getLogger(__name__)
+
+
+# One MPEG-1 Layer III frame (128 kbps, 44.1 kHz) with silent payload
+MP3_FRAME = b'\xff\xfb\x90\x64' + b'\x00' * 413
+MP3_SIZE = 10 * 1024 * 1024
+
+
+def _get_written_bytes() -> int | None:
+    try:
+        with open('/proc/self/io') as process_io:
+            for line in process_io:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+
+    except OSError:
+        return None
+
+
+@tagged('-standard', 'benchmark')
+class TestMP3AudioServiceBenchmark(TransactionCase):
+    """Bytes written per metadata update. Run it with `make benchmark`."""
+
+    updates = 10
+
+    def setUp(self) -> None:
+        if _get_written_bytes() is None:
+            self.skipTest("Written bytes are only available on Linux ('/proc/self/io').")
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = Path(self.tmp_dir.name) / "track.mp3"
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_bytes_written_per_update(self) -> None:
+        default_writes = self._run_updates(MP3AudioFileService())
+        padded_writes = self._run_updates(MP3AudioFileService(tag_padding=64 * 1024))
+
+        for label, writes in (("Default padding", default_writes), ("64 KB padding", padded_writes)):
+            _logger.info(
+                f"{label}: {sum(writes) / 1024:.0f} KB written in {len(writes)} updates "
+                f"(first {writes[0] / 1024:.0f} KB, then {[round(size / 1024) for size in writes[1:]]} KB)."
+            )
+
+        # After the first resize, every edit must stay inside the padding instead of rewriting the audio
+        self.assertLess(max(padded_writes[1:]), MP3_SIZE // 10)
+        self.assertLess(sum(padded_writes), sum(default_writes))
+
+    def _run_updates(self, service: MP3AudioFileService) -> list[int]:
+        self.file_path.write_bytes(MP3_FRAME * (MP3_SIZE // len(MP3_FRAME)))
+        writes = []
+
+        for update in range(self.updates):
+            metadata = {
+                'TIT2': f"Title {'x' * 50 * update}",
+                'TPE1': "Track artist",
+                'TALB': "Album",
+                'TRCK': (update + 1, self.updates),
+            }
+
+            # Covers change every other edit and keep growing, as a new picture would
+            if update % 2 == 0:
+                metadata['APIC'] = os.urandom(20000 + 3000 * update)
+
+            written_bytes = _get_written_bytes()
+            service.set_track_metadata(self.file_path, metadata, frames=metadata.keys())
+            writes.append(_get_written_bytes() - written_bytes)
+
+        return writes
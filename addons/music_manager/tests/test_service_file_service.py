@@ -1,4 +1,6 @@
+import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from odoo.tests.common import TransactionCase
 
@@ -6,6 +8,7 @@ from .mocks.file_mock import FileMock
 from ..services.file_service import FolderManager
 from ..utils.constants import ROOT_DIR, TRACK_EXTENSION
 from ..utils.enums import FileType
+from ..utils.file_data import FileFingerprint
 from ..utils.exceptions import FilePersistenceError, InvalidPathError, MusicManagerError
 
 
@@ -165,51 +168,46 @@ class TestFileService(TransactionCase):
     # =========================================================================================
 
     def test_save_file_success(self) -> None:
-        pathlib_mock = FileMock.write_bytes_file_pathlib_success()
-        fake_manager = FolderManager(root_dir=Path(ROOT_DIR), file_extension=FileType(TRACK_EXTENSION))
-
-        data_to_save = b"Fake data"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / f"01_title.{TRACK_EXTENSION}"
+            file_path.write_bytes(b"Old data")
 
-        fake_manager.save_file(file_path=pathlib_mock, data=data_to_save)
+            self.manager.save_file(file_path=file_path, data=b"Fake data")
 
-        pathlib_mock.write_bytes.assert_called_once_with(data_to_save)
+            self.assertEqual(b"Fake data", file_path.read_bytes())
+            self.assertListEqual([file_path], list(Path(tmp_dir).iterdir()), msg="Temporary file must be removed.")
 
     def test_save_file_with_permission_error(self) -> None:
-        pathlib_mock = FileMock.write_bytes_file_pathlib_with_permission_error()
-        fake_manager = FolderManager(root_dir=Path(ROOT_DIR), file_extension=FileType(TRACK_EXTENSION))
-
-        data_to_save = b"Fake data"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / f"01_title.{TRACK_EXTENSION}"
+            file_path.write_bytes(b"Old data")
 
-        with self.assertRaises(FilePersistenceError) as caught_error:
-            fake_manager.save_file(file_path=pathlib_mock, data=data_to_save)
+            with patch('os.replace', side_effect=PermissionError("SIMULATING ERROR || PermissionError ||")):
+                with self.assertRaises(FilePersistenceError) as caught_error:
+                    self.manager.save_file(file_path=file_path, data=b"Fake data")
 
-        self.assertIsInstance(caught_error.exception, FilePersistenceError)
-        pathlib_mock.write_bytes.assert_called_once_with(data_to_save)
+            self.assertIsInstance(caught_error.exception, FilePersistenceError)
+            self.assertEqual(b"Old data", file_path.read_bytes(), msg="Original file must be kept when saving fails.")
+            self.assertListEqual([file_path], list(Path(tmp_dir).iterdir()), msg="Temporary file must be removed.")
 
     def test_save_file_with_exception_error(self) -> None:
-        pathlib_mock = FileMock.write_bytes_file_pathlib_with_exception_error()
-        fake_manager = FolderManager(root_dir=Path(ROOT_DIR), file_extension=FileType(TRACK_EXTENSION))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / f"01_title.{TRACK_EXTENSION}"
 
-        data_to_save = b"Fake data"
+            with patch('os.fsync', side_effect=OSError("SIMULATING ERROR || OSError ||")):
+                with self.assertRaises(MusicManagerError) as caught_error:
+                    self.manager.save_file(file_path=file_path, data=b"Fake data")
 
-        with self.assertRaises(MusicManagerError) as caught_error:
-            fake_manager.save_file(file_path=pathlib_mock, data=data_to_save)
-
-        self.assertIsInstance(caught_error.exception, MusicManagerError)
-        pathlib_mock.write_bytes.assert_called_once_with(data_to_save)
+            self.assertIsInstance(caught_error.exception, MusicManagerError)
+            self.assertFalse(file_path.exists(), msg="Target file must not exist when saving fails.")
 
     def test_save_file_with_unknown_error(self) -> None:
-        pathlib_mock = FileMock.create_mock(Path)
-        fake_manager = FolderManager(root_dir=Path(ROOT_DIR), file_extension=FileType(TRACK_EXTENSION))
-
-        data_to_save = b"Fake data"
-        pathlib_mock.write_bytes.side_effect = OSError("SIMULATING ERROR || OSError ||")
+        file_path = Path("/fake/not/existing/directory/01_title.mp3")
 
         with self.assertRaises(MusicManagerError) as caught_error:
-            fake_manager.save_file(file_path=pathlib_mock, data=data_to_save)
+            self.manager.save_file(file_path=file_path, data=b"Fake data")
 
         self.assertIsInstance(caught_error.exception, MusicManagerError)
-        pathlib_mock.write_bytes.assert_called_once_with(data_to_save)
 
     # =========================================================================================
     # Testing for 'read_file'
@@ -282,10 +280,12 @@ class TestFileService(TransactionCase):
         old_path_mock.parent = parent_mock
         fake_manager = FolderManager(root_dir=Path(ROOT_DIR), file_extension=FileType(TRACK_EXTENSION))
 
-        fake_manager.update_file_path(old_path_mock, new_path_mock)
+        with patch.object(FolderManager, '_sync_directory') as sync_mock:
+            fake_manager.update_file_path(old_path_mock, new_path_mock)
 
         old_path_mock.replace.assert_called_once()
         parent_mock.rmdir.assert_called_once()
+        self.assertEqual(2, sync_mock.call_count, msg="Both directories must be synced after moving the file.")
 
     def test_update_file_with_invalid_path_error(self) -> None:
         old_path_mock = FileMock.replace_file_pathlib_with_file_not_found_error()
@@ -397,3 +397,44 @@ class TestFileService(TransactionCase):
 
         self.assertIsInstance(caught_error.exception, MusicManagerError)
         pathlib_mock.unlink.assert_called_once()
+
+    # =========================================================================================
+    # Testing for 'scan_directory'
+    # =========================================================================================
+
+    def test_scan_directory_success(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "artist").mkdir()
+            (root / f"01_title.{TRACK_EXTENSION}").write_bytes(b"Fake data")
+            (root / "cover.png").write_bytes(b"Fake image")
+
+            fake_manager = FolderManager(root_dir=root, file_extension=FileType(TRACK_EXTENSION))
+            subdirs, files = fake_manager.scan_directory(root)
+
+        self.assertListEqual([root / "artist"], subdirs)
+        self.assertEqual(1, len(files), msg=f"Only '{TRACK_EXTENSION}' files must be found, got '{len(files)}'.")
+        self.assertIsInstance(files[0], FileFingerprint)
+        self.assertEqual(str(root / f"01_title.{TRACK_EXTENSION}"), files[0].path)
+        self.assertEqual(len(b"Fake data"), files[0].size)
+
+    def test_scan_directory_with_file_not_found_error(self) -> None:
+        with self.assertRaises(InvalidPathError) as caught_error:
+            self.manager.scan_directory(Path("/fake/not/existing/directory"))
+
+        self.assertIsInstance(caught_error.exception, InvalidPathError)
+
+    # =========================================================================================
+    # Testing for 'get_fingerprint'
+    # =========================================================================================
+
+    def test_get_fingerprint_success(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fingerprint = self.manager.get_fingerprint(Path(tmp_dir))
+
+        self.assertIsInstance(fingerprint, FileFingerprint)
+        self.assertEqual(tmp_dir, fingerprint.path)
+        self.assertGreater(fingerprint.mtime_ns, 0)
+
+    def test_get_fingerprint_with_file_not_found(self) -> None:
+        self.assertIsNone(self.manager.get_fingerprint(Path("/fake/not/existing/directory")))
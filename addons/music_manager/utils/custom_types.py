@@ -130,6 +130,8 @@ DisplayNotification: TypeAlias = Dict[str, str | Dict[str, str | bool]]
 DomainCustomFilter: TypeAlias = List[Tuple[str, str, List[int]]]
 MessageCounter: TypeAlias = Dict[str, int | List[str]]
 OptionDownloadSettings: TypeAlias = Dict[str, str | bool | List[Dict[str, str]]]
+SaveOperation: TypeAlias = Dict[str, int | str | Dict[str, Any]]
+SaveResult: TypeAlias = Dict[str, int | str | bool | None]
 ReplaceItemCommand: TypeAlias = Tuple[int, int, List[int]]
 WindowActionView: TypeAlias = Dict[str, str | int | Dict[Any, Any]]
 
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    path: str                           # Absolute path
+    size: int = 0                       # Size (in bytes)
+    mtime_ns: int = 0                   # Last modification (in nanoseconds)
+    inode: int = 0                      # Inode number
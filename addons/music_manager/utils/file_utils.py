@@ -1,6 +1,7 @@
 import datetime
 import magic
 import re
+from functools import lru_cache
 from typing import List, Tuple
 from unidecode import unidecode
 
@@ -9,6 +10,11 @@ from ..utils.data_encoding import base64_decode
 from ..utils.exceptions import InvalidFileFormatError
 
 
+# Patterns compiled once: path sections are normalized for every track on each path recompute
+SYMBOL_PATTERN = re.compile("|".join(re.escape(symbol_key) for symbol_key in SYMBOL_MAP.keys()))
+INVALID_CHARS_PATTERN = re.compile(r'[^a-z0-9]+')
+
+
     # =========================================================================================
     # Utils for MIME type
     # =========================================================================================
@@ -38,14 +44,20 @@ def validate_allowed_mimes(file_data: bytes, allowed_mimes: set[str]) -> str:
     # =========================================================================================
 
 
+@lru_cache(maxsize=4096)
 def clean_path_section(section: str) -> str:
+    # Artist & album names repeat heavily across a library, so normalized sections are memoized
     mapped_chars = _map_special_characters(section)
     normalized = _normalize_characters(mapped_chars)
-    cleaned = re.sub(pattern=r'[^a-z0-9]', repl='_', string=normalized)
-    return re.sub(pattern=r'_+', repl='_', string=cleaned).strip('_')
+    return INVALID_CHARS_PATTERN.sub('_', normalized).strip('_')
 
 
 def is_valid_path(path: str, root_dir: str) -> bool:
+    return bool(_get_path_pattern(root_dir).fullmatch(path))
+
+
+@lru_cache(maxsize=16)
+def _get_path_pattern(root_dir: str) -> re.Pattern:
     artist = r'\w+'
     album = r'\w+'
     track_no = r'[0-9]{2}'
@@ -53,20 +65,28 @@ def is_valid_path(path: str, root_dir: str) -> bool:
     title = r'\w+'
     extension = r'[a-zA-Z0-9]{3,4}'
 
-    pattern = fr'{re.escape(root_dir)}\/{artist}\/{album}\/{disk_no}{track_no}_{title}\.{extension}'
-
-    return bool(re.fullmatch(pattern, path))
+    return re.compile(fr'{re.escape(root_dir)}\/{artist}\/{album}\/{disk_no}{track_no}_{title}\.{extension}')
 
 
 def _map_special_characters(string: str) -> str:
-    pattern = re.compile("|".join(re.escape(symbol_key) for symbol_key in SYMBOL_MAP.keys()))
-    return pattern.sub(lambda match_pattern: SYMBOL_MAP[match_pattern.group(0)], string)
+    return SYMBOL_PATTERN.sub(lambda match_pattern: SYMBOL_MAP[match_pattern.group(0)], string)
 
 
 def _normalize_characters(string: str) -> str:
     return unidecode(string).lower()
 
 
+    # =========================================================================================
+    # Utils for name matching
+    # =========================================================================================
+
+
+@lru_cache(maxsize=4096)
+def get_name_key(name: str) -> str:
+    # 'Beyoncé', 'beyonce' & 'Beyonce ' are the same artist
+    return " ".join(unidecode(name).casefold().split())
+
+
     # =========================================================================================
     # Utils for dates
     # =========================================================================================
@@ -0,0 +1,34 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+
+def get_frame_fingerprints(metadata: Dict[str, Any]) -> Dict[str, str]:
+    return {frame: _hash_frame_value(value) for frame, value in metadata.items()}
+
+
+def get_changed_frames(fingerprints: Dict[str, str], stored_fingerprint: str | None) -> list[str]:
+    stored_fingerprints = load_fingerprint(stored_fingerprint)
+
+    return [frame for frame, value in fingerprints.items() if stored_fingerprints.get(frame) != value]
+
+
+def dump_fingerprint(fingerprints: Dict[str, str]) -> str:
+    return json.dumps(fingerprints, sort_keys=True, separators=(',', ':'))
+
+
+def load_fingerprint(stored_fingerprint: str | None) -> Dict[str, str]:
+    if not stored_fingerprint:
+        return {}
+
+    try:
+        return json.loads(stored_fingerprint)
+
+    except ValueError:
+        return {}
+
+
+def _hash_frame_value(value: Any) -> str:
+    encoded_value = json.dumps(value, sort_keys=True, default=str).encode()
+
+    return hashlib.sha1(encoded_value).hexdigest()[:16]
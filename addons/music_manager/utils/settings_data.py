@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AudioSettingsData:
+    available_adapters: str = 'ytdlp'   # Download engine
+    bitrate: str = '0'                  # Download quality (in kbps, '0' is auto)
+    image_format: str = 'png'           # Processed image format
+    image_size: str = '400'             # Processed image side (in px)
+    import_batch_size: int = 50         # Files claimed per batch
+    import_chunk_size: int = 10         # Files sent to each extraction worker at once
+    import_commit_interval: int = 10    # Maximum time between commits (in seconds)
+    import_commit_size: int = 25        # Files per commit
+    import_lease_duration: int = 600    # Claim lease (in seconds)
+    import_time_budget: int = 90        # Importer run duration (in seconds)
+    import_workers: int = 4             # Extraction processes
+    root_dir: str = '/music'            # Music library root directory
+    save_chunk_size: int = 20           # Tracks saved per commit by bulk save jobs
+    save_workers: int = 4               # Threads writing tags & moving files
+    sound_format: str = 'mp3'           # Audio file extension
+    tag_padding: int = 64               # Space reserved after ID3 tags when they grow (in KB)
+    to_delete: bool = False             # Delete files with their tracks
@@ -23,7 +23,7 @@ from ..utils.exceptions import (
     MusicManagerError,
     VideoProcessingError,
 )
-from ..utils.file_utils import get_years_list, validate_allowed_mimes
+from ..utils.file_utils import get_name_key, get_years_list, validate_allowed_mimes
 
 
 _logger = logging.getLogger(__name__)
@@ -407,7 +407,7 @@ class TrackWizard(TransientModel, ProcessImageMixin):
             return fallback_artists[:1]
 
         artist_model = self.env['music_manager.artist'].sudo()
-        artist = artist_model.search([('name', '=', artist_name)], limit=1)
+        artist = artist_model.search([('name_key', '=', get_name_key(artist_name))], limit=1)
 
         if artist:
             return artist
@@ -415,30 +415,35 @@ class TrackWizard(TransientModel, ProcessImageMixin):
         return self.env['music_manager.artist'].create({'name': artist_name})
 
     def _get_download_service_adapter(self, video_url):
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+        settings = self.env['music_manager.audio_settings'].get_settings()
 
-        adapter_type = settings.available_adapters if settings else 'ytdlp'
         config = {
-            'format': settings.sound_format if settings else 'mp3',
-            'quality': settings.bitrate if settings else '192',
+            'format': settings.sound_format,
+            'quality': settings.bitrate,
         }
 
-        return DownloadServiceAdapter(video_url=video_url, adapter_type=adapter_type, config=config)
+        return DownloadServiceAdapter(video_url=video_url, adapter_type=settings.available_adapters, config=config)
 
-    def _get_file_service_adapter(self):
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+    def _get_file_service_adapter(self) -> FileServiceAdapter:
+        return self.env['music_manager.audio_settings'].get_file_service_adapter()
 
-        root = settings.root_dir if settings else '/music'
-        file_extension = settings.sound_format if settings else 'mp3'
+    def _get_stored_file_path(self):
+        self.ensure_one()
 
-        return FileServiceAdapter(str_root_dir=root, file_extension=file_extension)
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
 
-    def _get_track_service_adapter(self):
-        settings = self.env['music_manager.audio_settings'].search([], limit=1)
+        if not attachment.store_fname:
+            return None
 
-        file_extension = settings.sound_format if settings else 'mp3'
+        # noinspection PyProtectedMember
+        return attachment._full_path(attachment.store_fname)
 
-        return TrackServiceAdapter(file_type=file_extension)
+    def _get_track_service_adapter(self) -> TrackServiceAdapter:
+        return self.env['music_manager.audio_settings'].get_track_service_adapter()
 
     def _match_album_artist_id(self) -> None:
         self.ensure_one()
@@ -450,7 +455,7 @@ class TrackWizard(TransientModel, ProcessImageMixin):
             _logger.info(f"There is no TMP ALBUM ARTIST: {self.tmp_album}")
             return
 
-        found = artist_model.search([('name', '=', self.tmp_album_artist)], limit=1)
+        found = artist_model.search([('name_key', '=', get_name_key(self.tmp_album_artist))], limit=1)
         self.possible_album_artist_id = found
 
     def _match_album_id(self) -> None:
@@ -463,7 +468,7 @@ class TrackWizard(TransientModel, ProcessImageMixin):
             _logger.info(f"There is no TMP ALBUM: {self.tmp_album}")
             return
 
-        found = album_model.search([('name', '=', self.tmp_album)], limit=1)
+        found = album_model.search([('name_key', '=', get_name_key(self.tmp_album))], limit=1)
         self.possible_album_id = found
 
     def _match_artist_ids(self) -> None:
@@ -476,8 +481,8 @@ class TrackWizard(TransientModel, ProcessImageMixin):
             _logger.info(f"There is no TMP ARTISTS: {self.tmp_album}")
             return
 
-        names = [name.strip() for name in self.tmp_artists.split(",")]
-        found_artists = artist_model.search([('name', 'in', names)])
+        name_keys = [get_name_key(name) for name in self.tmp_artists.split(",")]
+        found_artists = artist_model.search([('name_key', 'in', name_keys)])
 
         self.possible_artist_ids = found_artists
 
@@ -490,7 +495,7 @@ class TrackWizard(TransientModel, ProcessImageMixin):
         if not self.tmp_genre:
             return
 
-        found = genre_model.search([('name', '=', self.tmp_genre)], limit=1)
+        found = genre_model.search([('name_key', '=', get_name_key(self.tmp_genre))], limit=1)
         self.possible_genre_id = found
 
     def _match_original_artist_id(self) -> None:
@@ -502,7 +507,7 @@ class TrackWizard(TransientModel, ProcessImageMixin):
         if not self.tmp_original_artist:
             return
 
-        found = artist_model.search([('name', '=', self.tmp_original_artist)], limit=1)
+        found = artist_model.search([('name_key', '=', get_name_key(self.tmp_original_artist))], limit=1)
         self.possible_original_artist_id = found
 
     def _match_track_year(self) -> None:
@@ -520,13 +525,19 @@ class TrackWizard(TransientModel, ProcessImageMixin):
     def _update_fields(self) -> None:
         self.ensure_one()
 
-        if isinstance(self.file, bytes):
-            track_service = self._get_track_service_adapter()
+        track_service = self._get_track_service_adapter()
+        stored_file_path = self._get_stored_file_path()
+        audio_info = None
+
+        if stored_file_path:
+            audio_info = track_service.probe_audio_info(stored_file_path)
+
+        elif isinstance(self.file, bytes):
             audio_info = track_service.read_audio_info(self.file)
 
-            for attr_name, value in audio_info.items():
-                if hasattr(self, attr_name):
-                    setattr(self, attr_name, value)
+        for attr_name, value in (audio_info or {}).items():
+            if hasattr(self, attr_name):
+                setattr(self, attr_name, value)
 
         self.match_all_metadata()
 
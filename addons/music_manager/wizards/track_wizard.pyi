@@ -136,7 +136,8 @@ class TrackWizard:
         """
 
     def _find_or_create_single_artist(self: Self, artist_name: str, fallback_artists: Sequence[Artist]) -> Artist | Literal[False]:
-        """Tries to find a given single artist name. If there is not any, sets the first one finded on fall back list.
+        """Tries to find a given single artist name by its name key. If there is not any, sets the first one finded
+        on fall back list.
         :param artist_name: Artist name
         :param fallback_artists: A list with various Artists
         :return: Artist (created or finded) | False if there is not any name
@@ -149,36 +150,41 @@ class TrackWizard:
 
     def _get_file_service_adapter(self: Self) -> FileServiceAdapter:
         """Ensure file adapter has its settings updated
-        :return: FileServiceAdapter with updated settings
+        :return: New FileServiceAdapter built from the cached settings
+        """
+
+    def _get_stored_file_path(self: Self) -> str | None:
+        """Gets the filestore path of the uploaded file so metadata can be read directly from disk.
+        :return: Full file path | None if file is not stored in the filestore
         """
 
     def _get_track_service_adapter(self: Self) -> TrackServiceAdapter:
         """Ensure track service adapter has its settings updated
-        :return: TrackServiceAdapter with updated settings
+        :return: New TrackServiceAdapter built from the cached settings
         """
 
     def _match_album_artist_id(self: Self) -> None:
-        """Matches album artist ID with given temporary album artist name.
+        """Matches album artist ID by name key with given temporary album artist name.
         :return: None
         """
 
     def _match_album_id(self: Self) -> None:
-        """Matches album ID with given temporary album name.
+        """Matches album ID by name key with given temporary album name.
         :return: None
         """
 
     def _match_artist_ids(self: Self) -> None:
-        """Matches all track artists IDs with given temporary track artist names separated with commas.
+        """Matches all track artists IDs by name key with given temporary track artist names separated with commas.
         :return: None
         """
 
     def _match_genre_id(self: Self) -> None:
-        """Matches genre ID with given temporary genre name.
+        """Matches genre ID by name key with given temporary genre name.
         :return: None
         """
 
     def _match_original_artist_id(self: Self) -> None:
-        """Matches original artist ID with given temporary original artist name.
+        """Matches original artist ID by name key with given temporary original artist name.
         :return: None
         """
 
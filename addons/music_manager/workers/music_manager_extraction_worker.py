@@ -0,0 +1,35 @@
+import importlib
+import traceback
+from typing import Dict, List
+
+
+# Services loaded once by each worker process
+_worker_services = {}
+
+TRACK_SERVICE_MODULE = 'odoo.addons.music_manager.adapters.track_service_adapter'
+
+
+def _init_extraction_worker(file_extension: str, addons_paths: List[str] | None = None) -> None:
+    # Worker processes start without the addons paths Odoo adds at server start, so they are set before the import
+    if addons_paths:
+        import odoo.addons
+
+        odoo.addons.__path__.extend(path for path in addons_paths if path not in odoo.addons.__path__)
+
+    track_service_adapter = importlib.import_module(TRACK_SERVICE_MODULE)
+    _worker_services['track_service'] = track_service_adapter.TrackServiceAdapter(file_extension)
+
+
+def _extract_track_data(str_file_path: str) -> Dict[str, str | dict | None]:
+    try:
+        track_data = _worker_services['track_service'].probe_audio_info(str_file_path)
+
+        return {'file_path': str_file_path, 'track_data': track_data, 'error': None, 'traceback': None}
+
+    except Exception as unknown_error:
+        return {
+            'file_path': str_file_path,
+            'track_data': None,
+            'error': str(unknown_error),
+            'traceback': traceback.format_exc(),
+        }